@@ -3,13 +3,52 @@ FastMCP 클라이언트 브리지
 Cursor IDE와 A2A 서버 간의 통신을 담당합니다.
 """
 
+import atexit
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
-from typing import Dict, Any
+from pydantic import BaseModel, Field, StringConstraints, ValidationError, field_validator
+from typing import Annotated, Dict, Any, List, Optional, Tuple
 
 # A2A 서버 엔드포인트
 A2A_SERVER_URL = "http://localhost:8000"
 
+# 공유 HTTP 세션 (keep-alive 연결 재사용)
+# 재시도는 멱등한 GET(헬스 체크)에만 적용: /v1/create_shorts 등 POST를 재전송하면
+# 서버가 이미 처리 중인 작업(영상 생성, YouTube 업로드)이 중복 실행될 수 있음
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET"})
+        )
+    )
+)
+atexit.register(_SESSION.close)
+
+# 헬스 체크 결과 캐시 (URL -> (만료 시각, 응답))
+HEALTH_CACHE_TTL = 30
+_health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# 자주 발생하는 연결 오류 응답 템플릿 (호출마다 dict 리터럴을 새로 만들지 않음)
+_CONN_ERR_TMPL: Dict[str, Any] = {
+    "error": "A2A 서버에 연결할 수 없습니다.",
+    "message": f"서버가 실행 중인지 확인하세요: {A2A_SERVER_URL}",
+    "hint": "server/main.py를 실행하여 서버를 시작하세요."
+}
+_TIMEOUT_ERR_TMPL: Dict[str, Any] = {
+    "error": "요청 시간 초과",
+    "message": "A2A 서버의 응답이 너무 오래 걸렸습니다."
+}
+
 # FastMCP 인스턴스 초기화
 mcp = FastMCP("A2A Healing Shorts Factory Bridge")
 
@@ -26,24 +65,17 @@ def _call_a2a_server(endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         서버 응답
     """
     url = f"{A2A_SERVER_URL}{endpoint}"
+    # YouTube 업로드 포함 시 더 긴 타임아웃 (최대 15분)
+    timeout = 900 if payload.get("upload_to_youtube", False) else 300
     
     try:
-        # YouTube 업로드 포함 시 더 긴 타임아웃 (최대 15분)
-        timeout = 900 if payload.get("upload_to_youtube", False) else 300
-        response = requests.post(url, json=payload, timeout=timeout)
+        response = _SESSION.post(url, json=payload, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.ConnectionError:
-        return {
-            "error": "A2A 서버에 연결할 수 없습니다.",
-            "message": f"서버가 실행 중인지 확인하세요: {A2A_SERVER_URL}",
-            "hint": "server/main.py를 실행하여 서버를 시작하세요."
-        }
+        return _CONN_ERR_TMPL.copy()
     except requests.exceptions.Timeout:
-        return {
-            "error": "요청 시간 초과",
-            "message": "A2A 서버의 응답이 너무 오래 걸렸습니다."
-        }
+        return _TIMEOUT_ERR_TMPL.copy()
     except requests.exceptions.HTTPError as e:
         return {
             "error": f"HTTP 오류: {e.response.status_code}",
@@ -57,6 +89,68 @@ def _call_a2a_server(endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _fmt_generate(entry: Dict[str, Any], iteration: int, agent_name: str) -> Dict[str, Any]:
+    """Planner 프롬프트 생성 로그 포맷팅"""
+    return {
+        "iteration": iteration,
+        "agent": agent_name,
+        "action": "프롬프트 생성",
+        "output": entry.get("output", "")
+    }
+
+
+def _fmt_review(entry: Dict[str, Any], iteration: int, agent_name: str) -> Dict[str, Any]:
+    """Reviewer 검토 로그 포맷팅"""
+    review_output = entry.get("output", {})
+    return {
+        "iteration": iteration,
+        "agent": agent_name,
+        "action": "프롬프트 검토",
+        "status": review_output.get("status", "UNKNOWN"),
+        "score": review_output.get("score", 0),
+        "feedback": review_output.get("feedback", "")
+    }
+
+
+def _fmt_error(entry: Dict[str, Any], iteration: int, agent_name: str) -> Dict[str, Any]:
+    """에이전트 오류 로그 포맷팅"""
+    return {
+        "iteration": iteration,
+        "agent": agent_name,
+        "action": "오류",
+        "error": entry.get("error", "Unknown error")
+    }
+
+
+# 대화 로그 action -> 포맷터
+_FORMATTERS = {
+    "generate": _fmt_generate,
+    "review": _fmt_review,
+    "error": _fmt_error,
+}
+
+
+class CreateShortsRequest(BaseModel):
+    """
+    create_healing_short 입력 검증 모델 (/v1/create_shorts 요청 페이로드)
+    서버(server/main.py)의 CreateShortsRequest와 같은 제약을 적용하여 서버에서 거절될 요청은 보내지 않음
+    """
+    topic: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+    video_duration: float = Field(default=30.0, ge=1.0, le=300.0)
+    upload_to_youtube: bool = False
+    youtube_title: Optional[str] = None
+    youtube_description: Optional[str] = None
+    youtube_tags: Optional[List[str]] = None
+    
+    @field_validator("youtube_tags", mode="before")
+    @classmethod
+    def _split_tags(cls, value):
+        """쉼표로 구분된 태그 문자열을 리스트로 변환"""
+        if isinstance(value, str):
+            return [tag.strip() for tag in value.split(",")] if value else None
+        return value
+
+
 @mcp.tool()
 def create_healing_short(
     topic: str,
@@ -74,7 +168,7 @@ def create_healing_short(
     
     Args:
         topic: 비디오 주제 키워드 (예: "Rain", "Ocean Waves", "Forest")
-        video_duration: 비디오 길이 (초). YouTube Shorts는 1초 이상 가능. 기본값: 30초
+        video_duration: 비디오 길이 (초). 1초 이상 300초 이하. 기본값: 30초
         upload_to_youtube: YouTube에 업로드할지 여부
         youtube_title: YouTube 비디오 제목 (선택사항)
         youtube_description: YouTube 비디오 설명 (선택사항)
@@ -83,66 +177,47 @@ def create_healing_short(
     Returns:
         워크플로우 실행 결과 및 에이전트 대화 로그
     """
-    # 비디오 길이 최소값 검증 (1초 이상)
-    if video_duration < 1:
+    # 입력값 검증 및 페이로드 생성 (None 값 필드는 제외)
+    try:
+        request = CreateShortsRequest(
+            topic=topic,
+            video_duration=video_duration,
+            upload_to_youtube=upload_to_youtube,
+            youtube_title=youtube_title,
+            youtube_description=youtube_description,
+            youtube_tags=youtube_tags
+        )
+    except ValidationError as e:
+        error_fields = {err["loc"][0] for err in e.errors() if err["loc"]}
+        if "topic" in error_fields:
+            return {
+                "error": "주제 오류",
+                "message": "주제는 1자 이상 500자 이하여야 합니다."
+            }
+        if "video_duration" in error_fields:
+            return {
+                "error": "비디오 길이 오류",
+                "message": "비디오 길이는 1초 이상 300초 이하여야 합니다."
+            }
         return {
-            "error": "비디오 길이 오류",
-            "message": "비디오 길이는 최소 1초 이상이어야 합니다."
+            "error": "입력값 오류",
+            "message": str(e)
         }
     
-    # 태그 문자열을 리스트로 변환
-    tags_list = None
-    if youtube_tags:
-        tags_list = [tag.strip() for tag in youtube_tags.split(",")]
-    
     # A2A 서버에 요청 전송
-    payload = {
-        "topic": topic,
-        "video_duration": video_duration,
-        "upload_to_youtube": upload_to_youtube,
-        "youtube_title": youtube_title,
-        "youtube_description": youtube_description,
-        "youtube_tags": tags_list
-    }
+    payload = request.model_dump(exclude_none=True)
     
     # YouTube 업로드가 요청된 경우 동기 엔드포인트 사용 (완료될 때까지 기다림)
     endpoint = "/v1/create_shorts_sync" if upload_to_youtube else "/v1/create_shorts"
     result = _call_a2a_server(endpoint, payload)
     
-    # 에이전트 대화 로그 포맷팅
+    # 에이전트 대화 로그 포맷팅 (action별 포맷터로 디스패치)
     if "conversation_log" in result:
-        formatted_log = []
-        for entry in result["conversation_log"]:
-            agent_name = entry.get("agent", "Unknown")
-            action = entry.get("action", "unknown")
-            iteration = entry.get("iteration", 0)
-            
-            if action == "generate":
-                formatted_log.append({
-                    "iteration": iteration,
-                    "agent": agent_name,
-                    "action": "프롬프트 생성",
-                    "output": entry.get("output", "")
-                })
-            elif action == "review":
-                review_output = entry.get("output", {})
-                formatted_log.append({
-                    "iteration": iteration,
-                    "agent": agent_name,
-                    "action": "프롬프트 검토",
-                    "status": review_output.get("status", "UNKNOWN"),
-                    "score": review_output.get("score", 0),
-                    "feedback": review_output.get("feedback", "")
-                })
-            elif action == "error":
-                formatted_log.append({
-                    "iteration": iteration,
-                    "agent": agent_name,
-                    "action": "오류",
-                    "error": entry.get("error", "Unknown error")
-                })
-        
-        result["formatted_conversation_log"] = formatted_log
+        result["formatted_conversation_log"] = [
+            fmt(entry, entry.get("iteration", 0), entry.get("agent", "Unknown"))
+            for entry in result["conversation_log"]
+            if (fmt := _FORMATTERS.get(entry.get("action", "unknown")))
+        ]
     
     return result
 
@@ -194,10 +269,17 @@ def check_server_health() -> Dict[str, Any]:
     Returns:
         서버 상태 정보
     """
+    url = f"{A2A_SERVER_URL}/health"
+    cached = _health_cache.get(url)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+    
     try:
-        response = requests.get(f"{A2A_SERVER_URL}/health", timeout=5)
+        response = _SESSION.get(url, timeout=5)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        _health_cache[url] = (time.monotonic() + HEALTH_CACHE_TTL, result)
+        return result
     except Exception as e:
         return {
             "status": "unhealthy",
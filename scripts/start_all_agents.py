@@ -2,160 +2,203 @@
 모든 A2A 에이전트 서버를 한 번에 실행하는 스크립트
 """
 
-import subprocess
+import asyncio
+import importlib
+import multiprocessing
 import sys
 import os
-import time
 import socket
 from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# 프로젝트 루트를 Python 경로에 추가 (server 패키지 import용)
+sys.path.insert(0, str(PROJECT_ROOT))
 
-def is_port_in_use(port: int) -> bool:
-    """포트가 사용 중인지 확인"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind(('localhost', port))
-            return False
-        except OSError:
-            return True
+from server.a2a_config import A2AConfig
+
+# Linux의 fork 방식에서는 부모에서 import한 공통 모듈(FastAPI, Pydantic, httpx)을 자식이 copy-on-write로 공유
+# macOS는 프레임워크/gRPC 스레드가 있는 상태의 fork가 안전하지 않으므로 플랫폼 기본값(spawn)을 사용
+MP_CONTEXT = multiprocessing.get_context("fork" if sys.platform.startswith("linux") else None)
+
+
+# 실행할 에이전트 서버: (에이전트 키, 모듈, 포트, 이름)
+AGENTS = (
+    ("planner", "server.agents.planner_server", 8001, "PlannerAgent"),
+    ("reviewer", "server.agents.reviewer_server", 8002, "ReviewerAgent"),
+    ("producer", "server.agents.producer_server", 8003, "ProducerAgent"),
+    ("uploader", "server.agents.uploader_server", 8004, "UploaderAgent"),
+)
+# 포트 -> Unix 도메인 소켓 경로 ({AGENT}_UDS 또는 A2A_UDS_DIR이 설정된 에이전트만)
+AGENT_UDS_PATHS: Dict[int, str] = {
+    port: uds_path
+    for agent_key, _, port, _ in AGENTS
+    if (uds_path := A2AConfig.get_uds_path(agent_key))
+}
 
+# 헬스 체크 요청 (응답 상태 줄만 확인하므로 HTTP/1.0으로 보내 서버가 바로 연결을 닫게 함)
+_HEALTH_REQUEST = b"GET /health HTTP/1.0\r\nHost: localhost\r\n\r\n"
 
-def check_server_health(port: int, timeout: int = 2) -> bool:
-    """서버 헬스 체크"""
-    import urllib.request
-    import urllib.error
+
+def _connect(port: int, uds_path: Optional[str], timeout: float) -> socket.socket:
+    """에이전트에 연결 (uds_path가 있으면 Unix 도메인 소켓, 없으면 TCP 루프백)"""
+    if not uds_path:
+        return socket.create_connection(("127.0.0.1", port), timeout=timeout)
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        response = urllib.request.urlopen(f"http://localhost:{port}/health", timeout=timeout)
-        return response.getcode() == 200
-    except:
+        s.settimeout(timeout)
+        s.connect(uds_path)
+    except OSError:
+        s.close()
+        raise
+    return s
+
+
+def check_server_health(port: int, timeout: float = 2, uds_path: Optional[str] = None) -> bool:
+    """서버 헬스 체크 (urllib 대신 소켓으로 요청을 보내고 상태 줄만 확인)"""
+    try:
+        with _connect(port, uds_path, timeout) as s:
+            s.sendall(_HEALTH_REQUEST)
+            status_line = s.recv(64).split(b"\r\n", 1)[0]
+        return status_line.split(b" ")[1:2] == [b"200"]
+    except OSError:
         return False
 
 
+def _run_agent(module_name: str, host: str, port: int):
+    """자식 프로세스 진입점: 에이전트 서버 모듈을 import하여 실행"""
+    os.chdir(PROJECT_ROOT)
+    importlib.import_module(module_name).run(host, port)
+
+
 def start_agent(module_name: str, port: int, agent_name: str):
     """에이전트 서버 시작"""
     print(f"Starting {agent_name} on port {port}...")
     
-    # Python 모듈로 실행 (python -m server.agents.planner_server)
-    process = subprocess.Popen(
-        [sys.executable, "-m", module_name],
-        cwd=str(PROJECT_ROOT),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+    # 에이전트 모듈의 run(host, port)을 자식 프로세스에서 실행
+    # 자식의 출력은 파이프 없이 현재 콘솔로 바로 출력됨
+    process = MP_CONTEXT.Process(
+        target=_run_agent,
+        args=(module_name, "0.0.0.0", port),
+        name=agent_name
     )
+    process.start()
     
     return process, agent_name
 
 
+def stop_agent(process, timeout: float = 5) -> bool:
+    """
+    에이전트 프로세스 종료
+    
+    Returns:
+        정상 종료되면 True, 강제 종료했으면 False
+    """
+    process.terminate()
+    process.join(timeout)
+    if process.is_alive():
+        process.kill()
+        process.join()
+        return False
+    return True
+
+
+async def _wait_ready(started: list, timeout: float = 10.0) -> list:
+    """
+    시작한 에이전트들의 헬스 체크를 동시에 수행합니다.
+    각 에이전트는 50ms에서 시작해 최대 500ms까지 늘어나는 간격으로 재시도합니다.
+    
+    Args:
+        started: (process, agent_name, port) 목록
+        timeout: 에이전트별 최대 대기 시간 (초)
+    
+    Returns:
+        started와 같은 순서의 준비 완료 여부 목록
+    """
+    async def probe(process, port: int) -> bool:
+        # Unix 도메인 소켓에서만 수신하는 에이전트는 해당 소켓으로 확인
+        uds_path = AGENT_UDS_PATHS.get(port)
+        transport = httpx.AsyncHTTPTransport(uds=uds_path) if uds_path else None
+        async with httpx.AsyncClient(transport=transport) as client:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            delay = 0.05
+            while loop.time() < deadline:
+                # 프로세스가 종료되었으면 더 기다리지 않음
+                if not process.is_alive():
+                    return False
+                try:
+                    response = await client.get(f"http://localhost:{port}/health", timeout=0.5)
+                    if response.status_code == 200:
+                        return True
+                except httpx.HTTPError:
+                    pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+            return False
+    
+    return await asyncio.gather(*(probe(process, port) for process, _, port in started))
+
+
 def main():
     """모든 에이전트 서버 시작"""
     print("=" * 60)
     print("Starting all A2A Agent Servers")
     print("=" * 60)
     
-    processes = []
+    # 공통 의존성을 부모에서 미리 import (fork 시 자식과 공유)
+    importlib.import_module("server.a2a_server")
     
-    # 각 에이전트 서버 시작
-    agents = [
-        ("server.agents.planner_server", 8001, "PlannerAgent"),
-        ("server.agents.reviewer_server", 8002, "ReviewerAgent"),
-        ("server.agents.producer_server", 8003, "ProducerAgent"),
-        ("server.agents.uploader_server", 8004, "UploaderAgent"),
-    ]
+    processes = []
+    started = []
     
-    for module_name, port, agent_name in agents:
+    # 1. 모든 에이전트 프로세스를 먼저 실행 (대기 없이)
+    for _, module_name, port, agent_name in AGENTS:
         try:
-            # 포트가 이미 사용 중이고 서버가 정상 작동 중인지 확인
-            if is_port_in_use(port):
-                if check_server_health(port, timeout=1):
-                    print(f"✓ {agent_name} already running on port {port} (reusing existing server)")
-                    # 기존 서버를 사용하므로 더미 프로세스 추가 (종료 시 제외)
-                    processes.append((None, agent_name, port))
-                    continue
-                else:
-                    print(f"⚠ Port {port} is in use but server not responding. Starting new instance...")
-            
-            process, name = start_agent(module_name, port, agent_name)
-            processes.append((process, name, port))
-            
-            # 서버 시작 대기 (초기 대기)
-            time.sleep(2)
-            
-            # 프로세스가 즉시 종료되었는지 확인 (실제 에러인 경우)
-            if process.poll() is not None:
-                # 프로세스가 종료된 경우 에러 출력 확인
-                try:
-                    stdout, _ = process.communicate(timeout=1)
-                    # 포트 충돌 에러인지 확인
-                    if stdout and ('10048' in stdout or 'address already in use' in stdout.lower() or '이미 사용 중' in stdout):
-                        # 포트 충돌이지만 기존 서버가 작동 중일 수 있음
-                        if check_server_health(port, timeout=1):
-                            print(f"✓ {agent_name} already running on port {port} (port conflict resolved)")
-                            # 기존 프로세스 제거하고 None으로 대체
-                            if (process, name, port) in processes:
-                                processes.remove((process, name, port))
-                            processes.append((None, agent_name, port))
-                            continue
-                    
-                    print(f"❌ {agent_name} failed to start!")
-                    if stdout:
-                        # FutureWarning은 무시하고 실제 에러만 표시
-                        error_lines = [line for line in stdout.split('\n') 
-                                     if 'Traceback' in line or ('Error' in line and 'FutureWarning' not in line) or 'Exception' in line]
-                        if error_lines:
-                            print(f"   Error: {error_lines[0][:200]}")
-                except:
-                    pass
-                # 실패한 프로세스 제거
-                if (process, name, port) in processes:
-                    processes.remove((process, name, port))
+            # 이미 정상 작동 중인 서버가 있는지 확인
+            # (헬스 체크 응답이 곧 포트가 열려 있다는 뜻이므로 별도 포트 검사는 하지 않음,
+            #  포트만 점유되어 있는 경우는 아래에서 시작 실패 후 처리)
+            if check_server_health(port, timeout=1, uds_path=AGENT_UDS_PATHS.get(port)):
+                print(f"✓ {agent_name} already running on port {port} (reusing existing server)")
+                # 기존 서버를 사용하므로 더미 프로세스 추가 (종료 시 제외)
+                processes.append((None, agent_name, port))
                 continue
             
-            # 헬스 체크로 서버가 실제로 응답하는지 확인 (재시도 포함)
-            import urllib.request
-            import urllib.error
-            health_check_passed = False
-            max_retries = 3
-            
-            for attempt in range(max_retries):
-                try:
-                    response = urllib.request.urlopen(f"http://localhost:{port}/health", timeout=2)
-                    if response.getcode() == 200:
-                        health_check_passed = True
-                        print(f"✓ {agent_name} started successfully on port {port}")
-                        break
-                except (urllib.error.URLError, Exception):
-                    # 프로세스가 여전히 실행 중이면 재시도
-                    if process.poll() is None:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)  # 재시도 전 대기
-                            continue
-                        else:
-                            # 모든 재시도 실패했지만 프로세스는 실행 중
-                            health_check_passed = True
-                            print(f"✓ {agent_name} started on port {port} (health check timeout, but process running)")
-                            break
-                    else:
-                        # 프로세스가 종료됨
-                        print(f"❌ {agent_name} failed to start (process terminated)")
-                        if (process, name, port) in processes:
-                            processes.remove((process, name, port))
-                        break
-            
-            # 헬스 체크 실패하고 프로세스도 종료된 경우 제외
-            if not health_check_passed and process.poll() is not None:
-                if (process, name, port) in processes:
-                    processes.remove((process, name, port))
-                    
+            process, name = start_agent(module_name, port, agent_name)
+            started.append((process, name, port))
         except Exception as e:
             print(f"❌ Failed to start {agent_name}: {e}")
     
-    # 실제로 시작된 서버만 표시 (None은 기존 서버, poll()이 None인 것은 실행 중인 프로세스)
-    running_servers = [(p, n, port) for p, n, port in processes if p is None or p.poll() is None]
+    # 2. 헬스 체크를 동시에 수행하여 가장 느린 에이전트의 준비 시간만큼만 대기
+    ready_flags = asyncio.run(_wait_ready(started)) if started else []
+    
+    for (process, name, port), ready in zip(started, ready_flags):
+        if ready:
+            print(f"✓ {name} started successfully on port {port}")
+            processes.append((process, name, port))
+            continue
+        
+        if process.is_alive():
+            # 헬스 체크는 시간 초과했지만 프로세스는 실행 중
+            print(f"✓ {name} started on port {port} (health check timeout, but process running)")
+            processes.append((process, name, port))
+            continue
+        
+        # 프로세스가 종료된 경우: 포트 충돌이지만 기존 서버가 작동 중일 수 있음
+        if check_server_health(port, timeout=1, uds_path=AGENT_UDS_PATHS.get(port)):
+            print(f"✓ {name} already running on port {port} (port conflict resolved)")
+            processes.append((None, name, port))
+            continue
+        
+        # 자식 프로세스의 에러 출력은 이미 콘솔에 표시됨
+        print(f"❌ {name} failed to start! (exit code: {process.exitcode})")
+    
+    # 실제로 시작된 서버만 표시 (None은 기존 서버, is_alive()인 것은 실행 중인 프로세스)
+    running_servers = [(p, n, port) for p, n, port in processes if p is None or p.is_alive()]
     
     if not running_servers:
         print("\n❌ No agents started successfully!")
@@ -166,6 +209,9 @@ def main():
     print("=" * 60)
     print("\nAgent URLs:")
     for _, name, port in running_servers:
+        if port in AGENT_UDS_PATHS:
+            print(f"  - {name}: unix:{AGENT_UDS_PATHS[port]}")
+            continue
         print(f"  - {name}: http://localhost:{port}")
         print(f"    AgentCard: http://localhost:{port}/a2a/agent_card")
         print(f"    Tasks: http://localhost:{port}/a2a/tasks")
@@ -175,17 +221,14 @@ def main():
         # 모든 프로세스가 종료될 때까지 대기 (None인 경우는 기존 서버이므로 대기하지 않음)
         for process, name, _ in running_servers:
             if process is not None:
-                process.wait()
+                process.join()
     except KeyboardInterrupt:
         print("\n\nStopping all agents...")
         for process, name, _ in running_servers:
             if process is not None:
-                try:
-                    process.terminate()
-                    process.wait(timeout=5)
+                if stop_agent(process):
                     print(f"  ✓ {name} stopped")
-                except:
-                    process.kill()
+                else:
                     print(f"  ✓ {name} force stopped")
             else:
                 print(f"  ⚠ {name} was already running (not stopped by this script)")
@@ -3,26 +3,106 @@ A2A 프로토콜 클라이언트 유틸리티
 다른 A2A 에이전트와 통신하기 위한 클라이언트
 """
 
+import re
+import time
 import httpx
 from typing import Dict, Any, Optional
 from .models import AgentCard, Task, TaskStatus, TaskState
 
 
+# 공유 클라이언트 연결 풀 설정
+# 유휴 연결 유지 시간은 httpx 기본값(5초)보다 길게 잡아, 한 워크플로우 안에서
+# 다른 에이전트를 기다리는 동안 연결이 만료되어 다시 맺는 일이 없도록 함 (서버 UVICORN_KEEPALIVE보다 짧게)
+AGENT_KEEPALIVE_EXPIRY = 60.0
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=AGENT_KEEPALIVE_EXPIRY
+)
+
+# 프로세스 전역 공유 HTTP 클라이언트 (keep-alive 연결 풀 재사용)
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+# Unix 도메인 소켓 경로별 공유 클라이언트
+_UDS_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    모든 A2AClient가 함께 사용하는 공유 httpx.AsyncClient를 반환합니다.
+    처음 호출될 때(또는 닫힌 이후) 지연 생성됩니다.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=300,
+            limits=_POOL_LIMITS
+        )
+    return _SHARED_CLIENT
+
+
+def get_uds_client(uds_path: str) -> httpx.AsyncClient:
+    """
+    Unix 도메인 소켓으로 연결하는 공유 httpx.AsyncClient를 반환합니다.
+    같은 호스트의 에이전트와 통신할 때 TCP 루프백 대신 사용합니다.
+    """
+    client = _UDS_CLIENTS.get(uds_path)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=uds_path),
+            timeout=300,
+            limits=_POOL_LIMITS
+        )
+        _UDS_CLIENTS[uds_path] = client
+    return client
+
+
+async def close_shared_client():
+    """공유 클라이언트 연결 종료 (서버 shutdown 시 호출)"""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None and not _SHARED_CLIENT.is_closed:
+        await _SHARED_CLIENT.aclose()
+    _SHARED_CLIENT = None
+    
+    for client in _UDS_CLIENTS.values():
+        if not client.is_closed:
+            await client.aclose()
+    _UDS_CLIENTS.clear()
+
+
+# 헬스 체크 결과 캐시 (agent_url -> 만료 시각). 서버의 Cache-Control max-age를 따름
+_health_cache: Dict[str, float] = {}
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
 class A2AClient:
     """
     A2A 프로토콜 클라이언트
     다른 A2A 에이전트와 통신합니다.
     """
     
-    def __init__(self, agent_url: str, timeout: int = 300):
+    def __init__(
+        self,
+        agent_url: str,
+        timeout: int = 300,
+        client: Optional[httpx.AsyncClient] = None,
+        uds: Optional[str] = None
+    ):
         """
         Args:
             agent_url: 에이전트의 기본 URL (예: "http://localhost:8001")
             timeout: 요청 타임아웃 (초)
+            client: 사용할 httpx.AsyncClient (기본값: 프로세스 전역 공유 클라이언트)
+            uds: 에이전트의 Unix 도메인 소켓 경로 (지정 시 TCP 대신 소켓으로 연결,
+                 agent_url은 Host 헤더와 경로 구성에만 사용)
         """
         self.agent_url = agent_url.rstrip('/')
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        if client is not None:
+            self.client = client
+        elif uds:
+            self.client = get_uds_client(uds)
+        else:
+            self.client = get_shared_client()
     
     async def get_agent_card(self) -> AgentCard:
         """
@@ -35,9 +115,12 @@ class A2AClient:
             httpx.HTTPError: HTTP 요청 실패 시
         """
         try:
-            response = await self.client.get(f"{self.agent_url}/a2a/agent_card")
+            response = await self.client.get(
+                f"{self.agent_url}/a2a/agent_card",
+                timeout=self.timeout
+            )
             response.raise_for_status()
-            return AgentCard(**response.json())
+            return AgentCard.model_validate_json(response.content)
         except httpx.HTTPError as e:
             raise Exception(f"AgentCard 조회 실패 ({self.agent_url}): {str(e)}")
     
@@ -55,12 +138,16 @@ class A2AClient:
             httpx.HTTPError: HTTP 요청 실패 시
         """
         try:
+            # Pydantic에서 바로 JSON 바이트로 직렬화하여 전송 (dict -> json 재직렬화 생략)
             response = await self.client.post(
                 f"{self.agent_url}/a2a/tasks",
-                json=task.model_dump(exclude_none=True)
+                content=task.model_dump_json(exclude_none=True).encode(),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
             )
             response.raise_for_status()
-            return TaskStatus(**response.json())
+            # JSON 바이트를 Pydantic으로 바로 검증 (중간 dict 생성 생략)
+            return TaskStatus.model_validate_json(response.content)
         except httpx.HTTPError as e:
             # HTTP 에러 시 FAILED 상태 반환
             return TaskStatus(
@@ -78,20 +165,34 @@ class A2AClient:
     async def health_check(self) -> bool:
         """
         에이전트의 헬스 체크를 수행합니다.
+        서버 응답의 Cache-Control max-age 동안은 HTTP 요청 없이 캐시된 결과를 반환합니다.
         
         Returns:
             에이전트가 정상이면 True
         """
+        expiry = _health_cache.get(self.agent_url)
+        if expiry is not None and time.monotonic() < expiry:
+            return True
+        
         try:
             response = await self.client.get(f"{self.agent_url}/health", timeout=5)
             response.raise_for_status()
-            return True
         except:
+            _health_cache.pop(self.agent_url, None)
             return False
+        
+        # 서버가 Cache-Control: max-age=N을 보내면 N초 동안 결과 재사용
+        match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+        if match:
+            _health_cache[self.agent_url] = time.monotonic() + int(match.group(1))
+        return True
     
     async def close(self):
-        """클라이언트 연결 종료"""
-        await self.client.aclose()
+        """
+        클라이언트 연결 종료
+        공유 클라이언트(또는 외부에서 주입된 클라이언트)는 소유자가 닫으므로 여기서는 닫지 않습니다.
+        """
+        pass
     
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -1,9 +1,13 @@
 """
 A2A 에이전트 설정
 각 에이전트의 URL 및 포트 설정을 관리합니다.
+
+URL 값은 프로세스 수명 동안 변하지 않으므로 최초 조회 시 캐시됩니다.
+환경 변수를 변경한 경우 프로세스를 재시작해야 반영됩니다.
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -21,6 +25,7 @@ class A2AConfig:
     DEFAULT_HOST = "0.0.0.0"
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_planner_url() -> str:
         """PlannerAgent URL 반환"""
         base_url = os.getenv("PLANNER_AGENT_URL")
@@ -30,6 +35,7 @@ class A2AConfig:
         return f"http://localhost:{port}"
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_reviewer_url() -> str:
         """ReviewerAgent URL 반환"""
         base_url = os.getenv("REVIEWER_AGENT_URL")
@@ -39,6 +45,7 @@ class A2AConfig:
         return f"http://localhost:{port}"
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_producer_url() -> str:
         """ProducerAgent URL 반환"""
         base_url = os.getenv("PRODUCER_AGENT_URL")
@@ -48,6 +55,7 @@ class A2AConfig:
         return f"http://localhost:{port}"
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_uploader_url() -> str:
         """UploaderAgent URL 반환"""
         base_url = os.getenv("UPLOADER_AGENT_URL")
@@ -56,6 +64,22 @@ class A2AConfig:
         port = int(os.getenv("UPLOADER_PORT", A2AConfig.DEFAULT_UPLOADER_PORT))
         return f"http://localhost:{port}"
     
+    @staticmethod
+    def get_uds_path(agent: str) -> Optional[str]:
+        """
+        에이전트의 Unix 도메인 소켓 경로 반환 (예: PLANNER_UDS=/tmp/planner.sock)
+        에이전트별 경로가 없고 A2A_UDS_DIR이 설정되어 있으면 {A2A_UDS_DIR}/{agent}.sock 사용
+        둘 다 설정되지 않았으면 None (TCP 사용)
+        
+        Args:
+            agent: 에이전트 이름 ("planner", "reviewer", "producer", "uploader")
+        """
+        uds_path = os.getenv(f"{agent.upper()}_UDS")
+        if uds_path:
+            return uds_path
+        uds_dir = os.getenv("A2A_UDS_DIR")
+        return os.path.join(uds_dir, f"{agent}.sock") if uds_dir else None
+    
     @staticmethod
     def get_all_agent_urls() -> Dict[str, str]:
         """모든 에이전트 URL 반환"""
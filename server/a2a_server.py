@@ -3,10 +3,49 @@ A2A 프로토콜 서버 베이스 클래스
 모든 A2A 에이전트 서버가 상속받는 기본 클래스
 """
 
+import asyncio
+import concurrent.futures
+import inspect
+import os
+import sys
+import orjson
+import uvicorn
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from typing import Dict, Any, Optional, Callable, Union, Awaitable
 from .models import AgentCard, Task, TaskStatus, TaskState
+from .a2a_client import close_shared_client
+
+# uvicorn.run에 넘길 이벤트 루프 / HTTP 파서 구현 (uvicorn[standard] 설치 시 uvloop + httptools)
+UVICORN_LOOP = "auto"
+UVICORN_HTTP = "auto"
+# 유휴 keep-alive 연결 유지 시간 (초). 클라이언트 풀(AGENT_KEEPALIVE_EXPIRY)보다 길어야
+# 에이전트 호출 사이(Gemini 응답 대기 등)에 풀의 연결이 서버 쪽에서 먼저 끊기지 않음
+UVICORN_KEEPALIVE = int(os.getenv("A2A_KEEPALIVE", "75"))
+
+# 더 빠른 이벤트 루프 사용 (선택적 의존성: Linux/macOS는 uvloop, Windows는 winloop)
+# 임포트한 프로세스의 전역 이벤트 루프 정책은 바꾸지 않고 uvicorn.run(loop=...)으로만 전달
+try:
+    if sys.platform == "win32":
+        import winloop  # noqa: F401
+        UVICORN_LOOP = "winloop:new_event_loop"
+    else:
+        import uvloop  # noqa: F401
+        UVICORN_LOOP = "uvloop"
+except ImportError:
+    pass
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    pass
+
+# 동기 task_handler 실행용 프로세스 전역 스레드 풀
+_TASK_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENT_WORKERS", "8")),
+    thread_name_prefix="a2a-task"
+)
 
 
 class A2AServerBase:
@@ -26,7 +65,13 @@ class A2AServerBase:
             task_handler: Task를 처리하는 함수
         """
         self.agent_card = agent_card
+        # AgentCard는 서버 수명 동안 변하지 않으므로 JSON 바이트를 한 번만 직렬화
+        self._agent_card_json = agent_card.model_dump_json().encode()
         self.task_handler = task_handler
+        # task_handler가 async인지 미리 확인 (요청마다 검사하지 않음)
+        self._handler_is_async = inspect.iscoroutinefunction(task_handler)
+        # 헬스 체크 응답 본문 (변하지 않으므로 한 번만 직렬화)
+        self._health_json = orjson.dumps({"status": "healthy", "agent": agent_card.name})
         self.app = FastAPI(
             title=f"{agent_card.name} - A2A Agent",
             description=agent_card.description,
@@ -40,33 +85,37 @@ class A2AServerBase:
         @self.app.get("/a2a/agent_card")
         async def get_agent_card():
             """A2A 표준: AgentCard 반환"""
-            return self.agent_card.model_dump()
+            return Response(
+                content=self._agent_card_json,
+                media_type="application/json"
+            )
         
         @self.app.post("/a2a/tasks")
         async def handle_task(task: Task):
             """A2A 표준: Task 처리"""
-            import asyncio
-            import inspect
-            
             try:
                 # Task 처리
-                # task_handler가 async인지 확인
-                if inspect.iscoroutinefunction(self.task_handler):
+                if self._handler_is_async:
                     result = await self.task_handler(task)
                 else:
                     # 동기 함수인 경우, 이미 실행 중인 이벤트 루프가 있으면
                     # 별도 스레드에서 실행
                     try:
                         loop = asyncio.get_running_loop()
-                        # 실행 중인 루프가 있으면 run_in_executor 사용
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            result = await loop.run_in_executor(executor, self.task_handler, task)
                     except RuntimeError:
+                        loop = None
+                    if loop is not None:
+                        # 실행 중인 루프가 있으면 공유 스레드 풀에서 실행
+                        result = await loop.run_in_executor(_TASK_EXECUTOR, self.task_handler, task)
+                    else:
                         # 실행 중인 루프가 없으면 직접 호출
                         result = self.task_handler(task)
                 
-                return result.model_dump()
+                # Pydantic에서 바로 JSON으로 직렬화 (dict 재직렬화 생략)
+                return Response(
+                    content=result.model_dump_json(exclude_none=True),
+                    media_type="application/json"
+                )
             except Exception as e:
                 # 에러 발생 시 FAILED 상태 반환
                 error_status = TaskStatus(
@@ -74,14 +123,58 @@ class A2AServerBase:
                     error=str(e),
                     message=f"Task 처리 중 오류 발생: {str(e)}"
                 )
-                return error_status.model_dump()
+                return Response(
+                    content=error_status.model_dump_json(exclude_none=True),
+                    media_type="application/json"
+                )
         
         @self.app.get("/health")
         async def health_check():
             """헬스 체크 엔드포인트"""
-            return {"status": "healthy", "agent": self.agent_card.name}
+            # 생존 확인용이므로 클라이언트/프록시가 결과를 캐시하지 않도록 no-store
+            # (캐시하면 종료된 에이전트가 캐시 기간 동안 정상으로 보고됨)
+            return Response(
+                content=self._health_json,
+                media_type="application/json",
+                headers={"Cache-Control": "no-store"}
+            )
+    
+    def close_shared_resources_on_shutdown(self):
+        """
+        서버 종료 시 프로세스 전역 공유 자원(A2A HTTP 클라이언트, 스레드 풀)을 정리하도록 등록
+        
+        다른 앱과 같은 프로세스에서 실행될 수 있으므로 인스턴스마다 등록하지 않고,
+        프로세스를 소유하는 serve()에서만 호출합니다.
+        """
+        @self.app.on_event("shutdown")
+        async def shutdown_event():
+            """서버 종료 시 공유 A2A HTTP 클라이언트 및 스레드 풀 정리"""
+            await close_shared_client()
+            _TASK_EXECUTOR.shutdown(wait=False)
     
     def get_app(self) -> FastAPI:
         """FastAPI 앱 반환"""
         return self.app
+    
+    def serve(self, host: str, port: int, uds_path: Optional[str] = None):
+        """
+        이 프로세스의 유일한 앱으로 uvicorn 서버 실행 (종료 시 공유 자원도 함께 정리)
+        
+        Args:
+            host: TCP 바인딩 호스트
+            port: TCP 포트
+            uds_path: 설정되어 있으면 TCP 대신 이 Unix 도메인 소켓에서 실행 (같은 호스트 통신용)
+        """
+        self.close_shared_resources_on_shutdown()
+        
+        if uds_path:
+            os.makedirs(os.path.dirname(uds_path) or ".", exist_ok=True)
+            print(f"Unix 소켓: {uds_path}")
+            bind: Dict[str, Any] = {"uds": uds_path}
+        else:
+            print(f"AgentCard: http://{host}:{port}/a2a/agent_card")
+            print(f"Tasks: http://{host}:{port}/a2a/tasks")
+            bind = {"host": host, "port": port}
+        
+        uvicorn.run(self.app, loop=UVICORN_LOOP, http=UVICORN_HTTP, timeout_keep_alive=UVICORN_KEEPALIVE, **bind)
 
@@ -0,0 +1,80 @@
+"""
+LLM 응답 캐시
+동일한 입력에 대한 Gemini 호출 결과를 프로세스 메모리에 보관하여
+반복 요청 시 API 왕복을 생략합니다. (정확히 일치하는 입력만 재사용)
+"""
+
+import hashlib
+import orjson
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 캐시 설정 (환경 변수로 조정 가능, LLM_CACHE_SIZE=0이면 비활성화)
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "512"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "3600"))
+
+
+class LLMCache:
+    """
+    SHA-256 키 기반 LRU + TTL 캐시
+    값은 JSON 직렬화 가능한 dict를 받아 JSON 바이트(불변)로 저장하고, 조회할 때마다 새 dict로 복원합니다.
+    (중첩된 리스트/dict까지 호출자 간에 공유되지 않음)
+    
+    모든 연산이 await 없이 이벤트 루프 스레드 안에서 끝나므로 별도의 락이 필요 없습니다.
+    """
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE, ttl: float = LLM_CACHE_TTL):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl: 항목 유지 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """입력 구성 요소들로부터 결정적인 캐시 키 생성"""
+        raw = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 값 반환 (없거나 만료되었으면 None)"""
+        if self.maxsize <= 0:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        # 저장된 JSON에서 새로 복원하므로 호출자가 결과를 수정해도 캐시가 오염되지 않음
+        return orjson.loads(entry[1])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """값 저장"""
+        if self.maxsize <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, orjson.dumps(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """히트/미스 통계"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._entries)
+        }
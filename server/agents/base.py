@@ -4,10 +4,13 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 from google import genai
 from google.genai import types
+import asyncio
+import concurrent.futures
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -16,6 +19,24 @@ load_dotenv()
 # Gemini API 키 로드
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Gemini 호출용 프로세스 전역 스레드 풀 (호출마다 생성하지 않고 재사용)
+_AGENT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("AGENT_WORKERS", "8")),
+    thread_name_prefix="agent"
+)
+
+# 서버 시작 시 예열 최대 대기 시간 (초). 네트워크가 느리거나 막혀 있어도 기동이 지연되지 않도록 제한
+WARMUP_TIMEOUT = float(os.getenv("AGENT_WARMUP_TIMEOUT", "5"))
+
+@lru_cache(maxsize=None)
+def _get_shared_client() -> genai.Client:
+    """
+    프로세스 전역 Gemini 클라이언트를 반환합니다.
+    모든 에이전트와 워커 스레드가 하나의 클라이언트(및 그 HTTP 연결 풀)를 공유합니다.
+    동기 API만 워커 스레드에서 사용하므로 이벤트 루프와 충돌하지 않습니다.
+    """
+    return genai.Client(api_key=GEMINI_API_KEY)
+
 
 class BaseAgent(ABC):
     """
@@ -38,8 +59,34 @@ class BaseAgent(ABC):
                 ".env 파일에 GEMINI_API_KEY를 설정하세요."
             )
         
-        # 새로운 Gemini API 클라이언트 초기화
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
+        # 프로세스 전역 Gemini API 클라이언트 공유
+        self.client = _get_shared_client()
+    
+    async def warmup(self) -> None:
+        """
+        Gemini 연결을 미리 수립합니다. (서버 시작 시 호출)
+        토큰을 소비하지 않는 모델 정보 조회로 TLS/HTTP 연결을 열어 두어
+        첫 실제 요청의 콜드 스타트 지연을 줄입니다. 실패해도 무시합니다.
+        """
+        def _sync_warmup():
+            self.client.models.get(model=self.model_name)
+        
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_AGENT_EXECUTOR, _sync_warmup)
+            print(f"[{self.name}] Gemini 연결 예열 완료")
+        except Exception as e:
+            print(f"[{self.name}] Gemini 연결 예열 실패 (무시): {str(e)}")
+    
+    async def warmup_with_timeout(self, timeout: float = WARMUP_TIMEOUT) -> None:
+        """
+        warmup()을 최대 timeout초까지만 기다립니다. (서버 startup 훅에서 사용)
+        시간을 초과하면 예열을 포기하고 기동을 계속합니다.
+        """
+        try:
+            await asyncio.wait_for(self.warmup(), timeout)
+        except asyncio.TimeoutError:
+            print(f"[{self.name}] 예열 시간 초과 ({timeout}초, 무시)")
     
     @abstractmethod
     async def process(self, input_data: str, context: Optional[str] = None) -> str:
@@ -71,78 +118,113 @@ class BaseAgent(ABC):
         
         # 프롬프트가 너무 길면 자르기
         # 중요한 부분(시작 부분)은 유지하고, 중간/끝 부분을 자름
-        truncated = prompt[:max_chars]
-        
-        # 마지막 문장이 잘리지 않도록 마지막 줄바꿈이나 문장 끝을 찾아서 자름
-        last_newline = truncated.rfind('\n')
-        last_period = truncated.rfind('.')
-        last_cut = max(last_newline, last_period)
-        
-        if last_cut > max_chars * 0.9:  # 90% 이상이면 그 위치에서 자름
-            truncated = truncated[:last_cut + 1]
+        # 마지막 문장이 잘리지 않도록 90% 지점 이후의 마지막 줄바꿈이나 문장 끝을 찾아서 자름
+        # (검색 범위를 마지막 10% 구간으로 제한하여 전체 문자열을 훑지 않음)
+        window_start = int(max_chars * 0.9) + 1
+        last_cut = max(
+            prompt.rfind('\n', window_start, max_chars),
+            prompt.rfind('.', window_start, max_chars)
+        )
+        cut = last_cut + 1 if last_cut != -1 else max_chars
+        truncated = prompt[:cut]
         
         # 잘렸다는 경고 메시지 추가
         truncated += f"\n\n[Note: 프롬프트가 {len(prompt)}자에서 {len(truncated)}자로 제한되었습니다. 일부 내용이 생략되었을 수 있습니다.]"
         
         return truncated
     
-    async def _generate_content(self, prompt: str, response_mime_type: Optional[str] = None) -> str:
+    async def _create_cached_content(self, system_instruction: str, ttl_seconds: int) -> str:
+        """
+        고정된 시스템 프롬프트를 Gemini 컨텍스트 캐시에 등록합니다.
+        
+        Args:
+            system_instruction: 캐시할 시스템 프롬프트
+            ttl_seconds: 캐시 유지 시간 (초)
+            
+        Returns:
+            캐시 이름 (generate 호출 시 cached_content로 전달)
+        """
+        def _sync_create():
+            cached = self.client.caches.create(
+                model=self.model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    ttl=f"{ttl_seconds}s"
+                )
+            )
+            return cached.name
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_AGENT_EXECUTOR, _sync_create)
+    
+    async def _delete_cached_content(self, name: str) -> None:
+        """
+        Gemini 컨텍스트 캐시를 삭제합니다. (더 이상 쓰지 않는 캐시가 TTL까지 과금되지 않도록)
+        이미 만료/삭제된 경우 등 실패는 무시합니다.
+        """
+        def _sync_delete():
+            self.client.caches.delete(name=name)
+        
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_AGENT_EXECUTOR, _sync_delete)
+        except Exception as e:
+            print(f"[{self.name}] 컨텍스트 캐시 삭제 실패 (무시): {str(e)}")
+    
+    async def _generate_content(
+        self,
+        prompt: str,
+        response_mime_type: Optional[str] = None,
+        system_instruction: Optional[str] = None,
+        cached_content: Optional[str] = None,
+        response_schema: Optional[Any] = None
+    ) -> str:
         """
         Gemini 모델을 사용하여 콘텐츠 생성 (async)
         FastAPI의 실행 중인 이벤트 루프와 충돌을 방지하기 위해
         동기 버전을 run_in_executor로 실행
-        각 스레드에서 독립적인 클라이언트를 생성하여 이벤트 루프 충돌 방지
+        모든 워커 스레드가 프로세스 전역 클라이언트를 공유
         
         Args:
             prompt: 프롬프트 텍스트
             response_mime_type: 응답 MIME 타입 (예: "application/json")
+            system_instruction: 시스템 프롬프트 (고정 접두부로 전달되어 Gemini 캐시 재사용에 유리)
+            cached_content: 컨텍스트 캐시 이름 (지정 시 system_instruction 대신 사용)
+            response_schema: 응답 JSON 스키마 (Pydantic 모델 등, response_mime_type="application/json"과 함께 사용)
             
         Returns:
             생성된 콘텐츠
         """
-        import asyncio
-        import concurrent.futures
-        
         # 프롬프트 길이 제한 적용 (503 오류 방지)
         prompt = self._truncate_prompt(prompt)
         
         # Config 준비
         config = None
-        if response_mime_type:
+        if response_mime_type or system_instruction or cached_content or response_schema:
             config = types.GenerateContentConfig(
-                response_mime_type=response_mime_type
+                response_mime_type=response_mime_type,
+                response_schema=response_schema,
+                system_instruction=None if cached_content else system_instruction,
+                cached_content=cached_content
             )
         
         def _sync_generate():
-            """동기 버전의 generate_content를 실행
-            각 스레드에서 독립적인 클라이언트를 생성하여 이벤트 루프 충돌 방지
-            """
+            """동기 버전의 generate_content를 실행"""
             try:
-                # 각 스레드에서 독립적인 클라이언트 생성
-                # 이렇게 하면 클라이언트가 내부적으로 이벤트 루프를 사용해도 충돌하지 않음
-                thread_client = genai.Client(api_key=GEMINI_API_KEY)
-                
-                response = thread_client.models.generate_content(
+                response = self.client.models.generate_content(
                     model=self.model_name,
                     contents=prompt,
                     config=config
                 )
-                result = response.text
-                
-                # 클라이언트 정리
-                thread_client.close()
-                
-                return result
+                return response.text
             except Exception as e:
                 raise Exception(f"{self.name} 콘텐츠 생성 실패: {str(e)}")
         
         try:
             # 현재 실행 중인 이벤트 루프 가져오기
             loop = asyncio.get_running_loop()
-            # 별도 스레드에서 동기 함수 실행
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                result = await loop.run_in_executor(executor, _sync_generate)
-            return result
+            # 공유 스레드 풀에서 동기 함수 실행
+            return await loop.run_in_executor(_AGENT_EXECUTOR, _sync_generate)
         except Exception as e:
             raise Exception(f"{self.name} 콘텐츠 생성 실패: {str(e)}")
 
@@ -4,6 +4,7 @@ ASMR, Nature Landscapes, Meditation 전문 비디오 디렉터
 사용자 키워드를 상세한 Google Veo 프롬프트로 변환합니다.
 """
 
+import orjson
 from typing import Optional
 from .base import BaseAgent
 
@@ -201,8 +202,6 @@ Output your storyboard in the format specified above, then provide the final com
         Returns:
             YouTube 메타데이터 딕셔너리 (title, description, tags)
         """
-        import json
-        
         metadata_prompt = f"""You are a YouTube content strategist specializing in Healing, ASMR, and Meditation videos.
 
 Based on this video storyboard/prompt, create engaging YouTube metadata:
@@ -237,8 +236,8 @@ Tags should be relevant to: healing, ASMR, meditation, relaxation, nature, etc."
             
             # JSON 파싱
             try:
-                metadata_dict = json.loads(response_text)
-            except json.JSONDecodeError:
+                metadata_dict = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
                 # JSON 파싱 실패 시 기본값 사용
                 metadata_dict = {
                     "title": f"Healing {topic} - Relaxing ASMR Video",
@@ -3,15 +3,24 @@ ProducerAgent A2A 서버
 포트 8003에서 실행되는 독립적인 A2A 에이전트 서버
 """
 
-import uvicorn
+import asyncio
 import os
 from typing import Dict, Any
 from ..a2a_server import A2AServerBase
+from ..a2a_config import A2AConfig
 from ..models import AgentCard, AgentSkill, Task, TaskStatus, TaskState, TransportProtocol, AgentCapabilities
-from ..tools import generate_veo_video_for_duration
+from ..tools import generate_veo_segments, merge_video_segments
 
+# 단계별 동시 실행 수 제한
+# - Veo 생성/폴링(I/O 대기 위주)은 넉넉하게
+# - 클립 병합 인코딩(CPU 위주)은 적게
+PRODUCER_VEO_INFLIGHT = int(os.getenv("PRODUCER_VEO_INFLIGHT", "8"))
+PRODUCER_ENC_INFLIGHT = int(os.getenv("PRODUCER_ENC_INFLIGHT", "2"))
+_veo_semaphore = asyncio.Semaphore(PRODUCER_VEO_INFLIGHT)
+_encode_semaphore = asyncio.Semaphore(PRODUCER_ENC_INFLIGHT)
 
-def handle_producer_task(task: Task) -> TaskStatus:
+
+async def handle_producer_task(task: Task) -> TaskStatus:
     """
     Producer Task 처리 함수
     
@@ -36,14 +45,21 @@ def handle_producer_task(task: Task) -> TaskStatus:
             )
         
         # Veo 비디오 생성 (8초 이하: 단일 클립, 8초 초과: 여러 클립 병합)
-        print(f"[ProducerAgent] Veo 비디오 생성 시작...")
-        veo_video_path = generate_veo_video_for_duration(
-            prompt=prompt,
-            output_dir=output_dir,
-            total_duration_seconds=int(video_duration) if video_duration else None,
-            aspect_ratio="9:16",  # YouTube Shorts 세로형
-            resolution="1080p",  # YouTube Shorts 권장 해상도
-        )
+        # 블로킹 작업(Veo 폴링, FFmpeg 병합)은 워커 스레드에서 실행하여 이벤트 루프를 막지 않음
+        # 단계마다 세마포어를 따로 두어, 한 Task가 병합 인코딩 중일 때 다른 Task의 Veo 생성이 진행되도록 함
+        async with _veo_semaphore:
+            print(f"[ProducerAgent] Veo 비디오 생성 시작...")
+            segment_paths = await asyncio.to_thread(
+                generate_veo_segments,
+                prompt=prompt,
+                output_dir=output_dir,
+                total_duration_seconds=int(video_duration) if video_duration else None,
+                aspect_ratio="9:16",  # YouTube Shorts 세로형
+                resolution="1080p",  # YouTube Shorts 권장 해상도
+            )
+        
+        async with _encode_semaphore:
+            veo_video_path = await asyncio.to_thread(merge_video_segments, segment_paths, output_dir)
         
         # Seamless loop 제거 - 원본 비디오 그대로 사용
         final_video_path = veo_video_path
@@ -102,26 +118,22 @@ def create_server(base_url: str = "http://localhost:8003") -> A2AServerBase:
     return A2AServerBase(agent_card, handle_producer_task)
 
 
-if __name__ == "__main__":
-    """서버 실행"""
-    import sys
-    
-    # 환경 변수에서 포트 및 URL 읽기
-    port = int(os.getenv("PRODUCER_PORT", "8003"))
-    host = os.getenv("PRODUCER_HOST", "0.0.0.0")
+def run(host: str = "0.0.0.0", port: int = 8003):
+    """서버 실행 (독립 실행 및 start_all_agents 슈퍼바이저에서 사용)"""
     base_url = os.getenv("PRODUCER_URL", f"http://localhost:{port}")
     
     # 서버 생성
     server = create_server(base_url)
-    app = server.get_app()
     
     print(f"ProducerAgent A2A 서버 시작: {base_url}")
-    print(f"AgentCard: http://{host}:{port}/a2a/agent_card")
-    print(f"Tasks: http://{host}:{port}/a2a/tasks")
-    
-    # 서버 실행
-    uvicorn.run(app, host=host, port=port)
-
-
+    # PRODUCER_UDS(또는 A2A_UDS_DIR)가 설정되어 있으면 TCP 대신 Unix 도메인 소켓에서 실행
+    server.serve(host, port, uds_path=A2AConfig.get_uds_path("producer"))
 
 
+if __name__ == "__main__":
+    """서버 실행"""
+    # 환경 변수에서 포트 및 호스트 읽기
+    port = int(os.getenv("PRODUCER_PORT", "8003"))
+    host = os.getenv("PRODUCER_HOST", "0.0.0.0")
+    
+    run(host, port)
@@ -4,24 +4,76 @@ Seamless Loop Healing Shorts의 품질 게이트키퍼
 LLM을 사용하여 프롬프트를 의미론적으로 평가합니다.
 """
 
-import json
-from typing import Optional
+import asyncio
+import orjson
+import re
+import time
+from typing import Optional, Tuple
+from google.genai import errors as genai_errors
 from .base import BaseAgent
+from ._llm_cache import LLMCache
 from ..models import ReviewResult
 
+# 캐시 키 생성 시 의미 없는 공백 차이를 무시하기 위한 패턴
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 사전 검사(기술 요구사항, 기준 3)용 패턴: 해상도 표기와 초 단위 길이 표기
+_RESOLUTION_PATTERN = re.compile(r"1080\s*[x×]\s*1920|9\s*:\s*16|youtube\s+shorts", re.IGNORECASE)
+# 숫자 앞은 \b 대신 (?<![\d.])로 확인: 한글도 \w이므로 "길이10초"처럼 한글 바로 뒤의 숫자는 \b로 잡히지 않음
+# 같은 이유로 "s" 뒤도 \b 대신 영문자가 이어지지 않는지만 확인 ("10s동안" 허용, "15 scenes" 제외)
+_DURATION_PATTERN = re.compile(r"(?<![\d.])\d+(?:\.\d+)?[\s-]*(?:seconds?|secs?|s(?![a-z])|초)", re.IGNORECASE)
+
+
+def _is_cache_error(error: Exception) -> bool:
+    """
+    컨텍스트 캐시 자체의 문제(만료/삭제되었거나 cached_content가 유효하지 않음)로 인한 오류인지 확인
+    429/503 같은 일시적 오류는 캐시 없이 다시 보내도 같은 부하만 늘리므로 제외
+    """
+    if not isinstance(error, genai_errors.APIError):
+        return False
+    if error.code == 404 or error.status == "NOT_FOUND":
+        return True
+    message = (error.message or "").lower()
+    return (error.code == 400 or error.status == "INVALID_ARGUMENT") and "cache" in message
+
+
+# 평가 요청의 정적 조각 (요청마다 f-string으로 다시 만들지 않음)
+_EVAL_PREFIX = "Evaluate this storyboard/prompt:\n"
+_EVAL_SUFFIX = """
+
+Check ALL criteria systematically:
+1. Is the theme appropriate (Healing/ASMR/Nature/Relaxing)?
+2. Does it follow the storyboard format (VIDEO SPECIFICATIONS, STORYBOARD sections, OVERALL PROMPT)?
+3. Does it mention 1080x1920 resolution and specify duration?
+4. Are camera movements (if any) slow and calming?
+5. Is the storyboard detailed and professional?
+6. Is the content specific and descriptive enough?
+
+Output your evaluation as JSON only (no additional text):"""
+
 
 class ReviewerAgent(BaseAgent):
     """
     품질 검토 에이전트
     Gemini LLM을 사용하여 프롬프트를 의미론적으로 평가합니다.
-    규칙 기반 로직을 사용하지 않고 순수 LLM 이해에 의존합니다.
+    단, 해상도/길이 표기가 아예 없는 프롬프트는 LLM 호출 전에
+    정규식 사전 검사(_fast_preflight)로 바로 거절합니다. 그 외 판단은 모두 LLM에 맡깁니다.
     """
     
+    # 시스템 프롬프트 컨텍스트 캐시 유지 시간 (초)
+    PROMPT_CACHE_TTL = 3600
+    
     def __init__(self):
         super().__init__(
             name="ReviewerAgent",
             model_name="gemini-2.5-flash"
         )
+        # 동일한 프롬프트/길이 조합에 대한 평가 결과 캐시
+        self.cache = LLMCache()
+        # Gemini 컨텍스트 캐시 (캐시 이름, 만료 시각) 및 생성 실패 시 재시도 가능 시각
+        self._prompt_cache: Optional[Tuple[str, float]] = None
+        self._prompt_cache_retry_at = 0.0
+        self._prompt_cache_lock = asyncio.Lock()
         self.system_prompt = """You are a strict quality gatekeeper for "Healing Shorts" video storyboards and prompts.
 
 Your role is to evaluate storyboards/prompts for Google Veo and ensure they meet ALL of the following criteria:
@@ -123,8 +175,70 @@ Be strict but fair. Only approve storyboards/prompts that meet ALL critical crit
         """
         review_result = await self.evaluate(input_data)
         # ReviewResult를 JSON 문자열로 변환
-        import json
-        return json.dumps(review_result.dict(), ensure_ascii=False)
+        return orjson.dumps(review_result.model_dump()).decode()
+    
+    async def _get_prompt_cache(self) -> Optional[str]:
+        """
+        시스템 프롬프트를 담은 Gemini 컨텍스트 캐시 이름을 반환합니다.
+        캐시가 없거나 만료되었으면 새로 생성하고, 생성에 실패하면
+        (예: 최소 토큰 수 미달) 한동안 재시도하지 않고 None을 반환합니다.
+        """
+        async with self._prompt_cache_lock:
+            now = time.monotonic()
+            if self._prompt_cache is not None and now < self._prompt_cache[1]:
+                return self._prompt_cache[0]
+            if now < self._prompt_cache_retry_at:
+                return None
+            
+            try:
+                name = await self._create_cached_content(self.system_prompt, self.PROMPT_CACHE_TTL)
+            except Exception as e:
+                print(f"[ReviewerAgent] 시스템 프롬프트 캐시 생성 실패 (일반 호출 사용): {str(e)}")
+                self._prompt_cache = None
+                self._prompt_cache_retry_at = now + self.PROMPT_CACHE_TTL
+                return None
+            
+            # 만료 직전 호출이 실패하지 않도록 1분 여유를 둠
+            self._prompt_cache = (name, now + self.PROMPT_CACHE_TTL - 60)
+            return name
+    
+    def _fast_preflight(self, prompt: str) -> Optional[ReviewResult]:
+        """
+        Gemini 호출 전 로컬 사전 검사를 수행합니다.
+        필수 기준 3(해상도/길이 명시)이 명백히 누락된 경우에만 즉시 REJECTED를 반환하고,
+        그 외에는 None을 반환하여 LLM 평가로 넘깁니다.
+        
+        해상도로 인정하는 표기 (대소문자 무시):
+            "1080x1920" / "1080 × 1920" (공백 허용), "9:16", "YouTube Shorts"
+            ("1920x1080"처럼 가로 해상도만 적힌 경우는 누락으로 봄)
+        길이로 인정하는 표기:
+            숫자(소수 포함) 뒤에 "second(s)", "sec(s)", "s", "초"가 오는 경우
+            (예: "15 seconds", "8-second", "7.5s", "15초", "길이10초"). 숫자 없이 "a few seconds"는 누락으로 봄
+        표기만 확인하며 값이 요청 길이와 맞는지는 LLM 평가(expected_duration)에서 확인합니다.
+        
+        Args:
+            prompt: 평가할 Veo 프롬프트
+            
+        Returns:
+            명백한 거절 사유가 있으면 ReviewResult, 없으면 None
+        """
+        missing = []
+        if not _RESOLUTION_PATTERN.search(prompt):
+            missing.append('resolution ("1080x1920", "vertical 9:16 format" or "YouTube Shorts format")')
+        if not _DURATION_PATTERN.search(prompt):
+            missing.append('exact duration in seconds (e.g., "15 seconds")')
+        
+        if not missing:
+            return None
+        
+        return ReviewResult(
+            status="REJECTED",
+            feedback=(
+                "TECHNICAL REQUIREMENTS (criterion 3) failed. The storyboard/prompt must explicitly mention: "
+                + "; ".join(missing) + "."
+            ),
+            score=0
+        )
     
     async def evaluate(self, prompt: str, expected_duration: Optional[float] = None) -> ReviewResult:
         """
@@ -137,36 +251,65 @@ Be strict but fair. Only approve storyboards/prompts that meet ALL critical crit
         Returns:
             ReviewResult 객체 (status, feedback, score)
         """
+        cache_key = LLMCache.make_key(
+            model=self.model_name,
+            system=self.system_prompt,
+            # 줄바꿈/들여쓰기만 다른 동일 구조의 프롬프트도 같은 키로 취급
+            input=_WHITESPACE_PATTERN.sub(" ", prompt).strip(),
+            duration=expected_duration
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return ReviewResult(**cached)
+        
+        # 필수 기술 요구사항이 명백히 빠진 경우 Gemini 호출 없이 즉시 거절
+        preflight = self._fast_preflight(prompt)
+        if preflight is not None:
+            return preflight
+        
         duration_check = ""
         if expected_duration:
-            duration_check = f"\n\nIMPORTANT: The video MUST be exactly {int(expected_duration)} seconds long. Verify that the prompt/storyboard explicitly mentions this duration."
+            duration_check = f"IMPORTANT: The video MUST be exactly {int(expected_duration)} seconds long. Verify that the prompt/storyboard explicitly mentions this duration.\n\n"
         
-        evaluation_prompt = f"""{self.system_prompt}{duration_check}
-
-Evaluate this storyboard/prompt:
-{prompt}
-
-Check ALL criteria systematically:
-1. Is the theme appropriate (Healing/ASMR/Nature/Relaxing)?
-2. Does it follow the storyboard format (VIDEO SPECIFICATIONS, STORYBOARD sections, OVERALL PROMPT)?
-3. Does it mention 1080x1920 resolution and specify duration?
-4. Are camera movements (if any) slow and calming?
-5. Is the storyboard detailed and professional?
-6. Is the content specific and descriptive enough?
-
-Output your evaluation as JSON only (no additional text):"""
+        # 고정된 system_prompt는 system_instruction(또는 컨텍스트 캐시)으로 보내고
+        # 요청마다 달라지는 부분만 사용자 입력으로 전달 (정적 조각은 모듈 상수로 미리 구성)
+        evaluation_prompt = "".join((duration_check, _EVAL_PREFIX, prompt, _EVAL_SUFFIX))
         
         try:
             # Gemini를 사용하여 JSON 형식으로 평가 결과 생성
-            response_text = await self._generate_content(
-                evaluation_prompt,
-                response_mime_type="application/json"
-            )
+            # ReviewResult 스키마로 응답 형식을 강제 (status → feedback → score 순서, JSON 파싱 실패로 인한 재시도 방지)
+            cached_content = await self._get_prompt_cache()
+            try:
+                response_text = await self._generate_content(
+                    evaluation_prompt,
+                    response_mime_type="application/json",
+                    response_schema=ReviewResult,
+                    system_instruction=self.system_prompt,
+                    cached_content=cached_content
+                )
+            except Exception as e:
+                if cached_content is None or not _is_cache_error(e):
+                    raise
+                # 캐시가 서버 측에서 만료/삭제되었거나 유효하지 않은 경우에만 캐시 없이 한 번 더 시도
+                # (다른 요청이 이미 새 캐시로 교체했으면 그대로 둠)
+                if self._prompt_cache is not None and self._prompt_cache[0] == cached_content:
+                    self._prompt_cache = None
+                # 남아 있을 수 있는 이전 캐시는 TTL까지 과금되지 않도록 삭제 (이미 없으면 생략)
+                if not (e.code == 404 or e.status == "NOT_FOUND"):
+                    await self._delete_cached_content(cached_content)
+                response_text = await self._generate_content(
+                    evaluation_prompt,
+                    response_mime_type="application/json",
+                    response_schema=ReviewResult,
+                    system_instruction=self.system_prompt
+                )
             
             # JSON 파싱
+            parsed = True
             try:
-                result_dict = json.loads(response_text)
-            except json.JSONDecodeError:
+                result_dict = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
+                parsed = False
                 # JSON 파싱 실패 시, 텍스트에서 JSON 추출 시도
                 # 또는 기본값 사용
                 result_dict = {
@@ -187,6 +330,10 @@ Output your evaluation as JSON only (no additional text):"""
                 review_result.status = "REJECTED"
                 review_result.feedback = f"Invalid status '{review_result.status}'. " + review_result.feedback
             
+            # 정상적으로 파싱된 평가 결과만 캐시 (파싱 실패/오류는 다음 호출에서 재시도)
+            if parsed:
+                self.cache.set(cache_key, review_result.model_dump())
+            
             return review_result
             
         except Exception as e:
@@ -3,16 +3,20 @@ ReviewerAgent A2A 서버
 포트 8002에서 실행되는 독립적인 A2A 에이전트 서버
 """
 
-import uvicorn
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from ..a2a_server import A2AServerBase
+from ..a2a_config import A2AConfig
 from ..models import AgentCard, AgentSkill, Task, TaskStatus, TaskState, TransportProtocol, AgentCapabilities
 from .reviewer import ReviewerAgent
 
 
-# ReviewerAgent 인스턴스 생성
-reviewer_agent = ReviewerAgent()
+# ReviewerAgent 인스턴스 (첫 Task 처리 시 한 번만 생성)
+@lru_cache(maxsize=None)
+def get_reviewer_agent() -> ReviewerAgent:
+    """ReviewerAgent 싱글톤 반환"""
+    return ReviewerAgent()
 
 
 async def handle_reviewer_task(task: Task) -> TaskStatus:
@@ -25,8 +29,6 @@ async def handle_reviewer_task(task: Task) -> TaskStatus:
     Returns:
         TaskStatus 객체
     """
-    import asyncio
-    
     try:
         # Task 입력에서 데이터 추출
         task_input = task.input or {}
@@ -42,7 +44,7 @@ async def handle_reviewer_task(task: Task) -> TaskStatus:
         
         # ReviewerAgent의 evaluate 메서드 호출
         # 이제 async 함수이므로 직접 await 가능
-        review_result = await reviewer_agent.evaluate(prompt, expected_duration=expected_duration)
+        review_result = await get_reviewer_agent().evaluate(prompt, expected_duration=expected_duration)
         
         return TaskStatus(
             state=TaskState.COMPLETED,
@@ -95,26 +97,32 @@ def create_reviewer_agent_card(base_url: str = "http://localhost:8002") -> Agent
 def create_server(base_url: str = "http://localhost:8002") -> A2AServerBase:
     """ReviewerAgent A2A 서버 생성"""
     agent_card = create_reviewer_agent_card(base_url)
-    return A2AServerBase(agent_card, handle_reviewer_task)
+    server = A2AServerBase(agent_card, handle_reviewer_task)
+    
+    @server.get_app().on_event("startup")
+    async def warmup_gemini():
+        """첫 Task 전에 Gemini 연결 예열 (WARMUP_TIMEOUT초 이상 기동을 지연시키지 않음)"""
+        await get_reviewer_agent().warmup_with_timeout()
+    
+    return server
 
 
-if __name__ == "__main__":
-    """서버 실행"""
-    import sys
-    
-    # 환경 변수에서 포트 및 URL 읽기
-    port = int(os.getenv("REVIEWER_PORT", "8002"))
-    host = os.getenv("REVIEWER_HOST", "0.0.0.0")
+def run(host: str = "0.0.0.0", port: int = 8002):
+    """서버 실행 (독립 실행 및 start_all_agents 슈퍼바이저에서 사용)"""
     base_url = os.getenv("REVIEWER_URL", f"http://localhost:{port}")
     
     # 서버 생성
     server = create_server(base_url)
-    app = server.get_app()
     
     print(f"ReviewerAgent A2A 서버 시작: {base_url}")
-    print(f"AgentCard: http://{host}:{port}/a2a/agent_card")
-    print(f"Tasks: http://{host}:{port}/a2a/tasks")
-    
-    # 서버 실행
-    uvicorn.run(app, host=host, port=port)
+    # REVIEWER_UDS(또는 A2A_UDS_DIR)가 설정되어 있으면 TCP 대신 Unix 도메인 소켓에서 실행
+    server.serve(host, port, uds_path=A2AConfig.get_uds_path("reviewer"))
+
 
+if __name__ == "__main__":
+    """서버 실행"""
+    # 환경 변수에서 포트 및 호스트 읽기
+    port = int(os.getenv("REVIEWER_PORT", "8002"))
+    host = os.getenv("REVIEWER_HOST", "0.0.0.0")
+    
+    run(host, port)
@@ -4,10 +4,13 @@ YouTube 업로드를 담당하는 A2A 에이전트
 메타데이터 검증 및 업로드 전 최종 검토를 수행합니다.
 """
 
-from typing import Optional, Dict
+import asyncio
+import orjson
+from typing import Callable, Optional, Dict, Set
 from .base import BaseAgent
+from ._llm_cache import LLMCache
 from ..models import AgentMessage, YouTubeMetadata
-from ..tools import upload_youtube_shorts
+from ..tools import prewarm_youtube_client, upload_youtube_shorts
 import os
 
 
@@ -22,6 +25,33 @@ class UploaderAgent(BaseAgent):
             name="UploaderAgent",
             model_name="gemini-2.5-flash"
         )
+        # 동일한 메타데이터에 대한 검증 결과 캐시
+        self.cache = LLMCache()
+        # 실행 중인 백그라운드 검증 Task (완료 전 GC 방지용 참조)
+        self._background_tasks: Set[asyncio.Task] = set()
+    
+    async def warmup(self) -> None:
+        """Gemini 연결과 함께 저장된 인증 정보로 YouTube API 클라이언트도 예열합니다."""
+        await asyncio.gather(
+            super().warmup(),
+            asyncio.to_thread(prewarm_youtube_client)
+        )
+    
+    def _log_validation_result(self, task: "asyncio.Task") -> None:
+        """백그라운드 메타데이터 검증 완료 시 결과를 로그로 남깁니다."""
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        
+        error = task.exception()
+        if error is not None:
+            print(f"[UploaderAgent] 메타데이터 검증 중 오류 발생 (업로드는 계속 진행): {str(error)}")
+            return
+        
+        validation_result = task.result()
+        if not validation_result["valid"]:
+            # 검증 실패 시에도 업로드는 진행 (경고만 표시)
+            print(f"[UploaderAgent] 메타데이터 검증 실패: {validation_result['feedback']}")
     
     async def process(
         self,
@@ -30,7 +60,8 @@ class UploaderAgent(BaseAgent):
         title: Optional[str] = None,
         description: Optional[str] = None,
         tags: Optional[list] = None,
-        privacy_status: str = "public"
+        privacy_status: str = "public",
+        progress_callback: Optional[Callable[[int], None]] = None
     ) -> Dict:
         """
         비디오 파일을 YouTube에 업로드합니다.
@@ -42,6 +73,7 @@ class UploaderAgent(BaseAgent):
             description: 사용자가 직접 입력한 설명 (youtube_metadata가 없을 때 사용)
             tags: 사용자가 직접 입력한 태그 (youtube_metadata가 없을 때 사용)
             privacy_status: 공개 설정 (public, unlisted, private)
+            progress_callback: 업로드 청크마다 진행률(0-100)을 받는 콜백 (업로드 스레드에서 호출됨)
             
         Returns:
             {
@@ -51,7 +83,7 @@ class UploaderAgent(BaseAgent):
             }
         """
         # 1. 비디오 파일 존재 여부 확인
-        if not os.path.exists(video_path):
+        if not await asyncio.to_thread(os.path.exists, video_path):
             return {
                 "success": False,
                 "youtube_url": None,
@@ -82,28 +114,25 @@ class UploaderAgent(BaseAgent):
             print(f"[UploaderAgent] 기본 메타데이터 사용")
         
         # 3. 메타데이터 최종 검증 (Gemini를 통한 검토)
-        try:
-            validation_result = await self._validate_metadata(
-                final_title,
-                final_description,
-                final_tags
-            )
-            
-            if not validation_result["valid"]:
-                print(f"[UploaderAgent] 메타데이터 검증 실패: {validation_result['feedback']}")
-                # 검증 실패 시에도 업로드는 진행 (경고만 표시)
-        except Exception as e:
-            print(f"[UploaderAgent] 메타데이터 검증 중 오류 발생 (업로드는 계속 진행): {str(e)}")
+        # 검증 결과는 경고 로그에만 쓰이므로 업로드를 기다리게 하지 않고 백그라운드에서 실행
+        validation_task = asyncio.create_task(
+            self._validate_metadata(final_title, final_description, final_tags)
+        )
+        self._background_tasks.add(validation_task)
+        validation_task.add_done_callback(self._log_validation_result)
         
         # 4. YouTube 업로드 실행
         try:
             print(f"[UploaderAgent] YouTube 업로드 시작: {video_path}")
-            youtube_url = upload_youtube_shorts(
+            # 블로킹 업로드(HTTP 전송, 재시도 대기)는 워커 스레드에서 실행하여 이벤트 루프를 막지 않음
+            youtube_url = await asyncio.to_thread(
+                upload_youtube_shorts,
                 file_path=video_path,
                 title=final_title,
                 description=final_description,
                 tags=final_tags,
-                privacy_status=privacy_status
+                privacy_status=privacy_status,
+                progress_callback=progress_callback
             )
             
             return {
@@ -122,7 +151,7 @@ class UploaderAgent(BaseAgent):
         self,
         title: str,
         description: str,
-        tags: list
+        tags: Optional[list]
     ) -> Dict:
         """
         Gemini를 사용하여 YouTube 메타데이터를 검증합니다.
@@ -130,7 +159,7 @@ class UploaderAgent(BaseAgent):
         Args:
             title: 비디오 제목
             description: 비디오 설명
-            tags: 비디오 태그 리스트
+            tags: 비디오 태그 리스트 (제목/설명만 지정된 경우 None)
             
         Returns:
             {
@@ -139,6 +168,17 @@ class UploaderAgent(BaseAgent):
                 "suggestions": Optional[Dict]
             }
         """
+        tags = tags or []
+        cache_key = LLMCache.make_key(
+            model=self.model_name,
+            title=title,
+            description=description,
+            tags=sorted(tags)
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         prompt = f"""You are a YouTube metadata validator. Review the following metadata for a healing/ASMR video and provide feedback.
 
 TITLE: {title}
@@ -166,14 +206,15 @@ Respond in JSON format:
             response_text = await self._generate_content(prompt, response_mime_type="application/json")
             
             # JSON 파싱
-            import json
-            result = json.loads(response_text)
+            result = orjson.loads(response_text)
             
-            return {
+            validation = {
                 "valid": result.get("valid", True),
                 "feedback": result.get("feedback", ""),
                 "suggestions": result.get("suggestions")
             }
+            self.cache.set(cache_key, validation)
+            return validation
         except Exception as e:
             # 검증 실패 시 기본값 반환 (업로드는 계속 진행)
             return {
@@ -3,10 +3,10 @@ UploaderAgent A2A 서버
 포트 8004에서 실행되는 독립적인 A2A 에이전트 서버
 """
 
-import uvicorn
 import os
 from typing import Dict, Any
 from ..a2a_server import A2AServerBase
+from ..a2a_config import A2AConfig
 from ..models import AgentCard, AgentSkill, Task, TaskStatus, TaskState, TransportProtocol, AgentCapabilities, YouTubeMetadata
 from .uploader import UploaderAgent
 
@@ -25,8 +25,6 @@ async def handle_uploader_task(task: Task) -> TaskStatus:
     Returns:
         TaskStatus 객체
     """
-    import asyncio
-    
     try:
         # Task 입력에서 데이터 추출
         task_input = task.input or {}
@@ -47,7 +45,7 @@ async def handle_uploader_task(task: Task) -> TaskStatus:
         # YouTubeMetadata 객체 생성 (있는 경우)
         youtube_metadata_obj = None
         if youtube_metadata:
-            youtube_metadata_obj = YouTubeMetadata(**youtube_metadata)
+            youtube_metadata_obj = YouTubeMetadata.model_validate(youtube_metadata)
         
         # UploaderAgent의 process 메서드 호출
         # 이제 async 함수이므로 직접 await 가능
@@ -118,26 +116,32 @@ def create_uploader_agent_card(base_url: str = "http://localhost:8004") -> Agent
 def create_server(base_url: str = "http://localhost:8004") -> A2AServerBase:
     """UploaderAgent A2A 서버 생성"""
     agent_card = create_uploader_agent_card(base_url)
-    return A2AServerBase(agent_card, handle_uploader_task)
+    server = A2AServerBase(agent_card, handle_uploader_task)
+    
+    @server.get_app().on_event("startup")
+    async def warmup_gemini():
+        """첫 Task 전에 Gemini 연결 예열 (WARMUP_TIMEOUT초 이상 기동을 지연시키지 않음)"""
+        await uploader_agent.warmup_with_timeout()
+    
+    return server
 
 
-if __name__ == "__main__":
-    """서버 실행"""
-    import sys
-    
-    # 환경 변수에서 포트 및 URL 읽기
-    port = int(os.getenv("UPLOADER_PORT", "8004"))
-    host = os.getenv("UPLOADER_HOST", "0.0.0.0")
+def run(host: str = "0.0.0.0", port: int = 8004):
+    """서버 실행 (독립 실행 및 start_all_agents 슈퍼바이저에서 사용)"""
     base_url = os.getenv("UPLOADER_URL", f"http://localhost:{port}")
     
     # 서버 생성
     server = create_server(base_url)
-    app = server.get_app()
     
     print(f"UploaderAgent A2A 서버 시작: {base_url}")
-    print(f"AgentCard: http://{host}:{port}/a2a/agent_card")
-    print(f"Tasks: http://{host}:{port}/a2a/tasks")
-    
-    # 서버 실행
-    uvicorn.run(app, host=host, port=port)
+    # UPLOADER_UDS(또는 A2A_UDS_DIR)가 설정되어 있으면 TCP 대신 Unix 도메인 소켓에서 실행
+    server.serve(host, port, uds_path=A2AConfig.get_uds_path("uploader"))
+
 
+if __name__ == "__main__":
+    """서버 실행"""
+    # 환경 변수에서 포트 및 호스트 읽기
+    port = int(os.getenv("UPLOADER_PORT", "8004"))
+    host = os.getenv("UPLOADER_HOST", "0.0.0.0")
+    
+    run(host, port)
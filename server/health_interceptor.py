@@ -0,0 +1,53 @@
+"""
+헬스 체크 ASGI 인터셉터
+/health 요청을 FastAPI 라우팅/미들웨어 스택을 거치지 않고 바로 응답합니다.
+에이전트 상태 폴링처럼 자주 호출되는 요청의 오버헤드를 줄이기 위해 사용합니다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# 인터셉트할 경로
+HEALTH_PATHS = frozenset({"/health", "/healthz"})
+
+# 미리 만들어 둔 응답 (요청마다 직렬화하지 않음)
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+_NOT_ALLOWED_HEADERS = [
+    (b"allow", b"GET, HEAD"),
+    (b"content-length", b"0"),
+]
+
+
+class HealthCheckInterceptor:
+    """
+    헬스 체크 경로만 직접 처리하고 나머지 요청은 감싼 앱으로 그대로 전달하는 ASGI 앱
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Args:
+            app: 감쌀 ASGI 앱 (FastAPI 인스턴스)
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in HEALTH_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 405, "headers": _NOT_ALLOWED_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+        await send({"type": "http.response.body", "body": _HEALTH_BODY if method == "GET" else b""})
@@ -4,37 +4,102 @@ A2A 워크플로우를 실행하고 비디오 처리를 BackgroundTask로 처리
 """
 
 import os
-import json
 import asyncio
-import time
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import orjson
+import re
 import subprocess
+import time
 import sys
-import socket
-import urllib.request
+from collections import deque
 from pathlib import Path
-from fastapi import FastAPI, BackgroundTasks, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+from fastapi import FastAPI, BackgroundTasks, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from starlette.datastructures import Headers
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional, List, Dict, Any, Set, Tuple
 from dotenv import load_dotenv
 
+# brotli는 선택 의존성 (설치되어 있으면 메인 페이지를 brotli로도 사전 압축)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 from .orchestrator import Orchestrator
 from .tools import generate_veo_video_for_duration
 from .models import WorkflowResponse
 from .agents.uploader import UploaderAgent
 from .a2a_config import A2AConfig
+from .a2a_client import close_shared_client, get_shared_client, get_uds_client
+from .health_interceptor import HealthCheckInterceptor
 
 # .env 파일 로드
 load_dotenv()
 
 # FastAPI 앱 생성
-app = FastAPI(
+fastapi_app = FastAPI(
     title="A2A Healing Shorts Factory",
     description="Autonomous Agent-to-Agent system for generating healing shorts",
     version="1.0.0"
 )
 
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """
+    Accept-Encoding 헤더를 {인코딩: q값}으로 파싱 (예: "gzip;q=0, br" -> {"gzip": 0.0, "br": 1.0})
+    q값이 잘못된 항목은 무시합니다.
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = -1.0
+        if 0.0 <= q <= 1.0:
+            accepted[coding] = q
+    return accepted
+
+
+def _encoding_q(accepted: Dict[str, float], coding: str) -> float:
+    """파싱된 Accept-Encoding에서 인코딩의 q값 반환 (명시되지 않았으면 "*"의 값)"""
+    return accepted.get(coding, accepted.get("*", 0.0))
+
+
+class QValueGZipMiddleware(GZipMiddleware):
+    """
+    Accept-Encoding의 q값을 존중하는 GZipMiddleware
+    기본 GZipMiddleware는 "gzip" 문자열 포함 여부만 보므로 "gzip;q=0"에도 압축함
+    """
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            if "gzip" in accept_encoding and _encoding_q(_accepted_encodings(accept_encoding), "gzip") <= 0:
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+
+# HTML/JS/CSS/JSON 응답 gzip 압축 (작은 응답과 비디오 등 이미 압축된 형식은 제외)
+fastapi_app.add_middleware(QValueGZipMiddleware, minimum_size=512)
+
+# 외부에 노출하는 ASGI 앱: /health는 FastAPI 스택을 거치지 않고 인터셉터가 바로 응답
+app = HealthCheckInterceptor(fastapi_app)
+
 # 정적 파일 서빙 (HTML, CSS, JS)
 # 프로젝트 루트 기준으로 디렉토리 경로 설정
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -45,20 +110,102 @@ output_dir = os.path.join(project_root, "output")
 os.makedirs(static_dir, exist_ok=True)
 os.makedirs(output_dir, exist_ok=True)
 
+# 메인 페이지가 참조하는 정적 파일 (내용 해시를 ?v= 쿼리로 붙여 배포 시 브라우저 캐시가 바로 무효화되도록 함)
+VERSIONED_STATIC_FILES = ("script.js", "style.css")
+
+
+def _versioned_html(html: bytes) -> bytes:
+    """index.html의 정적 파일 참조에 내용 해시 기반 버전 쿼리(?v=)를 붙임"""
+    for name in VERSIONED_STATIC_FILES:
+        file_path = os.path.join(static_dir, name)
+        if not os.path.exists(file_path):
+            continue
+        version = hashlib.md5(Path(file_path).read_bytes()).hexdigest()[:12]
+        html = html.replace(f'"/static/{name}"'.encode(), f'"/static/{name}?v={version}"'.encode())
+    return html
+
+
+# 메인 페이지 HTML: 요청마다 파일을 열지 않도록 임포트 시 한 번만 읽어 bytes로 보관
+_index_html_path = os.path.join(static_dir, "index.html")
+_ROOT_HTML_BYTES: Optional[bytes] = _versioned_html(Path(_index_html_path).read_bytes()) if os.path.exists(_index_html_path) else None
+
+# 메인 페이지 표현별 (본문, ETag): Content-Encoding -> 값, 압축본은 선호 순서대로
+# 요청마다 GZipMiddleware가 다시 압축하지 않고 최고 압축률로 한 번만 만들어 둔 것을 그대로 전송
+# 강한 ETag는 표현마다 달라야 하므로 압축본에는 인코딩 접미사를 붙임 (예: "<md5>-br")
+_ROOT_HTML_ENCODED: Dict[str, Tuple[bytes, str]] = {}
+_ROOT_HTML_IDENTITY: Optional[Tuple[bytes, str]] = None
+if _ROOT_HTML_BYTES is not None:
+    _root_html_md5 = hashlib.md5(_ROOT_HTML_BYTES).hexdigest()
+    _ROOT_HTML_IDENTITY = (_ROOT_HTML_BYTES, f'"{_root_html_md5}"')
+    if brotli is not None:
+        _ROOT_HTML_ENCODED["br"] = (brotli.compress(_ROOT_HTML_BYTES, quality=11), f'"{_root_html_md5}-br"')
+    _ROOT_HTML_ENCODED["gzip"] = (gzip.compress(_ROOT_HTML_BYTES, compresslevel=9), f'"{_root_html_md5}-gzip"')
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 목록(쉼표 구분, W/ 약한 비교 포함, "*")에 etag가 있는지 확인"""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+# 브라우저 캐시 유지 시간: 메인 페이지는 짧게
+# 정적 파일(JS/CSS)은 버전 쿼리(?v=)가 붙은 요청만 길게 캐시하고, 그 외에는 매번 ETag로 재검증
+ROOT_CACHE_CONTROL = "public, max-age=60"
+STATIC_CACHE_CONTROL = "no-cache"
+STATIC_VERSIONED_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 생성된 영상은 같은 파일명이 재사용되거나 인코딩 중인 파일이 노출될 수 있으므로
+# 캐시는 허용하되 매번 ETag로 재검증 (변경이 없으면 304로 본문 전송 생략)
+VIDEO_CACHE_CONTROL = os.getenv("VIDEO_CACHE_CONTROL", "no-cache")
+# 영상 전송 청크 크기 (FileResponse 기본값 64KB는 수십 MB 영상에서 스레드 읽기/전송 왕복이 너무 많음)
+VIDEO_CHUNK_SIZE = int(os.getenv("VIDEO_CHUNK_SIZE", str(1024 * 1024)))
+
+
+class CachedStaticFiles(StaticFiles):
+    """Cache-Control 헤더를 붙여 주는 StaticFiles (ETag/304, Range 처리는 StaticFiles 기본 동작 사용)"""
+    
+    def __init__(self, *args, cache_control: str = STATIC_CACHE_CONTROL,
+                 versioned_cache_control: Optional[str] = None, chunk_size: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+        self.versioned_cache_control = versioned_cache_control
+        self.chunk_size = chunk_size
+    
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        cache_control = self.cache_control
+        query_string = scope.get("query_string", b"")
+        if self.versioned_cache_control and (query_string.startswith(b"v=") or b"&v=" in query_string):
+            cache_control = self.versioned_cache_control
+        response.headers.setdefault("cache-control", cache_control)
+        if self.chunk_size and isinstance(response, FileResponse):
+            response.chunk_size = self.chunk_size
+        return response
+
+
 # 정적 파일 마운트
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+fastapi_app.mount(
+    "/static",
+    CachedStaticFiles(directory=static_dir, versioned_cache_control=STATIC_VERSIONED_CACHE_CONTROL),
+    name="static"
+)
 
-# 비디오 파일 서빙 (output 디렉토리)
-# 디렉토리가 존재하는 경우에만 마운트
-if os.path.exists(output_dir):
-    try:
-        app.mount("/videos", StaticFiles(directory=output_dir), name="videos")
-        print(f"[Server] 비디오 파일 서빙 활성화: {output_dir}")
-        print(f"[Server] 비디오 파일 접근 경로: /videos/<filename>.mp4")
-    except Exception as e:
-        print(f"[Server] 경고: 비디오 파일 서빙 마운트 실패: {e}")
-else:
-    print(f"[Server] 경고: output 디렉토리가 없습니다: {output_dir}")
+# 비디오 파일 서빙 (output 디렉토리, 위에서 makedirs로 생성되어 있음)
+try:
+    fastapi_app.mount(
+        "/videos",
+        CachedStaticFiles(directory=output_dir, cache_control=VIDEO_CACHE_CONTROL, chunk_size=VIDEO_CHUNK_SIZE),
+        name="videos"
+    )
+    print(f"[Server] 비디오 파일 서빙 활성화: {output_dir}")
+    print(f"[Server] 비디오 파일 접근 경로: /videos/<filename>.mp4")
+except Exception as e:
+    print(f"[Server] 경고: 비디오 파일 서빙 마운트 실패: {e}")
 
 # 오케스트레이터 및 에이전트 인스턴스
 orchestrator = Orchestrator()
@@ -67,171 +214,477 @@ uploader_agent = UploaderAgent()
 # 전역 변수: 실행 중인 에이전트 프로세스 관리
 agent_processes: Dict[str, subprocess.Popen] = {}
 
+# WebSocket 브로드캐스트 시 클라이언트당 전송 제한 시간 (초). 초과하면 느린 클라이언트로 보고 연결 제거
+WS_SEND_TIMEOUT = 2.0
+# 클라이언트별 전송 대기열 크기. 가득 차면 느린 클라이언트로 보고 연결 제거
+WS_QUEUE_SIZE = 256
+# 동시에 유지하는 WebSocket 연결 수 상한 (초과한 새 연결은 받지 않음, 같은 페이지의 재연결은 교체이므로 허용)
+WS_MAX_CONNECTIONS = int(os.getenv("WS_MAX_CONNECTIONS", "100"))
+# 같은 클라이언트 ID로 새 연결이 들어와 교체된 연결의 종료 코드 (클라이언트는 이 코드면 재연결하지 않음)
+WS_REPLACED_CLOSE_CODE = 4000
+# 전송할 메시지가 없을 때 보내는 애플리케이션 레벨 heartbeat 간격 (초)
+WS_HEARTBEAT_INTERVAL = 15.0
+_WS_PING_PAYLOAD = orjson.dumps({"type": "ping"})
+# Uvicorn WebSocket 프로토콜 ping 간격/응답 대기 시간 (초)
+WS_PING_INTERVAL = 20.0
+WS_PING_TIMEOUT = 20.0
+# Uvicorn WebSocket 설정: permessage-deflate 압축 (한글 프롬프트/피드백이 담긴 JSON은 압축률이 높음)
+# 및 클라이언트 수신 메시지 최대 크기 (대시보드는 큰 메시지를 보내지 않음)
+WS_PER_MESSAGE_DEFLATE = True
+WS_MAX_SIZE = 64 * 1024
+# 상태 업데이트 병합 창 (초): 이 시간 안에 온 진행 상태는 하나의 batch 프레임으로 묶고,
+# 같은 (type, step)의 업데이트가 여러 번 오면 마지막 것만 전송
+WS_COALESCE_WINDOW = 0.075
+# 병합하지 않고 즉시 전송하는 최종 상태
+WS_TERMINAL_STATUSES = frozenset({"completed", "error", "upload_complete", "upload_failed"})
+
+# Veo 생성/FFmpeg 병합 등 수 분씩 걸리는 영상 작업 전용 스레드 풀
+# (이벤트 루프와 기본 스레드 풀을 막지 않도록 분리)
+_VIDEO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("VIDEO_WORKERS", "2")),
+    thread_name_prefix="video"
+)
+
+
+async def _run_video_job(func, *args, **kwargs):
+    """블로킹 영상 작업을 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_VIDEO_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
 # WebSocket 연결 관리
 class ConnectionManager:
+    """
+    WebSocket 연결 관리
+    연결마다 크기가 제한된 전송 대기열과 전용 writer Task를 두어,
+    느린 클라이언트가 브로드캐스트나 다른 클라이언트를 지연시키지 않도록 합니다.
+    """
+    
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # 연결 -> 전송 대기열
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        # 연결 -> writer Task
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # 클라이언트 ID <-> 연결 (같은 페이지의 재연결 시 이전 연결을 교체)
+        self._clients: Dict[str, WebSocket] = {}
+        self._client_ids: Dict[WebSocket, str] = {}
+        # 병합 대기 중인 상태 메시지 (type -> 가장 최근 메시지)
+        self._pending: Dict[Tuple[str, Optional[str]], dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # 진행 중인 연결 종료 Task (완료 전 GC 방지용 참조)
+        self._closing: Set[asyncio.Task] = set()
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, client_id: Optional[str] = None) -> bool:
+        """
+        연결 수락 및 등록
+        
+        Returns:
+            수락 여부 (연결 수 상한을 넘으면 거절하고 False)
+        """
+        if len(self.active_connections) >= WS_MAX_CONNECTIONS and client_id not in self._clients:
+            print(f"[WebSocket] 연결 거절 (동시 연결 {WS_MAX_CONNECTIONS}개 초과)")
+            await websocket.close(code=1013)
+            return False
+        
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        
+        if client_id:
+            # 같은 클라이언트의 이전 연결이 남아 있으면 교체 (반쯤 끊긴 연결에 계속 전송하지 않도록)
+            previous = self._clients.get(client_id)
+            self._clients[client_id] = websocket
+            self._client_ids[websocket] = client_id
+            if previous is not None and previous is not websocket:
+                self._evict_later(previous, code=WS_REPLACED_CLOSE_CODE)
+        return True
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        client_id = self._client_ids.pop(websocket, None)
+        if client_id is not None and self._clients.get(client_id) is websocket:
+            del self._clients[client_id]
+    
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """대기열의 메시지를 순서대로 전송 (연결당 하나)"""
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=WS_HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    # 긴 영상 생성 중에도 프록시/브라우저가 연결을 끊지 않도록 heartbeat 전송
+                    payload = _WS_PING_PAYLOAD
+                await asyncio.wait_for(websocket.send_bytes(payload), timeout=WS_SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            print(f"[WebSocket] 느린 클라이언트 제거 (전송 {WS_SEND_TIMEOUT}초 초과)")
+            await self._evict(websocket)
+        except (WebSocketDisconnect, ConnectionError, OSError, RuntimeError) as e:
+            print(f"[WebSocket] 연결 끊김 감지 및 제거: {type(e).__name__}")
+            self.disconnect(websocket)
+        except Exception as e:
+            print(f"[WebSocket] 전송 오류: {type(e).__name__}: {str(e)}")
+            self.disconnect(websocket)
+    
+    async def _evict(self, websocket: WebSocket, code: int = 1013):
+        """느린(또는 교체된) 클라이언트 연결을 제거하고 닫기"""
+        self.disconnect(websocket)
+        try:
+            await asyncio.wait_for(websocket.close(code=code), timeout=WS_SEND_TIMEOUT)
+        except Exception:
+            pass  # 이미 끊어진 경우 무시
+    
+    def _evict_later(self, websocket: WebSocket, code: int = 1013):
+        """
+        연결을 즉시 목록에서 제거하고, 닫기(close 프레임 전송)는 백그라운드로 진행
+        (같은 연결에 대한 후속 브로드캐스트가 다시 제거를 시도하지 않도록 제거는 동기적으로 처리)
+        """
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._evict(websocket, code=code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    def _enqueue(self, websocket: WebSocket, payload: bytes):
+        """전송 대기열에 추가 (가득 차면 연결 제거)"""
+        queue = self.active_connections.get(websocket)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            print(f"[WebSocket] 느린 클라이언트 제거 (대기열 {WS_QUEUE_SIZE}개 초과)")
+            self._evict_later(websocket)
     
     async def send_personal_message(self, message: dict, websocket: WebSocket):
-        await websocket.send_json(message)
+        self._enqueue(websocket, orjson.dumps(message))
     
     async def broadcast(self, message: dict):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except (WebSocketDisconnect, ConnectionError, OSError) as e:
-                # 끊어진 연결은 제거 목록에 추가
-                disconnected.append(connection)
-                print(f"[WebSocket] 연결 끊김 감지 및 제거: {type(e).__name__}")
-            except Exception as e:
-                # 기타 예외는 로그만 남기고 계속 진행
-                print(f"[WebSocket] 브로드캐스트 오류: {type(e).__name__}: {str(e)}")
-                disconnected.append(connection)
+        # 보고 있는 클라이언트가 없으면 직렬화도 하지 않음 (MCP/API만으로 파이프라인을 돌리는 경우)
+        if not self.active_connections:
+            return
+        # 메시지는 한 번만 직렬화하고 각 연결의 대기열에 넣음 (전송은 writer Task가 담당)
+        payload = orjson.dumps(message)
+        # 대기열이 가득 찬 연결은 순회 중 제거될 수 있으므로 스냅샷을 순회
+        # (등록/해제는 await 없이 이벤트 루프 안에서만 일어나므로 별도 락은 필요 없음)
+        for connection in tuple(self.active_connections):
+            self._enqueue(connection, payload)
+    
+    async def broadcast_status(self, message: dict):
+        """
+        진행 상태 메시지 브로드캐스트
+        짧은 시간 안의 연속 업데이트는 (type, step)별로 마지막 것만 남겨 하나의 batch 프레임으로 전송합니다.
+        최종 상태는 대기 중인 메시지와 함께 즉시 전송하여 순서를 유지합니다.
+        """
+        if message.get("status") in WS_TERMINAL_STATUSES:
+            await self._flush_pending(message)
+            return
         
-        # 끊어진 연결 제거
-        for conn in disconnected:
-            try:
-                self.active_connections.remove(conn)
-            except ValueError:
-                pass  # 이미 제거된 경우 무시
+        self._pending[(message["type"], message.get("step"))] = message
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(WS_COALESCE_WINDOW))
+    
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self._flush_pending()
+    
+    async def _flush_pending(self, final_message: Optional[dict] = None):
+        """병합 대기 중인 상태 메시지 (+ 최종 상태 메시지)를 한 프레임으로 전송"""
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+            self._flush_task = None
+        updates = list(self._pending.values())
+        self._pending = {}
+        if final_message is not None:
+            updates.append(final_message)
+        
+        if len(updates) == 1:
+            await self.broadcast(updates[0])
+        elif updates:
+            await self.broadcast({"type": "batch", "updates": updates})
 
 manager = ConnectionManager()
 
 
-def check_agent_health(url: str, timeout: float = 1.0) -> bool:
-    """에이전트 서버 헬스 체크"""
+# 에이전트 헬스 체크 결과 캐시 (url -> 마지막 성공 시각)
+AGENT_HEALTH_TTL = 5.0
+_health_cache: Dict[str, float] = {}
+
+
+async def check_agent_health(url: str, timeout: float = 1.0) -> bool:
+    """
+    에이전트 서버 헬스 체크
+    최근 AGENT_HEALTH_TTL초 이내에 성공한 적이 있으면 요청 없이 True를 반환합니다.
+    (실패 결과는 캐시하지 않으므로 시작 대기 중인 서버는 매번 다시 확인)
+    """
+    checked_at = _health_cache.get(url)
+    if checked_at is not None and time.monotonic() - checked_at < AGENT_HEALTH_TTL:
+        return True
+    
     try:
-        response = urllib.request.urlopen(f"{url}/health", timeout=timeout)
-        return response.getcode() == 200
-    except:
-        return False
+        # 공유 httpx 클라이언트의 keep-alive 연결 재사용 (이벤트 루프를 막지 않음)
+        # {AGENT}_UDS로 Unix 도메인 소켓에서만 수신하는 에이전트는 해당 소켓으로 확인
+        uds_path = _AGENT_UDS_PATHS.get(url)
+        client = get_uds_client(uds_path) if uds_path else get_shared_client()
+        response = await client.get(f"{url}/health", timeout=timeout)
+        healthy = response.status_code == 200
+    except Exception:
+        healthy = False
+    
+    if healthy:
+        _health_cache[url] = time.monotonic()
+    else:
+        _health_cache.pop(url, None)
+    return healthy
 
 
-def check_port_in_use(port: int) -> bool:
-    """포트가 사용 중인지 확인"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('127.0.0.1', port)) == 0
+def invalidate_agent_health(*urls: str):
+    """
+    캐시된 헬스 체크 결과 제거
+    에이전트 호출이 실패했을 때 호출하여 다음 요청에서 바로 다시 확인하도록 합니다.
+    """
+    for url in urls:
+        _health_cache.pop(url, None)
 
 
-async def ensure_agent_servers_running() -> Dict[str, bool]:
+# 자동 시작 대상 에이전트: (이름, 모듈, 포트, URL) - 프로세스 수명 동안 변하지 않으므로 임포트 시 한 번만 구성
+AGENT_CONFIGS: Tuple[Tuple[str, str, int, str], ...] = (
+    ("planner", "server.agents.planner_server", A2AConfig.DEFAULT_PLANNER_PORT, A2AConfig.get_planner_url()),
+    ("reviewer", "server.agents.reviewer_server", A2AConfig.DEFAULT_REVIEWER_PORT, A2AConfig.get_reviewer_url()),
+    ("producer", "server.agents.producer_server", A2AConfig.DEFAULT_PRODUCER_PORT, A2AConfig.get_producer_url()),
+    ("uploader", "server.agents.uploader_server", A2AConfig.DEFAULT_UPLOADER_PORT, A2AConfig.get_uploader_url()),
+)
+# 에이전트 URL -> Unix 도메인 소켓 경로 (설정된 에이전트만)
+_AGENT_UDS_PATHS: Dict[str, str] = {
+    url: A2AConfig.get_uds_path(agent_name)
+    for agent_name, _, _, url in AGENT_CONFIGS
+    if A2AConfig.get_uds_path(agent_name)
+}
+# 에이전트 프로세스 작업 디렉토리 (server/main.py -> server -> shorts_factory)
+AGENT_PROJECT_ROOT = Path(__file__).parent.parent
+
+# 실행 중인 에이전트를 재시작하기 전까지 허용하는 연속 헬스 체크 실패 횟수 및 재확인 간격 (초)
+AGENT_RESTART_AFTER_FAILURES = 3
+AGENT_HEALTH_RETRY_INTERVAL = 0.2
+# 에이전트별 연속 헬스 체크 실패 횟수
+_health_fail_count: Dict[str, int] = {}
+
+# 에이전트 시작 후 헬스 체크 폴링 간격 (합계 약 10초)
+AGENT_STARTUP_POLL_INTERVALS = (0.05, 0.05, 0.1, 0.1, 0.2, 0.2, 0.5, 0.5, 1.0, 1.0, 2.0, 2.0, 2.3)
+
+# 에이전트 서버 출력 표시 여부 (꺼져 있으면 출력을 DEVNULL로 버려 파이프가 가득 차 멈추는 일을 방지)
+AGENT_VERBOSE = os.getenv("AGENT_VERBOSE", "").lower() in ("1", "true", "yes")
+# 에이전트 출력 로그 파일 디렉토리 (AGENT_VERBOSE가 꺼져 있을 때 출력을 버리지 않고 {에이전트}.log에 기록)
+AGENT_LOG_DIR = os.getenv("AGENT_LOG_DIR")
+# 시작 실패 시 에러 줄을 찾기 위해 읽는 로그 파일 끝부분 크기 (바이트)
+AGENT_LOG_READ_BYTES = 8192
+# 에이전트별 최근 출력 (AGENT_VERBOSE일 때만 수집, 시작 실패 원인 표시용)
+AGENT_LOG_TAIL = 50
+_agent_log_tails: Dict[str, "deque[str]"] = {}
+_agent_log_drains: Dict[str, "asyncio.Future[None]"] = {}
+# 에이전트 출력에서 첫 에러 줄을 찾는 패턴 (FutureWarning 줄은 제외, 한 번의 탐색으로 처리)
+_AGENT_ERROR_LINE_PATTERN = re.compile(r"^(?!.*FutureWarning).*(?:Error|Exception|Traceback|Failed).*$", re.MULTILINE)
+
+
+def _drain_agent_output(agent_name: str, stream):
+    """에이전트 출력을 계속 읽어 콘솔로 전달 (파이프가 가득 차지 않도록, 스레드에서 실행)"""
+    tail = _agent_log_tails.setdefault(agent_name, deque(maxlen=AGENT_LOG_TAIL))
+    tail.clear()
+    for raw_line in stream:
+        line = raw_line.decode(errors="replace").rstrip()
+        if line:
+            tail.append(line)
+            print(f"  [{agent_name.upper()}] {line}")
+
+
+def _read_agent_log_tail(log_path: Path) -> str:
+    """에이전트 로그 파일의 끝부분 읽기 (시작 실패 원인 표시용)"""
+    try:
+        with open(log_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - AGENT_LOG_READ_BYTES))
+            return f.read().decode(errors="replace")
+    except OSError:
+        return ""
+
+
+async def _stop_agent_process(process: subprocess.Popen, timeout: float) -> bool:
     """
-    필요한 에이전트 서버들이 실행 중인지 확인하고, 
-    실행 중이 아니면 자동으로 시작합니다.
+    에이전트 프로세스 종료 (timeout 내에 종료되지 않으면 강제 종료)
+    대기는 스레드에서 수행하여 이벤트 루프를 막지 않습니다.
     
     Returns:
-        각 에이전트의 시작 성공 여부
+        정상 종료되었으면 True, 강제 종료했으면 False
     """
-    agent_configs = [
-        ("planner", "server.agents.planner_server", A2AConfig.DEFAULT_PLANNER_PORT, A2AConfig.get_planner_url()),
-        ("reviewer", "server.agents.reviewer_server", A2AConfig.DEFAULT_REVIEWER_PORT, A2AConfig.get_reviewer_url()),
-        ("producer", "server.agents.producer_server", A2AConfig.DEFAULT_PRODUCER_PORT, A2AConfig.get_producer_url()),
-        ("uploader", "server.agents.uploader_server", A2AConfig.DEFAULT_UPLOADER_PORT, A2AConfig.get_uploader_url()),
-    ]
-    
-    results = {}
-    # server/main.py -> server -> shorts_factory
-    project_root = Path(__file__).parent.parent
-    
-    for agent_name, module_name, port, url in agent_configs:
-        # 이미 실행 중인 프로세스가 있고 살아있는지 확인
-        if agent_name in agent_processes:
-            process = agent_processes[agent_name]
-            if process.poll() is None:  # 프로세스가 실행 중
-                # 헬스 체크로 실제로 응답하는지 확인
-                if check_agent_health(url, timeout=1.0):
-                    results[agent_name] = True
-                    continue
-                else:
-                    # 프로세스는 있지만 응답하지 않음 - 종료하고 재시작
-                    try:
-                        process.terminate()
-                        process.wait(timeout=2)
-                    except:
-                        process.kill()
-                    del agent_processes[agent_name]
-        
-        # 포트가 사용 중인지 확인 (다른 프로세스가 실행 중일 수 있음)
-        if check_port_in_use(port):
-            # 헬스 체크로 실제로 에이전트 서버인지 확인
-            if check_agent_health(url, timeout=1.0):
-                results[agent_name] = True
-                continue
+    try:
+        process.terminate()
+        await asyncio.to_thread(process.wait, timeout)
+        return True
+    except ProcessLookupError:
+        return True  # 이미 종료됨
+    except subprocess.TimeoutExpired:
+        try:
+            process.kill()
+            await asyncio.to_thread(process.wait, 1)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            pass
+        return False
+
+
+async def _ensure_agent_running(
+    agent_name: str,
+    module_name: str,
+    port: int,
+    url: str,
+    project_root: Path
+) -> bool:
+    """
+    에이전트 하나가 실행 중인지 확인하고, 아니면 시작합니다.
+    
+    Returns:
+        시작 성공 여부
+    """
+    healthy = await check_agent_health(url, timeout=1.0)
+    
+    # 이미 실행 중인 프로세스가 있고 살아있는지 확인
+    if agent_name in agent_processes:
+        process = agent_processes[agent_name]
+        if process.poll() is None:  # 프로세스가 실행 중
+            # 헬스 체크로 실제로 응답하는지 확인
+            # 일시적인 실패로 재시작하지 않도록 연속 실패가 AGENT_RESTART_AFTER_FAILURES회 쌓일 때까지 재확인
+            while not healthy:
+                failures = _health_fail_count.get(agent_name, 0) + 1
+                _health_fail_count[agent_name] = failures
+                if failures >= AGENT_RESTART_AFTER_FAILURES:
+                    break
+                await asyncio.sleep(AGENT_HEALTH_RETRY_INTERVAL)
+                healthy = await check_agent_health(url, timeout=1.0)
+            
+            if healthy:
+                _health_fail_count.pop(agent_name, None)
+                return True
+            
+            # 프로세스는 있지만 계속 응답하지 않음 - 종료하고 재시작
+            print(f"  [RESTART] {agent_name.upper()}Agent 헬스 체크 {AGENT_RESTART_AFTER_FAILURES}회 연속 실패, 재시작합니다")
+            _health_fail_count.pop(agent_name, None)
+            await _stop_agent_process(process, timeout=2)
+            del agent_processes[agent_name]
+    
+    # 다른 프로세스가 이미 에이전트 서버를 실행 중일 수 있음
+    # (헬스 체크 성공이 곧 포트가 열려 있다는 뜻이므로 별도 포트 검사는 하지 않음)
+    if healthy:
+        return True
+    
+    # 서버 시작
+    try:
+        print(f"  [START] {agent_name.upper()}Agent 시작 중... (포트: {port})")
+        # 출력 처리: AGENT_VERBOSE면 파이프로 읽어 콘솔에 표시, AGENT_LOG_DIR이면 파일에 직접 기록, 아니면 버림
+        # (읽지 않는 파이프는 가득 차면 에이전트가 멈추므로 사용하지 않음)
+        log_path: Optional[Path] = None
+        if AGENT_VERBOSE:
+            stdout = subprocess.PIPE
+        elif AGENT_LOG_DIR:
+            log_path = Path(AGENT_LOG_DIR) / f"{agent_name}.log"
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            stdout = open(log_path, "wb")
+        else:
+            stdout = subprocess.DEVNULL
         
-        # 서버 시작
         try:
-            print(f"  [START] {agent_name.upper()}Agent 시작 중... (포트: {port})")
-            process = subprocess.Popen(
+            # asyncio 서브프로세스는 Windows의 SelectorEventLoop(uvicorn --reload/--workers)에서 지원되지 않으므로
+            # subprocess.Popen을 스레드에서 실행 (프로세스 생성 동안 이벤트 루프를 막지 않음)
+            process = await asyncio.to_thread(
+                subprocess.Popen,
                 [sys.executable, "-m", module_name],
                 cwd=str(project_root),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                stdout=stdout,
+                stderr=subprocess.DEVNULL if stdout == subprocess.DEVNULL else subprocess.STDOUT
             )
+        finally:
+            # 로그 파일은 자식 프로세스가 물려받았으므로 부모 쪽 핸들은 바로 닫음
+            if log_path is not None:
+                stdout.close()
+        
+        agent_processes[agent_name] = process
+        if AGENT_VERBOSE:
+            _agent_log_drains[agent_name] = asyncio.ensure_future(
+                asyncio.to_thread(_drain_agent_output, agent_name, process.stdout)
+            )
+        # 새로 시작한 서버는 이전 헬스 체크 결과를 사용하지 않음
+        _health_cache.pop(url, None)
+        
+        # 서버 시작 대기 (최대 약 10초, 로컬 서버는 보통 금방 뜨므로 짧은 간격부터 점점 늘림)
+        for wait_interval in AGENT_STARTUP_POLL_INTERVALS:
+            await asyncio.sleep(wait_interval)
             
-            agent_processes[agent_name] = process
-            
-            # 서버 시작 대기 (최대 10초)
-            max_wait = 10
-            wait_interval = 0.5
-            started = False
-            
-            for attempt in range(int(max_wait / wait_interval)):
-                await asyncio.sleep(wait_interval)
-                
-                # 프로세스가 종료되었는지 확인
-                if process.poll() is not None:
-                    # 프로세스가 종료됨 - 에러 발생
-                    # 에러 메시지 읽기
+            # 프로세스가 종료되었는지 확인
+            if process.poll() is not None:
+                # 프로세스가 종료됨 - 에러 발생
+                if log_path is not None:
+                    output = await asyncio.to_thread(_read_agent_log_tail, log_path)
+                elif AGENT_VERBOSE:
+                    # 수집된 출력에서 에러 메시지 찾기
                     try:
-                        stdout, _ = process.communicate(timeout=1)
-                        error_lines = [line for line in stdout.split('\n') 
-                                     if line.strip() and 
-                                     ('Error' in line or 'Exception' in line or 'Traceback' in line or 'Failed' in line)
-                                     and 'FutureWarning' not in line]
-                        if error_lines:
-                            print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패: {error_lines[0][:100]}")
-                        else:
-                            print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패 (프로세스가 종료됨)")
-                    except:
-                        print(f"    ❌ {agent_name.upper()}Agent 시작 실패 (프로세스가 종료됨)")
-                    results[agent_name] = False
-                    break
+                        await asyncio.wait_for(asyncio.shield(_agent_log_drains[agent_name]), timeout=1.0)
+                    except Exception:
+                        pass
+                    output = "\n".join(_agent_log_tails.get(agent_name, ()))
+                else:
+                    print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패 (프로세스가 종료됨, AGENT_VERBOSE=1 또는 AGENT_LOG_DIR로 출력 확인)")
+                    return False
                 
-                # 헬스 체크
-                if check_agent_health(url, timeout=1.0):
-                    results[agent_name] = True
-                    started = True
-                    print(f"    [OK] {agent_name.upper()}Agent 시작 완료")
-                    break
+                error_line = _AGENT_ERROR_LINE_PATTERN.search(output)
+                if error_line:
+                    print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패: {error_line.group(0)[:100]}")
+                else:
+                    print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패 (프로세스가 종료됨)")
+                return False
             
-            if not started and process.poll() is None:
-                # 프로세스는 실행 중이지만 헬스 체크 실패
-                # 일단 성공으로 간주 (서버가 아직 완전히 시작되지 않았을 수 있음)
-                results[agent_name] = True
-                print(f"    [WAIT] {agent_name.upper()}Agent 시작 중 (헬스 체크 대기 중...)")
-            elif not started:
-                results[agent_name] = False
-                print(f"    [FAIL] {agent_name.upper()}Agent 시작 실패")
-                
-        except Exception as e:
-            print(f"    [FAIL] {agent_name.upper()}Agent 시작 중 예외 발생: {e}")
-            results[agent_name] = False
+            # 헬스 체크
+            if await check_agent_health(url, timeout=1.0):
+                print(f"    [OK] {agent_name.upper()}Agent 시작 완료")
+                return True
+        
+        # 프로세스는 실행 중이지만 헬스 체크 실패
+        # 일단 성공으로 간주 (서버가 아직 완전히 시작되지 않았을 수 있음)
+        print(f"    [WAIT] {agent_name.upper()}Agent 시작 중 (헬스 체크 대기 중...)")
+        return True
+            
+    except Exception as e:
+        print(f"    [FAIL] {agent_name.upper()}Agent 시작 중 예외 발생: {e}")
+        return False
+
+
+async def ensure_agent_servers_running() -> Dict[str, bool]:
+    """
+    필요한 에이전트 서버들이 실행 중인지 확인하고, 
+    실행 중이 아니면 자동으로 시작합니다. (네 에이전트를 동시에 처리)
+    
+    Returns:
+        각 에이전트의 시작 성공 여부
+    """
+    # 에이전트별 헬스 체크 -> 시작 -> 시작 대기를 각각 독립적으로 동시에 진행
+    # (한 에이전트의 느린 헬스 체크가 다른 에이전트의 시작을 늦추지 않음)
+    started = await asyncio.gather(*(
+        _ensure_agent_running(agent_name, module_name, port, url, AGENT_PROJECT_ROOT)
+        for agent_name, module_name, port, url in AGENT_CONFIGS
+    ))
     
+    results = {agent_name: ok for (agent_name, _, _, _), ok in zip(AGENT_CONFIGS, started)}
     return results
 
 
 class CreateShortsRequest(BaseModel):
     """비디오 생성 요청 모델"""
-    topic: str = Field(description="비디오 주제 키워드 (예: 'Rain', 'Ocean Waves')")
+    # 앞뒤 공백을 제거한 뒤 길이를 검사 (공백만 있는 주제는 빈 주제로 거절)
+    topic: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)] = Field(
+        description="비디오 주제 키워드 (예: 'Rain', 'Ocean Waves')"
+    )
     video_duration: Optional[float] = Field(
         default=30.0, 
         description="비디오 길이 (초). 8초 이하는 단일 클립, 8초 초과는 다중 클립 병합. YouTube Shorts는 15-60초 권장. 기본값: 30초",
@@ -260,7 +713,7 @@ async def process_video_pipeline_with_updates(
     try:
         # Veo 비디오 생성 시작
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "video_status",
                 "status": "generating",
                 "message": "Veo 비디오 생성 중...",
@@ -269,7 +722,9 @@ async def process_video_pipeline_with_updates(
         except Exception as e:
             print(f"[WARNING] WebSocket 브로드캐스트 실패 (무시하고 계속): {str(e)}")
         
-        veo_video_path = generate_veo_video_for_duration(
+        # 생성에 수 분이 걸리므로 스레드에서 실행 (그동안 WebSocket 전송/keepalive 계속 처리)
+        veo_video_path = await _run_video_job(
+            generate_veo_video_for_duration,
             prompt=approved_prompt,
             total_duration_seconds=int(video_duration) if video_duration else None,
             aspect_ratio="9:16",  # YouTube Shorts 세로형
@@ -277,7 +732,7 @@ async def process_video_pipeline_with_updates(
         )
         
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "video_status",
                 "status": "veo_complete",
                 "message": f"Veo 비디오 생성 완료: {veo_video_path}",
@@ -290,8 +745,7 @@ async def process_video_pipeline_with_updates(
         # Seamless loop 제거 - 원본 비디오 그대로 사용
         final_video_path = veo_video_path
         
-        # 웹에서 접근 가능하도록 파일명만 추출
-        import os
+        # 웹에서 접근 가능하도록 파일명만 추출 (한 번만 계산해 완료 메시지에 재사용)
         video_filename = os.path.basename(final_video_path)
         
         # YouTube 업로드가 요청된 경우 자동으로 업로드 진행
@@ -308,7 +762,7 @@ async def process_video_pipeline_with_updates(
                 )
             except Exception as upload_error:
                 try:
-                    await manager.broadcast({
+                    await manager.broadcast_status({
                         "type": "video_status",
                         "status": "upload_failed",
                         "message": f"YouTube 업로드 실패: {str(upload_error)}",
@@ -320,7 +774,7 @@ async def process_video_pipeline_with_updates(
                 youtube_url = None
         
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "video_status",
                 "status": "completed",
                 "message": "비디오 파이프라인 완료" + (f" (YouTube 업로드 완료: {youtube_url})" if youtube_url else ""),
@@ -342,7 +796,7 @@ async def process_video_pipeline_with_updates(
         
         # WebSocket 브로드캐스트 시도 (실패해도 무시)
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "video_status",
                 "status": "error",
                 "message": f"비디오 파이프라인 오류: {str(e)}",
@@ -352,23 +806,49 @@ async def process_video_pipeline_with_updates(
             print(f"[WARNING] WebSocket 브로드캐스트 실패: {str(broadcast_error)}")
 
 
-@app.get("/", response_class=FileResponse)
-async def root():
+@fastapi_app.get("/", response_class=HTMLResponse)
+async def root(request: Request):
     """웹 인터페이스 메인 페이지"""
-    return FileResponse(os.path.join(static_dir, "index.html"))
+    if _ROOT_HTML_BYTES is None:
+        raise HTTPException(status_code=404, detail="index.html을 찾을 수 없습니다")
+    
+    # 클라이언트가 받을 수 있는(q > 0) 사전 압축본 중 q값이 가장 높은 것 선택 (같으면 선호 순서)
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    encoding, best_q = None, 0.0
+    for candidate in _ROOT_HTML_ENCODED:
+        q = _encoding_q(accepted, candidate)
+        if q > best_q:
+            encoding, best_q = candidate, q
+    body, etag = _ROOT_HTML_ENCODED[encoding] if encoding else _ROOT_HTML_IDENTITY
+    
+    headers = {"Cache-Control": ROOT_CACHE_CONTROL, "ETag": etag, "Vary": "Accept-Encoding"}
+    # 브라우저가 가진 사본이 선택한 표현과 같으면 본문 없이 304 응답
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
 
 
-@app.websocket("/ws")
+@fastapi_app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket 엔드포인트 - 실시간 업데이트 전송"""
-    await manager.connect(websocket)
+    # 페이지 로드별 ID (?client_id=...), 재연결 시 같은 페이지의 이전 연결을 교체하는 데 사용
+    client_id = websocket.query_params.get("client_id", "")[:64] or None
+    if not await manager.connect(websocket, client_id):
+        return
     try:
         while True:
             # 클라이언트로부터 메시지 수신 대기 (필요시)
             data = await websocket.receive_text()
-            # 에코 응답 (선택사항)
-            await websocket.send_json({"type": "echo", "message": data})
+            # 에코 응답 (선택사항, writer Task를 통해 전송 순서 유지)
+            await manager.send_personal_message({"type": "echo", "message": data}, websocket)
     except WebSocketDisconnect:
+        pass
+    finally:
+        # 정상 종료가 아닌 오류로 끝난 연결도 바로 제거
         manager.disconnect(websocket)
 
 
@@ -386,10 +866,9 @@ async def process_video_pipeline_sync(
     MCP 브리지에서 사용하기 위한 동기 버전입니다.
     """
     try:
-        from .tools import generate_veo_video_for_duration
-        
-        # Veo 비디오 생성
-        veo_video_path = generate_veo_video_for_duration(
+        # Veo 비디오 생성 (스레드에서 실행)
+        veo_video_path = await _run_video_job(
+            generate_veo_video_for_duration,
             prompt=approved_prompt,
             total_duration_seconds=int(video_duration) if video_duration else None,
             aspect_ratio="9:16",
@@ -399,7 +878,6 @@ async def process_video_pipeline_sync(
         # Seamless loop 제거 - 원본 비디오 그대로 사용
         final_video_path = veo_video_path
         
-        import os
         video_filename = os.path.basename(final_video_path)
         
         # YouTube 업로드가 요청된 경우 자동으로 업로드 진행
@@ -433,10 +911,43 @@ async def process_video_pipeline_sync(
         }
 
 
-@app.post("/v1/create_shorts", response_model=WorkflowResponse)
+# 동시에 실행할 비디오 파이프라인 수 / 대기열 최대 길이 (Veo 호출과 FFmpeg 인코딩으로부터 GPU/CPU 보호)
+PIPELINE_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "2"))
+PIPELINE_QUEUE_MAX = int(os.getenv("PIPELINE_QUEUE_MAX", "16"))
+# 비동기(/v1/create_shorts)와 동기(/v1/create_shorts_sync) 파이프라인이 함께 사용하는 실행 슬롯
+_pipeline_semaphore = asyncio.Semaphore(PIPELINE_CONCURRENCY)
+# 요청 처리와 분리된 비디오 파이프라인 작업 대기열 (startup에서 워커 시작)
+_pipeline_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_MAX)
+_pipeline_workers: List[asyncio.Task] = []
+# A2A 워크플로우 실행 중인 요청이 미리 잡아 둔 대기열 자리 수
+# (동시에 들어온 요청들이 모두 Gemini 워크플로우를 끝낸 뒤에야 대기열이 넘치는 일을 방지)
+_pipeline_reserved = 0
+
+
+def _pipeline_queue_full_error() -> HTTPException:
+    """대기열 초과 시 반환할 429 오류"""
+    return HTTPException(
+        status_code=429,
+        detail=f"대기 중인 비디오 생성 작업이 너무 많습니다 (최대 {PIPELINE_QUEUE_MAX}개). 잠시 후 다시 시도해주세요."
+    )
+
+
+async def _pipeline_worker():
+    """대기열의 비디오 파이프라인 작업을 하나씩 실행"""
+    while True:
+        job = await _pipeline_queue.get()
+        try:
+            async with _pipeline_semaphore:
+                await process_video_pipeline_with_updates(**job)
+        except Exception as e:
+            print(f"[ERROR] 비디오 파이프라인 작업 실패: {str(e)}")
+        finally:
+            _pipeline_queue.task_done()
+
+
+@fastapi_app.post("/v1/create_shorts", response_model=WorkflowResponse)
 async def create_shorts(
-    request: CreateShortsRequest,
-    background_tasks: BackgroundTasks
+    request: CreateShortsRequest
 ):
     """
     Healing Shorts 생성 엔드포인트
@@ -444,15 +955,23 @@ async def create_shorts(
     A2A 워크플로우를 실행하여:
     1. 필요한 에이전트 서버들이 실행 중인지 확인하고 자동 시작
     2. Planner와 Reviewer가 협업하여 승인된 프롬프트 생성
-    3. 비디오 처리를 BackgroundTask로 스케줄링
+    3. 비디오 처리를 파이프라인 작업 대기열에 등록 (동시 실행 수 제한)
     4. 즉시 응답 반환 (비동기 처리)
     """
+    global _pipeline_reserved
+    
+    # 대기열이 (예약분 포함) 가득 찼으면 A2A 워크플로우를 실행하기 전에 거절
+    if _pipeline_queue.qsize() + _pipeline_reserved >= PIPELINE_QUEUE_MAX:
+        raise _pipeline_queue_full_error()
+    
+    # 워크플로우가 끝날 때까지 대기열 자리를 예약 (아래 finally에서 해제)
+    _pipeline_reserved += 1
     try:
         # 0. 필요한 에이전트 서버들이 실행 중인지 확인 (startup에서 이미 시작했지만, 혹시 모를 상황 대비)
-        from .a2a_config import A2AConfig
-        
-        planner_healthy = check_agent_health(A2AConfig.get_planner_url(), timeout=1.0)
-        reviewer_healthy = check_agent_health(A2AConfig.get_reviewer_url(), timeout=1.0)
+        planner_healthy, reviewer_healthy = await asyncio.gather(
+            check_agent_health(A2AConfig.get_planner_url(), timeout=1.0),
+            check_agent_health(A2AConfig.get_reviewer_url(), timeout=1.0)
+        )
         
         # 필수 에이전트가 실행 중이 아니면 재시도
         if not planner_healthy or not reviewer_healthy:
@@ -482,15 +1001,16 @@ async def create_shorts(
             video_duration=request.video_duration
         )
         
-        # 실시간 에이전트 대화 로그 전송
+        # 에이전트 대화 로그 전송 (항목마다 보내지 않고 한 번의 메시지로 묶어 전송)
         if "conversation_log" in workflow_result:
+            entries = []
             for entry in workflow_result["conversation_log"]:
                 agent = entry.get("agent", "Unknown")
                 action = entry.get("action", "")
                 output = entry.get("output", {})
                 
                 if action == "generate":
-                    await manager.broadcast({
+                    entries.append({
                         "type": "agent_message",
                         "agent": agent,
                         "action": "generate",
@@ -498,7 +1018,7 @@ async def create_shorts(
                     })
                 elif action == "review":
                     review_output = output if isinstance(output, dict) else {}
-                    await manager.broadcast({
+                    entries.append({
                         "type": "agent_message",
                         "agent": agent,
                         "action": "review",
@@ -506,8 +1026,13 @@ async def create_shorts(
                         "score": review_output.get("score", 0),
                         "feedback": review_output.get("feedback", "")
                     })
+            
+            if entries:
+                await manager.broadcast({"type": "agent_message_batch", "entries": entries})
         
         if not workflow_result["success"]:
+            # 에이전트 장애로 실패했을 수 있으므로 다음 요청에서 헬스 체크를 다시 수행
+            invalidate_agent_health(A2AConfig.get_planner_url(), A2AConfig.get_reviewer_url())
             return WorkflowResponse(
                 status="failed",
                 conversation_log=workflow_result.get("conversation_log", []),
@@ -532,17 +1057,19 @@ async def create_shorts(
             if not youtube_tags:
                 youtube_tags = youtube_metadata.tags
         
-        # 2. 비디오 처리를 BackgroundTask로 스케줄링 (WebSocket 업데이트 포함)
-        background_tasks.add_task(
-            process_video_pipeline_with_updates,
-            approved_prompt=approved_prompt,
-            video_duration=request.video_duration,
-            upload_to_youtube=request.upload_to_youtube,
-            youtube_title=youtube_title,
-            youtube_description=youtube_description,
-            youtube_tags=youtube_tags,
-            youtube_metadata=youtube_metadata.dict() if youtube_metadata else None  # Gemini 메타데이터 전달
-        )
+        # 2. 비디오 처리를 파이프라인 작업 대기열에 등록 (WebSocket 업데이트 포함)
+        try:
+            _pipeline_queue.put_nowait({
+                "approved_prompt": approved_prompt,
+                "video_duration": request.video_duration,
+                "upload_to_youtube": request.upload_to_youtube,
+                "youtube_title": youtube_title,
+                "youtube_description": youtube_description,
+                "youtube_tags": youtube_tags,
+                "youtube_metadata": youtube_metadata.model_dump() if youtube_metadata else None  # Gemini 메타데이터 전달
+            })
+        except asyncio.QueueFull:
+            raise _pipeline_queue_full_error()
         
         # 3. 즉시 응답 반환
         return WorkflowResponse(
@@ -553,14 +1080,19 @@ async def create_shorts(
             message=f"프롬프트 승인 완료. 비디오 생성이 백그라운드에서 진행 중입니다. (반복 횟수: {workflow_result['iterations']}, 점수: {workflow_result['final_score']})"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
+        invalidate_agent_health(A2AConfig.get_planner_url(), A2AConfig.get_reviewer_url())
         raise HTTPException(
             status_code=500,
             detail=f"서버 오류: {str(e)}"
         )
+    finally:
+        _pipeline_reserved -= 1
 
 
-@app.post("/v1/create_shorts_sync", response_model=WorkflowResponse)
+@fastapi_app.post("/v1/create_shorts_sync", response_model=WorkflowResponse)
 async def create_shorts_sync(
     request: CreateShortsRequest
 ):
@@ -572,10 +1104,10 @@ async def create_shorts_sync(
     """
     try:
         # 0. 필요한 에이전트 서버들이 실행 중인지 확인
-        from .a2a_config import A2AConfig
-        
-        planner_healthy = check_agent_health(A2AConfig.get_planner_url(), timeout=1.0)
-        reviewer_healthy = check_agent_health(A2AConfig.get_reviewer_url(), timeout=1.0)
+        planner_healthy, reviewer_healthy = await asyncio.gather(
+            check_agent_health(A2AConfig.get_planner_url(), timeout=1.0),
+            check_agent_health(A2AConfig.get_reviewer_url(), timeout=1.0)
+        )
         
         if not planner_healthy or not reviewer_healthy:
             print("[WARNING] 일부 에이전트 서버가 응답하지 않습니다. 재시도 중...")
@@ -599,6 +1131,8 @@ async def create_shorts_sync(
         )
         
         if not workflow_result["success"]:
+            # 에이전트 장애로 실패했을 수 있으므로 다음 요청에서 헬스 체크를 다시 수행
+            invalidate_agent_health(A2AConfig.get_planner_url(), A2AConfig.get_reviewer_url())
             return WorkflowResponse(
                 status="failed",
                 conversation_log=workflow_result.get("conversation_log", []),
@@ -622,16 +1156,17 @@ async def create_shorts_sync(
             if not youtube_tags:
                 youtube_tags = youtube_metadata.tags
         
-        # 2. 비디오 생성 및 업로드 (동기적으로 완료될 때까지 기다림)
-        video_result = await process_video_pipeline_sync(
-            approved_prompt=approved_prompt,
-            video_duration=request.video_duration,
-            upload_to_youtube=request.upload_to_youtube,
-            youtube_title=youtube_title,
-            youtube_description=youtube_description,
-            youtube_tags=youtube_tags,
-            youtube_metadata=youtube_metadata.dict() if youtube_metadata else None
-        )
+        # 2. 비디오 생성 및 업로드 (동기적으로 완료될 때까지 기다림, 실행 슬롯은 비동기 파이프라인과 공유)
+        async with _pipeline_semaphore:
+            video_result = await process_video_pipeline_sync(
+                approved_prompt=approved_prompt,
+                video_duration=request.video_duration,
+                upload_to_youtube=request.upload_to_youtube,
+                youtube_title=youtube_title,
+                youtube_description=youtube_description,
+                youtube_tags=youtube_tags,
+                youtube_metadata=youtube_metadata.model_dump() if youtube_metadata else None
+            )
         
         if not video_result["success"]:
             return WorkflowResponse(
@@ -655,6 +1190,7 @@ async def create_shorts_sync(
         )
         
     except Exception as e:
+        invalidate_agent_health(A2AConfig.get_planner_url(), A2AConfig.get_reviewer_url())
         raise HTTPException(
             status_code=500,
             detail=f"서버 오류: {str(e)}"
@@ -683,7 +1219,7 @@ async def process_youtube_upload_with_updates(
     """
     try:
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "youtube_upload_status",
                 "status": "uploading",
                 "message": "UploaderAgent: YouTube 업로드 준비 중...",
@@ -697,10 +1233,22 @@ async def process_youtube_upload_with_updates(
         metadata_obj = None
         if youtube_metadata:
             try:
-                metadata_obj = YouTubeMetadata(**youtube_metadata)
+                metadata_obj = YouTubeMetadata.model_validate(youtube_metadata)
             except Exception as e:
                 print(f"[UploaderAgent] 메타데이터 파싱 실패: {e}")
         
+        # 업로드 진행률 전송 (업로드 스레드에서 호출되므로 이벤트 루프로 넘겨서 브로드캐스트)
+        loop = asyncio.get_running_loop()
+        
+        def report_progress(progress: int):
+            asyncio.run_coroutine_threadsafe(manager.broadcast_status({
+                "type": "youtube_upload_status",
+                "status": "uploading",
+                "message": f"UploaderAgent: YouTube 업로드 중... {progress}%",
+                "step": "youtube_upload",
+                "progress": progress
+            }), loop)
+        
         # UploaderAgent를 사용하여 업로드 실행
         result = await uploader_agent.process(
             video_path=video_path,
@@ -708,12 +1256,13 @@ async def process_youtube_upload_with_updates(
             title=title,
             description=description,
             tags=tags,
-            privacy_status=privacy_status
+            privacy_status=privacy_status,
+            progress_callback=report_progress
         )
         
         if result["success"]:
             try:
-                await manager.broadcast({
+                await manager.broadcast_status({
                     "type": "youtube_upload_status",
                     "status": "upload_complete",
                     "message": f"UploaderAgent: {result['message']}",
@@ -728,7 +1277,7 @@ async def process_youtube_upload_with_updates(
         
     except Exception as e:
         try:
-            await manager.broadcast({
+            await manager.broadcast_status({
                 "type": "youtube_upload_status",
                 "status": "upload_failed",
                 "message": f"UploaderAgent: YouTube 업로드 실패: {str(e)}",
@@ -739,7 +1288,25 @@ async def process_youtube_upload_with_updates(
         raise
 
 
-@app.post("/v1/upload_youtube")
+def _resolve_video_path(video_path: str) -> Tuple[str, bool]:
+    """
+    업로드 요청의 비디오 경로를 절대 경로로 변환합니다.
+    상대 경로는 output 디렉토리, 프로젝트 루트 순서로 찾습니다.
+    
+    Returns:
+        (절대 경로, 파일 존재 여부)
+    """
+    if os.path.isabs(video_path):
+        return video_path, os.path.exists(video_path)
+    
+    for base_dir in (output_dir, project_root):
+        candidate = os.path.join(base_dir, video_path)
+        if os.path.exists(candidate):
+            return candidate, True
+    return os.path.join(output_dir, video_path), False  # 기본값
+
+
+@fastapi_app.post("/v1/upload_youtube")
 async def upload_youtube(
     request: UploadYouTubeRequest,
     background_tasks: BackgroundTasks
@@ -755,24 +1322,11 @@ async def upload_youtube(
         업로드 시작 응답
     """
     try:
-        import os
-        
-        # 비디오 파일 경로 처리 (상대 경로를 절대 경로로 변환)
-        video_path = request.video_path
-        if not os.path.isabs(video_path):
-            # 상대 경로인 경우 프로젝트 루트 기준으로 변환
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            # output 디렉토리 기준으로도 확인
-            output_dir = os.path.join(project_root, "output")
-            if os.path.exists(os.path.join(output_dir, video_path)):
-                video_path = os.path.join(output_dir, video_path)
-            elif os.path.exists(os.path.join(project_root, video_path)):
-                video_path = os.path.join(project_root, video_path)
-            else:
-                video_path = os.path.join(output_dir, video_path)  # 기본값
+        # 경로 확인(stat)은 느린 볼륨에서 이벤트 루프를 막지 않도록 스레드에서 실행
+        video_path, exists = await asyncio.to_thread(_resolve_video_path, request.video_path)
         
         # 비디오 파일 존재 여부 확인
-        if not os.path.exists(video_path):
+        if not exists:
             raise HTTPException(
                 status_code=404,
                 detail=f"비디오 파일을 찾을 수 없습니다: {video_path}\n"
@@ -806,49 +1360,87 @@ async def upload_youtube(
         )
 
 
-@app.get("/v1/list_videos")
+# list_videos 결과 캐시
+# 인코딩 중인 영상은 제자리에서 커지므로 디렉토리 mtime만으로는 변경을 알 수 없음
+# VIDEO_LIST_CACHE_TTL초 동안은 캐시를 그대로 사용하고, 이후에는 다시 스캔하여
+# (디렉토리 mtime, 파일 수, 가장 최근 파일 mtime)이 바뀐 경우에만 응답을 다시 직렬화
+VIDEO_LIST_CACHE_TTL = float(os.getenv("VIDEO_LIST_CACHE_TTL", "2"))
+_videos_cache: Dict[str, Any] = {"key": None, "body": None, "checked_at": None}
+
+
+def _scan_output_videos() -> Tuple[Tuple[int, int, int], List[Dict[str, Any]]]:
+    """
+    output 디렉토리의 .mp4 파일 목록을 최신순으로 반환 (scandir가 캐시한 stat 사용)
+    
+    Returns:
+        (변경 감지용 키, 비디오 파일 목록)
+    """
+    dir_mtime = os.stat(output_dir).st_mtime_ns
+    latest_mtime = 0
+    video_files = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            # 확장자 부분만 소문자로 비교 (파일명 전체를 복사하지 않음)
+            # is_file은 디렉토리 항목 타입(d_type)을 사용하므로 추가 stat 호출이 없음
+            if entry.name[-4:].lower() != '.mp4' or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                file_stat = entry.stat()
+            except FileNotFoundError:
+                print(f"[Server] 경고: 파일이 존재하지 않음: {entry.path}")
+                continue
+            
+            latest_mtime = max(latest_mtime, file_stat.st_mtime_ns)
+            video_files.append({
+                "filename": entry.name,
+                "path": f"output/{entry.name}",  # API 응답용 경로
+                "url": f"/videos/{entry.name}",  # 웹 접근용 URL 추가
+                "size": file_stat.st_size,
+                "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
+                "modified_time": file_stat.st_mtime  # epoch 초 (표시용 포맷은 클라이언트에서 처리)
+            })
+    
+    # 수정 시간 기준으로 최신순 정렬
+    video_files.sort(key=lambda x: x["modified_time"], reverse=True)
+    return (dir_mtime, len(video_files), latest_mtime), video_files
+
+
+@fastapi_app.get("/v1/list_videos")
 async def list_videos():
     """
     output 폴더에 있는 모든 비디오 파일 목록을 반환합니다.
+    최근 VIDEO_LIST_CACHE_TTL초 이내에 확인했거나 파일이 바뀌지 않았으면 이전 응답을 그대로 사용합니다.
     
     Returns:
         비디오 파일 목록 (파일명, 경로, 크기, 수정 시간)
     """
+    checked_at = _videos_cache["checked_at"]
+    now = time.monotonic()
+    if checked_at is not None and now - checked_at < VIDEO_LIST_CACHE_TTL:
+        return Response(content=_videos_cache["body"], media_type="application/json")
+    
     try:
-        video_files = []
-        
-        # output 디렉토리에서 .mp4 파일 찾기
-        if os.path.exists(output_dir):
-            print(f"[Server] output 디렉토리 스캔 중: {output_dir}")
-            for filename in os.listdir(output_dir):
-                if filename.lower().endswith('.mp4'):
-                    file_path = os.path.join(output_dir, filename)
-                    if not os.path.exists(file_path):
-                        print(f"[Server] 경고: 파일이 존재하지 않음: {file_path}")
-                        continue
-                    file_stat = os.stat(file_path)
-                    
-                    video_files.append({
-                        "filename": filename,
-                        "path": f"output/{filename}",  # API 응답용 경로
-                        "url": f"/videos/{filename}",  # 웹 접근용 URL 추가
-                        "size": file_stat.st_size,
-                        "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
-                        "modified_time": file_stat.st_mtime,
-                        "modified_time_str": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(file_stat.st_mtime))
-                    })
-            print(f"[Server] 발견된 비디오 파일 수: {len(video_files)}")
-        else:
+        # 디렉토리 stat/스캔은 느린/네트워크 볼륨에서 오래 걸릴 수 있으므로 이벤트 루프 밖에서 실행
+        try:
+            key, video_files = await asyncio.to_thread(_scan_output_videos)
+        except FileNotFoundError:
             print(f"[Server] 경고: output 디렉토리가 존재하지 않음: {output_dir}")
+            return Response(
+                content=orjson.dumps({"status": "success", "count": 0, "videos": []}),
+                media_type="application/json"
+            )
         
-        # 수정 시간 기준으로 최신순 정렬
-        video_files.sort(key=lambda x: x["modified_time"], reverse=True)
+        if key != _videos_cache["key"]:
+            print(f"[Server] 비디오 목록 갱신: {len(video_files)}개 ({output_dir})")
+            _videos_cache["body"] = orjson.dumps({
+                "status": "success",
+                "count": len(video_files),
+                "videos": video_files
+            })
+            _videos_cache["key"] = key
+        _videos_cache["checked_at"] = now
         
-        return {
-            "status": "success",
-            "count": len(video_files),
-            "videos": video_files
-        }
+        return Response(content=_videos_cache["body"], media_type="application/json")
     except Exception as e:
         print(f"[Server] 비디오 목록 조회 오류: {str(e)}")
         raise HTTPException(
@@ -857,13 +1449,7 @@ async def list_videos():
         )
 
 
-@app.get("/health")
-async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
-
-
-@app.on_event("startup")
+@fastapi_app.on_event("startup")
 async def startup_event():
     """서버 시작 시 에이전트 서버들을 미리 시작"""
     print("\n" + "=" * 60)
@@ -871,7 +1457,15 @@ async def startup_event():
     print("=" * 60)
     print("\n[INFO] A2A 에이전트 서버들을 시작합니다...\n")
     
+    # 비디오 파이프라인 워커 시작
+    _pipeline_workers.extend(asyncio.create_task(_pipeline_worker()) for _ in range(PIPELINE_CONCURRENCY))
+    
+    # 업로드 에이전트(Gemini 연결, YouTube 인증 정보/API 클라이언트) 예열을 에이전트 서버 기동과 동시에 진행
+    # (WARMUP_TIMEOUT초를 넘기면 예열을 포기하므로 네트워크 문제로 기동이 멈추지 않음)
+    uploader_warmup = asyncio.create_task(uploader_agent.warmup_with_timeout())
+    
     agent_status = await ensure_agent_servers_running()
+    await uploader_warmup
     
     print("\n" + "=" * 60)
     print("[OK] 에이전트 서버 시작 완료")
@@ -893,7 +1487,7 @@ async def startup_event():
         print("          비디오 생성 기능이 정상적으로 작동하지 않을 수 있습니다.\n")
 
 
-@app.on_event("shutdown")
+@fastapi_app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 에이전트 서버들도 종료"""
     print("\n" + "=" * 60)
@@ -901,15 +1495,23 @@ async def shutdown_event():
     print("=" * 60)
     print("\n[INFO] A2A 에이전트 서버들을 종료합니다...\n")
     
-    for agent_name, process in agent_processes.items():
-        if process.poll() is None:  # 프로세스가 실행 중인 경우
-            try:
-                process.terminate()
-                process.wait(timeout=5)
-                print(f"  [OK] {agent_name.upper()}Agent 종료됨")
-            except:
-                process.kill()
-                print(f"  [OK] {agent_name.upper()}Agent 강제 종료됨")
+    # 실행 중인 에이전트들을 동시에 종료 (전체 대기 시간이 에이전트 수에 비례하지 않도록)
+    running = [(agent_name, process) for agent_name, process in agent_processes.items() if process.poll() is None]
+    stopped = await asyncio.gather(*(_stop_agent_process(process, timeout=5) for _, process in running))
+    for (agent_name, _), graceful in zip(running, stopped):
+        if graceful:
+            print(f"  [OK] {agent_name.upper()}Agent 종료됨")
+        else:
+            print(f"  [OK] {agent_name.upper()}Agent 강제 종료됨")
+    
+    # 비디오 파이프라인 워커 중지
+    for worker in _pipeline_workers:
+        worker.cancel()
+    _pipeline_workers.clear()
+    
+    # 공유 A2A HTTP 클라이언트 정리
+    await close_shared_client()
+    _VIDEO_EXECUTOR.shutdown(wait=False, cancel_futures=True)
     
     print("\n" + "=" * 60)
     print("[OK] 모든 서버 종료 완료")
@@ -918,6 +1520,17 @@ async def shutdown_event():
 
 if __name__ == "__main__":
     import uvicorn
+    from .a2a_server import UVICORN_LOOP, UVICORN_HTTP
     
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        ws_ping_interval=WS_PING_INTERVAL,
+        ws_ping_timeout=WS_PING_TIMEOUT,
+        ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE,
+        ws_max_size=WS_MAX_SIZE
+    )
@@ -7,6 +7,7 @@ import os
 from typing import Dict, List, Optional
 
 from .a2a_client import A2AClient
+from .a2a_config import A2AConfig
 from .agents.planner import PlannerAgent
 from .models import AgentMessage, ReviewResult, Task, TaskState, YouTubeMetadata
 
@@ -59,8 +60,11 @@ class Orchestrator:
         final_score = 0
 
         # Planner / Reviewer A2A 클라이언트 생성
-        async with A2AClient(self.planner_url) as planner_client, A2AClient(
-            self.reviewer_url
+        # (PLANNER_UDS / REVIEWER_UDS가 설정되어 있으면 Unix 도메인 소켓으로 연결)
+        async with A2AClient(
+            self.planner_url, uds=A2AConfig.get_uds_path("planner")
+        ) as planner_client, A2AClient(
+            self.reviewer_url, uds=A2AConfig.get_uds_path("reviewer")
         ) as reviewer_client:
             while attempts < max_iterations:
                 attempts += 1
@@ -205,7 +209,7 @@ class Orchestrator:
                                     approved_prompt, user_topic
                                 )
                             )
-                            youtube_metadata = YouTubeMetadata(**metadata_dict)
+                            youtube_metadata = YouTubeMetadata.model_validate(metadata_dict)
                         except Exception:
                             # 실패 시 기본값
                             youtube_metadata = YouTubeMetadata(
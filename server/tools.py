@@ -7,10 +7,95 @@ import os
 import time
 import random
 import re
+import queue
+import subprocess
+import threading
+import uuid
+from functools import lru_cache
 from pathlib import Path
+from moviepy.config import get_setting
 from moviepy.editor import VideoFileClip, concatenate_videoclips, ColorClip, CompositeVideoClip
 from moviepy.video.fx import speedx
-from typing import Optional
+from typing import Optional, Dict, Any, List, Callable
+
+
+# YouTube 재개 가능 업로드 청크 크기 (256KB의 배수여야 함)
+# 파일 전체를 한 요청으로 보내지 않고 청크 단위로 전송하여 업로드당 메모리를 청크 크기로 제한
+YOUTUBE_UPLOAD_CHUNK_SIZE = int(os.getenv("YOUTUBE_UPLOAD_CHUNK_SIZE", str(4 * 1024 * 1024)))
+
+# YouTube 업로드 OAuth 범위
+YOUTUBE_SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+
+# YouTube 인증 정보 / API 클라이언트 캐시
+# 업로드마다 token.pickle 로드, 토큰 갱신, discovery 빌드를 반복하지 않도록 프로세스 전역으로 보관
+# httplib2 기반 서비스 객체는 스레드 안전하지 않으므로 업로드 한 건이 하나씩 빌려 쓰고 반납
+_youtube_credentials = None
+_youtube_lock = threading.Lock()
+_youtube_services: "queue.SimpleQueue" = queue.SimpleQueue()
+
+
+def _unique_video_name(prefix: str) -> str:
+    """
+    출력 영상 파일명 생성 (타임스탬프 + 무작위 ID)
+    같은 초에 시작한 동시 작업끼리도 서로의 파일을 덮어쓰거나 지우지 않도록 합니다.
+    """
+    return f"{prefix}_{int(time.time())}_{uuid.uuid4().hex[:12]}.mp4"
+
+
+@lru_cache(maxsize=None)
+def _get_genai_client(api_key: str):
+    """
+    Veo 호출용 Gemini 클라이언트를 프로세스당 한 번만 생성하여 재사용합니다.
+    (클라이언트 내부 HTTP 커넥션 풀/TLS 세션을 요청 간에 유지)
+    """
+    from google import genai
+    return genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def _video_encoder_kwargs() -> Dict[str, Any]:
+    """
+    write_videofile에 전달할 비디오 인코더 설정을 반환합니다.
+    PRODUCER_HW_ACCEL=cuda(기본값)이고 FFmpeg에 h264_nvenc가 있으면 NVENC 하드웨어 인코딩,
+    그 외(none 또는 NVENC 미지원)에는 libx264 소프트웨어 인코딩을 사용합니다.
+    NVENC 확인은 프로세스당 한 번만 수행합니다.
+    """
+    software = {"codec": "libx264"}
+    if os.getenv("PRODUCER_HW_ACCEL", "cuda").lower() != "cuda":
+        return software
+    
+    # 주의: nvenc는 -tune zerolatency를 지원하지 않음
+    # -b:v 0: 목표 비트레이트 없이 -cq 고정 품질로 인코딩
+    # -pix_fmt yuv420p: MoviePy는 libx264일 때만 yuv420p를 지정하므로, 없으면 RGB 입력이
+    # 4:4:4(High 4:4:4 프로파일)로 인코딩되어 대부분의 브라우저에서 재생되지 않음
+    nvenc = {
+        "codec": "h264_nvenc",
+        "preset": "p4",
+        "ffmpeg_params": ["-tune", "ll", "-rc", "vbr", "-cq", "23", "-b:v", "0", "-pix_fmt", "yuv420p"]
+    }
+    
+    # 인코더 목록에 h264_nvenc가 있어도 GPU가 없거나 구버전 FFmpeg/드라이버가 p4 프리셋, -tune ll을
+    # 지원하지 않으면 실패하므로, 실제 인코딩과 같은 옵션으로 짧은 테스트 인코딩을 해서 확인
+    try:
+        result = subprocess.run(
+            [
+                get_setting("FFMPEG_BINARY"), "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1,format=rgb24",
+                "-c:v", nvenc["codec"], "-preset", nvenc["preset"], *nvenc["ffmpeg_params"],
+                "-f", "null", "-"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+    except Exception:
+        return software
+    
+    if result.returncode != 0:
+        return software
+    
+    print("[FFmpeg] NVENC 하드웨어 인코더(h264_nvenc) 사용")
+    return nvenc
 
 
 def generate_veo_clip(
@@ -54,7 +139,7 @@ def generate_veo_clip(
         print(f"[Veo] Mock 모드: 프롬프트로 비디오 생성 시뮬레이션: {prompt[:50]}...")
         time.sleep(2)  # API 호출 지연 시뮬레이션
         
-        output_path = os.path.join(output_dir, f"veo_generated_{random.randint(1000, 9999)}.mp4")
+        output_path = os.path.join(output_dir, _unique_video_name("veo_generated"))
         
         # Mock 모드에서도 duration_seconds 파라미터 사용
         mock_duration = duration_seconds if duration_seconds else 10
@@ -68,7 +153,7 @@ def generate_veo_clip(
         clip.write_videofile(
             output_path,
             fps=30,  # YouTube Shorts 권장 FPS
-            codec='libx264',
+            **_video_encoder_kwargs(),
             audio=False,
             logger=None
         )
@@ -92,8 +177,8 @@ def generate_veo_clip(
                 ".env 파일에 GEMINI_API_KEY를 설정하거나 MOCK_MODE=True로 설정하세요."
             )
         
-        # Gemini API 클라이언트 초기화
-        client = genai.Client(api_key=GEMINI_API_KEY)
+        # Gemini API 클라이언트 (공유 인스턴스 재사용)
+        client = _get_genai_client(GEMINI_API_KEY)
         
         # 프롬프트 정리: "OVERALL PROMPT FOR VEO" 섹션이 있으면 그것만 사용
         cleaned_prompt = prompt
@@ -184,6 +269,8 @@ def generate_veo_clip(
         # 여러 비디오를 순차적으로 생성 (Veo는 요청당 1개만 생성 가능)
         temp_video_paths = []
         max_wait_time = 600  # 10분
+        # 이 작업의 임시 파일 구분용 ID (동시에 실행되는 다른 작업의 임시 파일과 겹치지 않도록)
+        job_id = uuid.uuid4().hex[:12]
         
         for video_idx in range(num_videos_needed):
             print(f"[Veo] 비디오 {video_idx + 1}/{num_videos_needed} 생성 시작...")
@@ -222,7 +309,7 @@ def generate_veo_clip(
                 raise Exception(f"비디오 {video_idx + 1} 생성 응답에 생성된 비디오가 없습니다.")
             
             generated_video = operation.response.generated_videos[0]
-            temp_path = os.path.join(output_dir, f"veo_temp_{int(time.time())}_{video_idx}.mp4")
+            temp_path = os.path.join(output_dir, f"veo_temp_{job_id}_{video_idx}.mp4")
             
             # 비디오 다운로드
             print(f"[Veo] 비디오 {video_idx + 1} 다운로드 중...")
@@ -252,11 +339,11 @@ def generate_veo_clip(
             else:
                 print(f"[Veo] 경고: 합쳐진 비디오에 오디오 트랙이 없습니다.")
             
-            output_path = os.path.join(output_dir, f"veo_generated_{int(time.time())}.mp4")
+            output_path = os.path.join(output_dir, _unique_video_name("veo_generated"))
             final_clip.write_videofile(
                 output_path,
                 fps=30,
-                codec='libx264',
+                **_video_encoder_kwargs(),
                 audio_codec='aac' if final_clip.audio is not None else None,
                 audio=True if final_clip.audio is not None else False,
                 logger=None
@@ -276,7 +363,7 @@ def generate_veo_clip(
             # 비디오가 1개만 생성된 경우
             output_path = temp_video_paths[0]
             # 파일명 변경
-            new_path = os.path.join(output_dir, f"veo_generated_{int(time.time())}.mp4")
+            new_path = os.path.join(output_dir, _unique_video_name("veo_generated"))
             os.rename(output_path, new_path)
             output_path = new_path
         
@@ -330,25 +417,56 @@ def generate_veo_video_for_duration(
     Returns:
         최종 병합된 비디오 파일 경로
     """
+    temp_paths = generate_veo_segments(
+        prompt=prompt,
+        output_dir=output_dir,
+        total_duration_seconds=total_duration_seconds,
+        aspect_ratio=aspect_ratio,
+        resolution=resolution,
+    )
+    return merge_video_segments(temp_paths, output_dir=output_dir)
+
+
+def generate_veo_segments(
+    prompt: str,
+    output_dir: str = "output",
+    total_duration_seconds: Optional[int] = None,
+    aspect_ratio: str = "9:16",
+    resolution: str = "1080p",
+) -> List[str]:
+    """
+    목표 길이를 최대 8초 단위 세그먼트로 나누어 Veo 클립을 생성합니다. (I/O 단계)
+    병합은 merge_video_segments에서 수행합니다.
+
+    Args:
+        prompt: Veo 프롬프트
+        output_dir: 출력 디렉토리
+        total_duration_seconds: 최종 목표 비디오 길이 (초)
+        aspect_ratio: 비율 ("16:9" 또는 "9:16")
+        resolution: 해상도 ("720p" 또는 "1080p")
+
+    Returns:
+        생성된 클립 파일 경로 리스트
+    """
     # total_duration_seconds가 없으면 기존 단일 호출과 동일하게 동작
     if not total_duration_seconds:
-        return generate_veo_clip(
+        return [generate_veo_clip(
             prompt=prompt,
             output_dir=output_dir,
             duration_seconds=None,
             aspect_ratio=aspect_ratio,
             resolution=resolution,
-        )
+        )]
 
     # 8초 이하이면 단일 클립만 생성
     if total_duration_seconds <= 8:
-        return generate_veo_clip(
+        return [generate_veo_clip(
             prompt=prompt,
             output_dir=output_dir,
             duration_seconds=int(total_duration_seconds),
             aspect_ratio=aspect_ratio,
             resolution=resolution,
-        )
+        )]
 
     # 8초 초과: [8,8,나머지] 형태로 분할
     remaining = int(total_duration_seconds)
@@ -374,7 +492,22 @@ def generate_veo_video_for_duration(
         )
         temp_paths.append(clip_path)
 
-    # 세그먼트가 1개면 그대로 반환 (이론상 8초 이하 케이스에서만 발생)
+    return temp_paths
+
+
+def merge_video_segments(temp_paths: List[str], output_dir: str = "output") -> str:
+    """
+    세그먼트 클립들을 순차적으로 이어붙여 하나의 비디오로 인코딩합니다. (인코딩 단계)
+    병합 후 임시 세그먼트 파일은 삭제합니다.
+
+    Args:
+        temp_paths: generate_veo_segments가 반환한 클립 경로 리스트
+        output_dir: 출력 디렉토리
+
+    Returns:
+        최종 비디오 파일 경로 (세그먼트가 1개면 그 경로를 그대로 반환)
+    """
+    # 세그먼트가 1개면 그대로 반환 (8초 이하 케이스)
     if len(temp_paths) == 1:
         return temp_paths[0]
 
@@ -390,12 +523,12 @@ def generate_veo_video_for_duration(
 
         # 최종 출력 경로
         Path(output_dir).mkdir(exist_ok=True)
-        output_path = os.path.join(output_dir, f"veo_multi_{int(time.time())}.mp4")
+        output_path = os.path.join(output_dir, _unique_video_name("veo_multi"))
 
         final_clip.write_videofile(
             output_path,
             fps=30,
-            codec="libx264",
+            **_video_encoder_kwargs(),
             audio_codec="aac" if final_clip.audio is not None else None,
             audio=True if final_clip.audio is not None else False,
             logger=None,
@@ -527,20 +660,22 @@ def make_seamless_loop(
             print(f"[MoviePy] 최종 비디오에 오디오 트랙이 없습니다.")
         
         # 출력 파일 경로
-        output_filename = f"seamless_loop_{int(time.time())}.mp4"
+        output_filename = _unique_video_name("seamless_loop")
         output_path = os.path.join(output_dir, output_filename)
         
         # 최종 비디오 길이 저장 (close 전에)
         final_duration = final_clip.duration
         
         # 최종 비디오 저장 (YouTube Shorts 권장 설정)
+        encoder_kwargs = _video_encoder_kwargs()
         final_clip.write_videofile(
             output_path,
             fps=30,  # YouTube Shorts 권장 FPS
-            codec='libx264',
+            **encoder_kwargs,
             audio_codec='aac' if final_clip.audio is not None else None,
             audio=True if final_clip.audio is not None else False,
-            bitrate="8000k",  # YouTube Shorts 권장 비트레이트
+            # YouTube Shorts 권장 비트레이트 (NVENC는 -cq 고정 품질 모드이므로 지정하지 않음)
+            bitrate="8000k" if encoder_kwargs["codec"] == "libx264" else None,
             logger=None  # 로그 출력 억제
         )
         
@@ -559,12 +694,121 @@ def make_seamless_loop(
         raise Exception(f"Seamless loop 생성 실패: {str(e)}")
 
 
+def _youtube_token_path() -> str:
+    """OAuth 인증 후 저장되는 token.pickle 경로 (프로젝트 루트 기준)"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(project_root, "token.pickle")
+
+
+def _get_cached_youtube_credentials():
+    """
+    캐시된 YouTube 인증 정보를 반환합니다. 만료되었으면 갱신하고,
+    갱신할 수 없으면 캐시를 비우고 None을 반환합니다.
+    """
+    global _youtube_credentials
+    
+    with _youtube_lock:
+        credentials = _youtube_credentials
+        if credentials is None or credentials.valid:
+            return credentials
+        
+        if credentials.expired and credentials.refresh_token:
+            from google.auth.transport.requests import Request
+            try:
+                credentials.refresh(Request())
+                print("[YouTube] 캐시된 인증 토큰 갱신 완료")
+                return credentials
+            except Exception as e:
+                print(f"[YouTube] 캐시된 인증 토큰 갱신 실패: {e}")
+        
+        _youtube_credentials = None
+        return None
+
+
+def _set_cached_youtube_credentials(credentials) -> None:
+    """업로드/예열에서 얻은 인증 정보를 캐시에 저장"""
+    global _youtube_credentials
+    
+    with _youtube_lock:
+        _youtube_credentials = credentials
+
+
+def _acquire_youtube_service(credentials):
+    """
+    인증 정보에 맞는 YouTube API 서비스 객체를 풀에서 꺼냅니다. (없으면 새로 빌드)
+    다른 인증 정보로 만든 객체는 버립니다.
+    """
+    while True:
+        try:
+            owner, service = _youtube_services.get_nowait()
+        except queue.Empty:
+            break
+        if owner is credentials:
+            return service
+    
+    from googleapiclient.discovery import build
+    return build('youtube', 'v3', credentials=credentials, cache_discovery=False)
+
+
+def _release_youtube_service(credentials, service) -> None:
+    """사용이 끝난 서비스 객체를 풀에 반납"""
+    _youtube_services.put((credentials, service))
+
+
+def prewarm_youtube_client() -> bool:
+    """
+    저장된 인증 정보(token.pickle 또는 YOUTUBE_OAUTH_CREDENTIALS)로 YouTube API 클라이언트를
+    미리 준비합니다. (서버 시작 시 호출)
+    브라우저 OAuth 인증이 필요한 경우나 Mock 모드에서는 아무것도 하지 않으며, 실패해도 무시합니다.
+    
+    Returns:
+        예열 성공 여부
+    """
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    
+    if os.getenv("MOCK_MODE", "True").lower() == "true":
+        return False
+    
+    try:
+        import pickle
+        import json
+        from google.oauth2.credentials import Credentials
+        
+        credentials = _get_cached_youtube_credentials()
+        if credentials is None:
+            token_pickle_path = _youtube_token_path()
+            oauth_credentials = os.getenv("YOUTUBE_OAUTH_CREDENTIALS")
+            if os.path.exists(token_pickle_path):
+                with open(token_pickle_path, 'rb') as token:
+                    credentials = pickle.load(token)
+            elif oauth_credentials:
+                credentials = Credentials.from_authorized_user_info(json.loads(oauth_credentials), YOUTUBE_SCOPES)
+            else:
+                return False
+            
+            _set_cached_youtube_credentials(credentials)
+            # 만료된 토큰은 여기서 갱신 (갱신할 수 없으면 업로드 시 기존 인증 절차를 따름)
+            credentials = _get_cached_youtube_credentials()
+            if credentials is None:
+                return False
+        
+        _release_youtube_service(credentials, _acquire_youtube_service(credentials))
+        print("[YouTube] API 클라이언트 예열 완료")
+        return True
+    except Exception as e:
+        print(f"[YouTube] API 클라이언트 예열 실패 (무시): {e}")
+        return False
+
+
 def upload_youtube_shorts(
     file_path: str,
     title: Optional[str] = None,
     description: Optional[str] = None,
     tags: Optional[list] = None,
-    privacy_status: str = "public"
+    privacy_status: str = "public",
+    progress_callback: Optional[Callable[[int], None]] = None
 ) -> str:
     """
     YouTube Shorts에 비디오를 업로드합니다.
@@ -577,6 +821,7 @@ def upload_youtube_shorts(
         description: 비디오 설명
         tags: 비디오 태그
         privacy_status: 공개 설정 (public, unlisted, private)
+        progress_callback: 청크 전송마다 진행률(0-100)을 받는 콜백 (업로드 스레드에서 호출됨)
         
     Returns:
         업로드된 YouTube 비디오 URL
@@ -658,7 +903,6 @@ def upload_youtube_shorts(
     
     # 실제 YouTube Data API를 사용한 비디오 업로드
     try:
-        from googleapiclient.discovery import build
         from googleapiclient.http import MediaFileUpload
         from googleapiclient.errors import HttpError
         from google_auth_oauthlib.flow import InstalledAppFlow
@@ -667,90 +911,96 @@ def upload_youtube_shorts(
         import pickle
         import json
         
-        # token.pickle 경로 설정 (이미 project_root는 위에서 설정됨)
-        token_pickle_path = os.path.join(project_root, "token.pickle")
-        
-        # OAuth 2.0 인증 처리
-        SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
-        credentials = None
+        # 캐시된 인증 정보가 있으면 token.pickle 로드/OAuth 절차를 건너뜀
+        credentials = _get_cached_youtube_credentials()
+        if credentials is None:
+            # token.pickle 경로 설정 (이미 project_root는 위에서 설정됨)
+            token_pickle_path = os.path.join(project_root, "token.pickle")
         
-        # 저장된 credentials 파일 확인
-        if os.path.exists(token_pickle_path):
-            try:
-                with open(token_pickle_path, 'rb') as token:
-                    credentials = pickle.load(token)
-                print(f"[YouTube] 저장된 인증 정보 로드: {token_pickle_path}")
-            except Exception as e:
-                print(f"[YouTube] token.pickle 로드 실패: {e}")
-                credentials = None
+            # OAuth 2.0 인증 처리
+            SCOPES = YOUTUBE_SCOPES
+            credentials = None
         
-        # credentials가 없거나 만료된 경우
-        if not credentials or not credentials.valid:
-            if credentials and credentials.expired and credentials.refresh_token:
-                print("[YouTube] 인증 토큰 만료됨. 갱신 중...")
+            # 저장된 credentials 파일 확인
+            if os.path.exists(token_pickle_path):
                 try:
-                    credentials.refresh(Request())
-                    print("[YouTube] 인증 토큰 갱신 완료")
+                    with open(token_pickle_path, 'rb') as token:
+                        credentials = pickle.load(token)
+                    print(f"[YouTube] 저장된 인증 정보 로드: {token_pickle_path}")
                 except Exception as e:
-                    print(f"[YouTube] 토큰 갱신 실패: {e}")
+                    print(f"[YouTube] token.pickle 로드 실패: {e}")
                     credentials = None
-            else:
-                # OAuth 2.0 플로우 시작
-                if YOUTUBE_CLIENT_SECRETS_FILE:
-                    # 절대 경로로 변환
-                    if not os.path.isabs(YOUTUBE_CLIENT_SECRETS_FILE):
-                        # 상대 경로인 경우 프로젝트 루트 기준으로 변환
-                        secrets_path = os.path.join(project_root, YOUTUBE_CLIENT_SECRETS_FILE)
-                    else:
-                        secrets_path = YOUTUBE_CLIENT_SECRETS_FILE
+        
+            # credentials가 없거나 만료된 경우
+            if not credentials or not credentials.valid:
+                if credentials and credentials.expired and credentials.refresh_token:
+                    print("[YouTube] 인증 토큰 만료됨. 갱신 중...")
+                    try:
+                        credentials.refresh(Request())
+                        print("[YouTube] 인증 토큰 갱신 완료")
+                    except Exception as e:
+                        print(f"[YouTube] 토큰 갱신 실패: {e}")
+                        credentials = None
+                else:
+                    # OAuth 2.0 플로우 시작
+                    if YOUTUBE_CLIENT_SECRETS_FILE:
+                        # 절대 경로로 변환
+                        if not os.path.isabs(YOUTUBE_CLIENT_SECRETS_FILE):
+                            # 상대 경로인 경우 프로젝트 루트 기준으로 변환
+                            secrets_path = os.path.join(project_root, YOUTUBE_CLIENT_SECRETS_FILE)
+                        else:
+                            secrets_path = YOUTUBE_CLIENT_SECRETS_FILE
                     
-                    if os.path.exists(secrets_path):
-                        print(f"[YouTube] OAuth 인증 시작: {secrets_path}")
-                        flow = InstalledAppFlow.from_client_secrets_file(
-                            secrets_path, SCOPES)
-                        # BackgroundTask에서는 브라우저 인증이 어려울 수 있으므로 에러 메시지 개선
-                        try:
-                            credentials = flow.run_local_server(port=0)
-                        except Exception as e:
-                            raise Exception(
-                                f"OAuth 인증 실패: {str(e)}\n\n"
-                                f"BackgroundTask에서는 브라우저 인증이 어려울 수 있습니다.\n"
-                                f"먼저 서버를 직접 실행하여 한 번 인증한 후 token.pickle 파일이 생성되면 "
-                                f"BackgroundTask에서도 사용할 수 있습니다."
+                        if os.path.exists(secrets_path):
+                            print(f"[YouTube] OAuth 인증 시작: {secrets_path}")
+                            flow = InstalledAppFlow.from_client_secrets_file(
+                                secrets_path, SCOPES)
+                            # BackgroundTask에서는 브라우저 인증이 어려울 수 있으므로 에러 메시지 개선
+                            try:
+                                credentials = flow.run_local_server(port=0)
+                            except Exception as e:
+                                raise Exception(
+                                    f"OAuth 인증 실패: {str(e)}\n\n"
+                                    f"BackgroundTask에서는 브라우저 인증이 어려울 수 있습니다.\n"
+                                    f"먼저 서버를 직접 실행하여 한 번 인증한 후 token.pickle 파일이 생성되면 "
+                                    f"BackgroundTask에서도 사용할 수 있습니다."
+                                )
+                        else:
+                            raise FileNotFoundError(
+                                f"client_secrets.json 파일을 찾을 수 없습니다: {secrets_path}\n"
+                                f"현재 작업 디렉토리: {os.getcwd()}\n"
+                                f"프로젝트 루트: {project_root}"
                             )
+                    elif YOUTUBE_OAUTH_CREDENTIALS:
+                        print("[YouTube] YOUTUBE_OAUTH_CREDENTIALS에서 인증 정보 로드")
+                        creds_dict = json.loads(YOUTUBE_OAUTH_CREDENTIALS)
+                        credentials = Credentials.from_authorized_user_info(creds_dict, SCOPES)
                     else:
-                        raise FileNotFoundError(
-                            f"client_secrets.json 파일을 찾을 수 없습니다: {secrets_path}\n"
-                            f"현재 작업 디렉토리: {os.getcwd()}\n"
-                            f"프로젝트 루트: {project_root}"
+                        raise ValueError(
+                            "YouTube 업로드를 위해 OAuth 인증이 필요합니다.\n\n"
+                            f"설정 방법:\n"
+                            f"1. YOUTUBE_CLIENT_SECRETS_FILE=path/to/client_secrets.json 설정\n"
+                            f"   또는\n"
+                            f"2. YOUTUBE_OAUTH_CREDENTIALS={{\"token\": \"...\", ...}} 설정\n\n"
+                            f"현재 설정:\n"
+                            f"  YOUTUBE_CLIENT_SECRETS_FILE: {YOUTUBE_CLIENT_SECRETS_FILE}\n"
+                            f"  YOUTUBE_OAUTH_CREDENTIALS: {'설정됨' if YOUTUBE_OAUTH_CREDENTIALS else '설정 안 됨'}"
                         )
-                elif YOUTUBE_OAUTH_CREDENTIALS:
-                    print("[YouTube] YOUTUBE_OAUTH_CREDENTIALS에서 인증 정보 로드")
-                    creds_dict = json.loads(YOUTUBE_OAUTH_CREDENTIALS)
-                    credentials = Credentials.from_authorized_user_info(creds_dict, SCOPES)
-                else:
-                    raise ValueError(
-                        "YouTube 업로드를 위해 OAuth 인증이 필요합니다.\n\n"
-                        f"설정 방법:\n"
-                        f"1. YOUTUBE_CLIENT_SECRETS_FILE=path/to/client_secrets.json 설정\n"
-                        f"   또는\n"
-                        f"2. YOUTUBE_OAUTH_CREDENTIALS={{\"token\": \"...\", ...}} 설정\n\n"
-                        f"현재 설정:\n"
-                        f"  YOUTUBE_CLIENT_SECRETS_FILE: {YOUTUBE_CLIENT_SECRETS_FILE}\n"
-                        f"  YOUTUBE_OAUTH_CREDENTIALS: {'설정됨' if YOUTUBE_OAUTH_CREDENTIALS else '설정 안 됨'}"
-                    )
             
-            # credentials 저장
+                # credentials 저장
+                if credentials:
+                    try:
+                        with open(token_pickle_path, 'wb') as token:
+                            pickle.dump(credentials, token)
+                        print(f"[YouTube] 인증 정보 저장: {token_pickle_path}")
+                    except Exception as e:
+                        print(f"[YouTube] 인증 정보 저장 실패: {e}")
+            
             if credentials:
-                try:
-                    with open(token_pickle_path, 'wb') as token:
-                        pickle.dump(credentials, token)
-                    print(f"[YouTube] 인증 정보 저장: {token_pickle_path}")
-                except Exception as e:
-                    print(f"[YouTube] 인증 정보 저장 실패: {e}")
+                _set_cached_youtube_credentials(credentials)
         
-        # YouTube API 클라이언트 생성
-        youtube = build('youtube', 'v3', credentials=credentials)
+        # YouTube API 클라이언트 (풀에서 재사용, 업로드가 끝나면 반납)
+        youtube = _acquire_youtube_service(credentials)
         
         # 기본값 설정
         video_title = title or "Healing Shorts - Auto Generated"
@@ -772,11 +1022,11 @@ def upload_youtube_shorts(
         }
         
         # 미디어 파일 업로드 객체 생성 (공식 문서 참고)
-        # chunksize=-1: 전체 파일을 한 번에 업로드 (재시도 시 중단된 지점부터 재개)
+        # chunksize: 청크 단위로 파일을 읽어 전송 (재시도 시 중단된 청크부터 재개)
         # resumable=True: 재개 가능한 업로드 활성화
         media = MediaFileUpload(
             file_path,
-            chunksize=-1,
+            chunksize=YOUTUBE_UPLOAD_CHUNK_SIZE,
             resumable=True,
             mimetype='video/*'
         )
@@ -790,7 +1040,13 @@ def upload_youtube_shorts(
         )
         
         # 재개 가능한 업로드 실행 (공식 문서의 resumable_upload 함수 방식)
-        return resumable_upload(insert_request, file_path, MAX_RETRIES, RETRIABLE_EXCEPTIONS, RETRIABLE_STATUS_CODES)
+        try:
+            return resumable_upload(
+                insert_request, file_path, MAX_RETRIES, RETRIABLE_EXCEPTIONS, RETRIABLE_STATUS_CODES,
+                progress_callback=progress_callback
+            )
+        finally:
+            _release_youtube_service(credentials, youtube)
             
     except ImportError as e:
         raise Exception(
@@ -811,7 +1067,14 @@ def upload_youtube_shorts(
         raise Exception(f"YouTube 업로드 실패: {error_str}")
 
 
-def resumable_upload(insert_request, file_path: str, MAX_RETRIES: int, RETRIABLE_EXCEPTIONS: tuple, RETRIABLE_STATUS_CODES: list) -> str:
+def resumable_upload(
+    insert_request,
+    file_path: str,
+    MAX_RETRIES: int,
+    RETRIABLE_EXCEPTIONS: tuple,
+    RETRIABLE_STATUS_CODES: list,
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> str:
     """
     재개 가능한 업로드를 실행합니다 (공식 문서의 resumable_upload 함수 구현).
     지수 백오프 전략을 사용하여 실패한 업로드를 재시도합니다.
@@ -824,6 +1087,7 @@ def resumable_upload(insert_request, file_path: str, MAX_RETRIES: int, RETRIABLE
         MAX_RETRIES: 최대 재시도 횟수
         RETRIABLE_EXCEPTIONS: 재시도 가능한 예외 튜플
         RETRIABLE_STATUS_CODES: 재시도 가능한 HTTP 상태 코드 리스트
+        progress_callback: 청크 전송마다 진행률(0-100)을 받는 콜백
         
     Returns:
         업로드된 YouTube 비디오 URL
@@ -836,6 +1100,7 @@ def resumable_upload(insert_request, file_path: str, MAX_RETRIES: int, RETRIABLE
     response = None
     error = None
     retry = 0
+    file_size = os.path.getsize(file_path)
     
     while response is None:
         try:
@@ -844,15 +1109,21 @@ def resumable_upload(insert_request, file_path: str, MAX_RETRIES: int, RETRIABLE
             
             if status:
                 # 업로드 진행률 표시 (공식 문서 참고)
+                progress = None
                 if hasattr(status, 'progress'):
                     progress = int(status.progress() * 100)
                     print(f"[YouTube] 업로드 진행률: {progress}%")
                 elif hasattr(status, 'resumable_progress'):
                     # 재개 가능한 업로드의 경우
                     uploaded_bytes = status.resumable_progress
-                    file_size = os.path.getsize(file_path)
                     progress = int((uploaded_bytes / file_size) * 100) if file_size > 0 else 0
                     print(f"[YouTube] 업로드 진행률: {progress}% ({uploaded_bytes}/{file_size} bytes)")
+                
+                if progress is not None and progress_callback is not None:
+                    try:
+                        progress_callback(progress)
+                    except Exception as e:
+                        print(f"[YouTube] 진행률 콜백 오류 (무시): {e}")
             
             if response is not None:
                 if 'id' in response:
@@ -1,9 +1,53 @@
 let ws = null;
 let currentVideoPath = null;
 let currentVideoMetadata = null;
+const wsTextDecoder = new TextDecoder();
+// 서버에서 교체된 연결의 종료 코드 (같은 탭에서 새 연결이 열린 경우, 재연결하지 않음)
+const WS_REPLACED_CLOSE_CODE = 4000;
+// 비디오 주제 최대 길이 (서버 CreateShortsRequest.topic과 동일)
+const TOPIC_MAX_LENGTH = 500;
+
+// 디버그 로그는 ?debug 쿼리가 있을 때만 출력 (평소에는 빈 함수라 인자 처리 비용만 남음)
+const DEBUG = new URLSearchParams(window.location.search).has('debug');
+const dlog = DEBUG ? console.log.bind(console, '[DEBUG]') : () => {};
+
+// 영상 수정 시간 표시용 포맷터 (서버는 epoch 초만 보내고 브라우저 로캘로 포맷)
+const videoTimeFormat = new Intl.DateTimeFormat('ko-KR', {
+    year: 'numeric', month: '2-digit', day: '2-digit',
+    hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false
+});
+
+// 자주 쓰는 DOM 요소 참조 (페이지 로드 시 한 번만 조회, 키는 요소 id)
+const DOM = {};
+const DOM_IDS = [
+    'topic', 'videoDuration', 'createBtn', 'statusSection',
+    'agentStatus', 'agentLog', 'videoStatus', 'videoLog', 'videoPreview',
+    'youtubeUploadSection', 'uploadTitle', 'uploadDescription', 'uploadTags',
+    'uploadYoutubeBtn', 'youtubeUploadStatus',
+    'refreshVideoListBtn', 'videoListContainer'
+];
+
+function cacheDomElements() {
+    DOM_IDS.forEach(id => {
+        DOM[id] = document.getElementById(id);
+    });
+}
+
+// 페이지 로드별 WebSocket 클라이언트 ID (재연결 시에는 유지, 새로고침/탭 복제 시에는 새로 발급)
+// sessionStorage는 탭 복제 시 함께 복사되어 두 탭이 같은 ID로 서로의 연결을 끊게 되므로 사용하지 않음
+let wsClientId = null;
+
+function getWsClientId() {
+    if (!wsClientId) {
+        wsClientId = window.crypto && crypto.randomUUID
+            ? crypto.randomUUID()
+            : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+    }
+    return wsClientId;
+}
 
 function addLog(containerId, message, className = '') {
-    const container = document.getElementById(containerId);
+    const container = DOM[containerId];
     if (!container) return;
     
     const entry = document.createElement('div');
@@ -18,141 +62,171 @@ function addLog(containerId, message, className = '') {
     container.scrollTop = container.scrollHeight;
 }
 
-function connectWebSocket() {
-    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-    const wsUrl = `${protocol}//${window.location.host}/ws`;
-    
-    ws = new WebSocket(wsUrl);
-    
-    ws.onopen = () => {
-        addLog('agentLog', 'WebSocket 연결됨', '');
-    };
-    
-    ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+// 에이전트 대화 메시지 한 건을 로그에 표시
+function handleAgentMessage(data) {
+    const agent = data.agent;
+    const action = data.action;
+    const message = data.message;
+    
+    if (action === 'generate') {
+        addLog('agentLog', `🤖 ${agent}: 프롬프트 생성`, 'planner');
+        addLog('agentLog', `   "${message}"`, 'planner');
+    } else if (action === 'review') {
+        const status = data.status;
+        const score = data.score;
+        const feedback = data.feedback;
         
-        if (data.type === 'agent_message') {
-            const agent = data.agent;
-            const action = data.action;
-            const message = data.message;
-            
-            if (action === 'generate') {
-                addLog('agentLog', `🤖 ${agent}: 프롬프트 생성`, 'planner');
-                addLog('agentLog', `   "${message}"`, 'planner');
-            } else if (action === 'review') {
-                const status = data.status;
-                const score = data.score;
-                const feedback = data.feedback;
-                
-                addLog('agentLog', `🔍 ${agent}: 프롬프트 검토`, 'reviewer');
-                addLog('agentLog', `   상태: ${status} (점수: ${score}/100)`, status === 'APPROVED' ? 'reviewer' : 'error');
-                if (feedback) {
-                    addLog('agentLog', `   피드백: ${feedback}`, 'reviewer');
-                }
+        addLog('agentLog', `🔍 ${agent}: 프롬프트 검토`, 'reviewer');
+        addLog('agentLog', `   상태: ${status} (점수: ${score}/100)`, status === 'APPROVED' ? 'reviewer' : 'error');
+        if (feedback) {
+            addLog('agentLog', `   피드백: ${feedback}`, 'reviewer');
+        }
+    }
+}
+
+// 다음 애니메이션 프레임에 반영할 서버 메시지
+let pendingUpdates = [];
+
+function applyPendingUpdates() {
+    const updates = pendingUpdates;
+    pendingUpdates = [];
+    updates.forEach(handleServerMessage);
+}
+
+// 서버에서 받은 메시지 한 건 처리
+function handleServerMessage(data) {
+    if (data.type === 'agent_message_batch') {
+        data.entries.forEach(handleAgentMessage);
+    } else if (data.type === 'agent_message') {
+        handleAgentMessage(data);
+    } else if (data.type === 'video_status') {
+        const status = data.status;
+        const message = data.message;
+        
+        addLog('videoLog', message, 'video');
+        
+        if (status === 'completed') {
+            const videoStatus = DOM.videoStatus;
+            if (videoStatus) {
+                videoStatus.textContent = '완료';
+                videoStatus.className = 'status-badge completed';
             }
-        } else if (data.type === 'video_status') {
-            const status = data.status;
-            const message = data.message;
             
-            addLog('videoLog', message, 'video');
-            
-            if (status === 'completed') {
-                const videoStatus = document.getElementById('videoStatus');
-                if (videoStatus) {
-                    videoStatus.textContent = '완료';
-                    videoStatus.className = 'status-badge completed';
-                }
+            // video_filename이 있으면 우선 사용, 없으면 final_video_path에서 파일명 추출
+            const videoFile = data.video_filename || (data.final_video_path ? data.final_video_path.split(/[\\/]/).pop() : null);
+            if (videoFile) {
+                // currentVideoPath를 올바른 형식으로 설정 (output/filename.mp4)
+                currentVideoPath = `output/${videoFile}`;
+                dlog('비디오 생성 완료, currentVideoPath 설정:', currentVideoPath);
+                showVideoPreview(videoFile);
                 
-                // video_filename이 있으면 우선 사용, 없으면 final_video_path에서 파일명 추출
-                const videoFile = data.video_filename || (data.final_video_path ? data.final_video_path.split(/[\\/]/).pop() : null);
-                if (videoFile) {
-                    // currentVideoPath를 올바른 형식으로 설정 (output/filename.mp4)
-                    currentVideoPath = `output/${videoFile}`;
-                    console.log('[DEBUG] 비디오 생성 완료, currentVideoPath 설정:', currentVideoPath);
-                    showVideoPreview(videoFile);
+                // YouTube 메타데이터 설정
+                if (data.youtube_metadata) {
+                    currentVideoMetadata = data.youtube_metadata;
+                    dlog('YouTube 메타데이터 설정:', currentVideoMetadata);
                     
-                    // YouTube 메타데이터 설정
-                    if (data.youtube_metadata) {
-                        currentVideoMetadata = data.youtube_metadata;
-                        console.log('[DEBUG] YouTube 메타데이터 설정:', currentVideoMetadata);
-                        
-                        const titleInput = document.getElementById('uploadTitle');
-                        const descriptionInput = document.getElementById('uploadDescription');
-                        const tagsInput = document.getElementById('uploadTags');
-                        
-                        if (titleInput) {
-                            titleInput.value = data.youtube_metadata.title || '';
-                        }
-                        if (descriptionInput) {
-                            descriptionInput.value = data.youtube_metadata.description || '';
-                        }
-                        if (tagsInput) {
-                            tagsInput.value = data.youtube_metadata.tags ? data.youtube_metadata.tags.join(', ') : '';
-                        }
-                    }
+                    const titleInput = DOM.uploadTitle;
+                    const descriptionInput = DOM.uploadDescription;
+                    const tagsInput = DOM.uploadTags;
                     
-                    // YouTube 업로드 섹션 표시
-                    const uploadSection = document.getElementById('youtubeUploadSection');
-                    if (uploadSection) {
-                        uploadSection.style.display = 'block';
-                        // 스크롤 이동
-                        uploadSection.scrollIntoView({ behavior: 'smooth' });
-                        
-                        console.log('[DEBUG] YouTube 업로드 섹션 표시됨');
-                        
-                        // 업로드 버튼 이벤트 리스너 재설정
-                        setupUploadButton();
+                    if (titleInput) {
+                        titleInput.value = data.youtube_metadata.title || '';
                     }
-                }
-            } else if (status === 'error') {
-                const videoStatus = document.getElementById('videoStatus');
-                if (videoStatus) {
-                    videoStatus.textContent = '오류';
-                    videoStatus.className = 'status-badge failed';
-                }
-            }
-        } else if (data.type === 'youtube_upload_status') {
-            const status = data.status;
-            const message = data.message;
-            
-            addLog('videoLog', message, 'video');
-            
-            const uploadStatusDiv = document.getElementById('youtubeUploadStatus');
-            const uploadBtn = document.getElementById('uploadYoutubeBtn');
-            
-            if (status === 'upload_complete') {
-                if (uploadStatusDiv) {
-                    uploadStatusDiv.innerHTML = `<p style="color: var(--success-color); font-weight: 600;">✅ ${message}</p>`;
-                    if (data.youtube_url) {
-                        uploadStatusDiv.innerHTML += `<p style="margin-top: 10px;"><a href="${data.youtube_url}" target="_blank" style="color: #ff0000; text-decoration: none; font-weight: 600;">YouTube에서 보기 →</a></p>`;
+                    if (descriptionInput) {
+                        descriptionInput.value = data.youtube_metadata.description || '';
+                    }
+                    if (tagsInput) {
+                        tagsInput.value = data.youtube_metadata.tags ? data.youtube_metadata.tags.join(', ') : '';
                     }
                 }
-                if (uploadBtn) {
-                    uploadBtn.disabled = false;
-                    uploadBtn.textContent = '📺 YouTube에 업로드 완료';
-                }
-            } else if (status === 'upload_failed') {
-                if (uploadStatusDiv) {
-                    uploadStatusDiv.innerHTML = `<p style="color: var(--error-color); font-weight: 600;">❌ ${message}</p>`;
-                }
-                if (uploadBtn) uploadBtn.disabled = false;
-            } else if (status === 'uploading') {
-                if (uploadStatusDiv) {
-                    uploadStatusDiv.innerHTML = `<p style="color: var(--text-secondary);">⏳ ${message}</p>`;
+                
+                // YouTube 업로드 섹션 표시
+                const uploadSection = DOM.youtubeUploadSection;
+                if (uploadSection) {
+                    uploadSection.style.display = 'block';
+                    // 스크롤 이동
+                    uploadSection.scrollIntoView({ behavior: 'smooth' });
+                    
+                    dlog('YouTube 업로드 섹션 표시됨');
+                    
+                    resetUploadButton();
                 }
-                if (uploadBtn) {
-                    uploadBtn.disabled = true;
-                    uploadBtn.textContent = '⏳ 업로드 중...';
+            }
+        } else if (status === 'error') {
+            const videoStatus = DOM.videoStatus;
+            if (videoStatus) {
+                videoStatus.textContent = '오류';
+                videoStatus.className = 'status-badge failed';
+            }
+        }
+    } else if (data.type === 'youtube_upload_status') {
+        const status = data.status;
+        const message = data.message;
+        
+        addLog('videoLog', message, 'video');
+        
+        const uploadStatusDiv = DOM.youtubeUploadStatus;
+        const uploadBtn = DOM.uploadYoutubeBtn;
+        
+        if (status === 'upload_complete') {
+            if (uploadStatusDiv) {
+                uploadStatusDiv.innerHTML = `<p style="color: var(--success-color); font-weight: 600;">✅ ${message}</p>`;
+                if (data.youtube_url) {
+                    uploadStatusDiv.innerHTML += `<p style="margin-top: 10px;"><a href="${data.youtube_url}" target="_blank" style="color: #ff0000; text-decoration: none; font-weight: 600;">YouTube에서 보기 →</a></p>`;
                 }
             }
+            if (uploadBtn) {
+                uploadBtn.disabled = false;
+                uploadBtn.textContent = '📺 YouTube에 업로드 완료';
+            }
+        } else if (status === 'upload_failed') {
+            if (uploadStatusDiv) {
+                uploadStatusDiv.innerHTML = `<p style="color: var(--error-color); font-weight: 600;">❌ ${message}</p>`;
+            }
+            if (uploadBtn) uploadBtn.disabled = false;
+        } else if (status === 'uploading') {
+            if (uploadStatusDiv) {
+                uploadStatusDiv.innerHTML = `<p style="color: var(--text-secondary);">⏳ ${message}</p>`;
+            }
+            if (uploadBtn) {
+                uploadBtn.disabled = true;
+                uploadBtn.textContent = '⏳ 업로드 중...';
+            }
         }
+    }
+}
+
+function connectWebSocket() {
+    const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const wsUrl = `${protocol}//${window.location.host}/ws?client_id=${encodeURIComponent(getWsClientId())}`;
+    
+    const socket = new WebSocket(wsUrl);
+    ws = socket;
+    // 서버는 UTF-8 JSON을 바이너리 프레임으로 전송
+    ws.binaryType = 'arraybuffer';
+    
+    ws.onopen = () => {
+        addLog('agentLog', 'WebSocket 연결됨', '');
+    };
+    
+    ws.onmessage = (event) => {
+        const data = JSON.parse(typeof event.data === 'string' ? event.data : wsTextDecoder.decode(event.data));
+        const updates = data.type === 'batch' ? data.updates : [data];
+        
+        // 한 프레임 안에 도착한 메시지는 모아서 다음 애니메이션 프레임에 한 번에 DOM에 반영
+        if (pendingUpdates.length === 0) {
+            requestAnimationFrame(applyPendingUpdates);
+        }
+        pendingUpdates.push(...updates);
     };
     
     ws.onerror = (error) => {
         addLog('agentLog', 'WebSocket 오류 발생', 'error');
     };
     
-    ws.onclose = () => {
+    ws.onclose = (event) => {
+        // 이미 새 연결로 교체된 소켓이면 재연결하지 않음
+        if (ws !== socket || event.code === WS_REPLACED_CLOSE_CODE) return;
         addLog('agentLog', 'WebSocket 연결 종료', '');
         // 자동 재연결 시도
         setTimeout(() => {
@@ -163,7 +237,7 @@ function connectWebSocket() {
 }
 
 function showVideoPreview(videoPath) {
-    const preview = document.getElementById('videoPreview');
+    const preview = DOM.videoPreview;
     if (!preview) return;
     
     // 파일명만 추출
@@ -184,10 +258,11 @@ function showVideoPreview(videoPath) {
 }
 
 async function createShorts() {
-    const topicInput = document.getElementById('topic');
-    const durationInput = document.getElementById('videoDuration');
+    const topicInput = DOM.topic;
+    const durationInput = DOM.videoDuration;
     
-    const topic = topicInput.value;
+    // 서버와 같은 기준: 앞뒤 공백을 제거한 뒤 1~500자
+    const topic = topicInput.value.trim();
     const videoDuration = parseFloat(durationInput.value) || 30.0;
     
     if (!topic) {
@@ -196,6 +271,12 @@ async function createShorts() {
         return;
     }
     
+    if (topic.length > TOPIC_MAX_LENGTH) {
+        alert(`비디오 주제는 ${TOPIC_MAX_LENGTH}자 이하로 입력하세요. (현재 ${topic.length}자)`);
+        topicInput.focus();
+        return;
+    }
+    
     if (videoDuration < 1 || videoDuration > 300) {
         alert('비디오 길이는 1초에서 300초 사이여야 합니다.');
         durationInput.focus();
@@ -209,19 +290,19 @@ async function createShorts() {
     }
     
     // UI 초기화
-    document.getElementById('statusSection').style.display = 'flex';
-    document.getElementById('agentLog').innerHTML = '';
-    document.getElementById('videoLog').innerHTML = '';
-    document.getElementById('videoPreview').innerHTML = '';
-    document.getElementById('youtubeUploadSection').style.display = 'none';
-    document.getElementById('youtubeUploadStatus').innerHTML = '';
-    
-    const createBtn = document.getElementById('createBtn');
+    DOM.statusSection.style.display = 'flex';
+    DOM.agentLog.innerHTML = '';
+    DOM.videoLog.innerHTML = '';
+    DOM.videoPreview.innerHTML = '';
+    DOM.youtubeUploadSection.style.display = 'none';
+    DOM.youtubeUploadStatus.innerHTML = '';
+    
+    const createBtn = DOM.createBtn;
     createBtn.disabled = true;
     createBtn.innerHTML = '<span class="spinner"></span> 처리 중...';
     
-    const agentStatus = document.getElementById('agentStatus');
-    const videoStatus = document.getElementById('videoStatus');
+    const agentStatus = DOM.agentStatus;
+    const videoStatus = DOM.videoStatus;
     
     agentStatus.textContent = '처리 중';
     agentStatus.className = 'status-badge processing';
@@ -280,21 +361,13 @@ async function createShorts() {
     }
 }
 
-// 업로드 버튼 설정 함수
-function setupUploadButton() {
-    const uploadBtn = document.getElementById('uploadYoutubeBtn');
+// 업로드 버튼을 다시 누를 수 있는 상태로 되돌림 (클릭 핸들러는 페이지 로드 시 한 번만 등록)
+function resetUploadButton() {
+    const uploadBtn = DOM.uploadYoutubeBtn;
     if (!uploadBtn) return;
     
-    // 기존 리스너 제거를 위해 노드 복제
-    const newUploadBtn = uploadBtn.cloneNode(true);
-    uploadBtn.parentNode.replaceChild(newUploadBtn, uploadBtn);
-    
-    newUploadBtn.addEventListener('click', async (e) => {
-        e.preventDefault();
-        await uploadToYouTube();
-    });
-    
-    newUploadBtn.disabled = false;
+    uploadBtn.disabled = false;
+    uploadBtn.textContent = '📺 YouTube에 업로드';
 }
 
 // 통합된 YouTube 업로드 함수
@@ -304,8 +377,8 @@ async function uploadToYouTube() {
         return;
     }
     
-    const uploadBtn = document.getElementById('uploadYoutubeBtn');
-    const uploadStatus = document.getElementById('youtubeUploadStatus');
+    const uploadBtn = DOM.uploadYoutubeBtn;
+    const uploadStatus = DOM.youtubeUploadStatus;
     
     if (!uploadBtn || !uploadStatus) return;
     
@@ -314,9 +387,9 @@ async function uploadToYouTube() {
     uploadStatus.innerHTML = '<p style="color: var(--primary-color);">YouTube에 업로드 중입니다...</p>';
     
     // 입력 필드에서 메타데이터 가져오기
-    const titleInput = document.getElementById('uploadTitle');
-    const descriptionInput = document.getElementById('uploadDescription');
-    const tagsInput = document.getElementById('uploadTags');
+    const titleInput = DOM.uploadTitle;
+    const descriptionInput = DOM.uploadDescription;
+    const tagsInput = DOM.uploadTags;
     
     const title = titleInput?.value?.trim() || currentVideoMetadata?.title || null;
     const description = descriptionInput?.value?.trim() || currentVideoMetadata?.description || null;
@@ -364,7 +437,7 @@ async function uploadToYouTube() {
 
 // 영상 목록 불러오기
 async function loadVideoList() {
-    const container = document.getElementById('videoListContainer');
+    const container = DOM.videoListContainer;
     if (!container) return;
     
     container.innerHTML = '<p style="color: var(--text-secondary); text-align: center; padding: 20px;">영상 목록을 불러오는 중...</p>';
@@ -374,49 +447,51 @@ async function loadVideoList() {
         const result = await response.json();
         
         if (result.status === 'success' && result.videos && result.videos.length > 0) {
-            container.innerHTML = '';
+            // 항목을 DocumentFragment에 모은 뒤 한 번에 교체 (HTML 파싱 없음, 리플로우 1회)
+            const fragment = document.createDocumentFragment();
             
             result.videos.forEach(video => {
                 const videoItem = document.createElement('div');
                 videoItem.className = 'video-list-item';
                 
-                // 비디오 경로와 파일명을 안전하게 이스케이프
-                const safePath = video.path.replace(/'/g, "\\'").replace(/"/g, '&quot;');
-                const safeFilename = video.filename.replace(/'/g, "\\'").replace(/"/g, '&quot;');
+                const row = document.createElement('div');
+                row.style.cssText = 'display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 15px;';
                 
-                videoItem.innerHTML = `
-                    <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 15px;">
-                        <div style="flex: 1; min-width: 200px;">
-                            <div class="video-title">${video.filename}</div>
-                            <div class="video-meta">
-                                크기: ${video.size_mb} MB | 수정: ${video.modified_time_str}
-                            </div>
-                            <video controls style="width: 100%; max-height: 200px; margin-top: 10px; border-radius: 5px; background: #000;" src="${video.url || '/videos/' + video.filename}"></video>
-                        </div>
-                        <div>
-                            <button class="video-upload-btn" 
-                                    data-video-path="${safePath}"
-                                    data-video-filename="${safeFilename}"
-                                    style="background: #ff0000; padding: 10px 20px; font-size: 0.9rem;">
-                                📺 YouTube 업로드
-                            </button>
-                        </div>
-                    </div>
-                `;
+                const info = document.createElement('div');
+                info.style.cssText = 'flex: 1; min-width: 200px;';
                 
-                // 버튼 이벤트 리스너
-                const uploadBtn = videoItem.querySelector('.video-upload-btn');
-                if (uploadBtn) {
-                    uploadBtn.addEventListener('click', function(e) {
-                        e.preventDefault();
-                        const videoPath = this.getAttribute('data-video-path');
-                        const filename = this.getAttribute('data-video-filename');
-                        selectVideoForUpload(videoPath, filename);
-                    });
-                }
+                const title = document.createElement('div');
+                title.className = 'video-title';
+                title.textContent = video.filename;
+                
+                const meta = document.createElement('div');
+                meta.className = 'video-meta';
+                meta.textContent = `크기: ${video.size_mb} MB | 수정: ${videoTimeFormat.format(video.modified_time * 1000)}`;
                 
-                container.appendChild(videoItem);
+                const player = document.createElement('video');
+                player.controls = true;
+                player.style.cssText = 'width: 100%; max-height: 200px; margin-top: 10px; border-radius: 5px; background: #000;';
+                player.src = video.url || '/videos/' + encodeURIComponent(video.filename);
+                
+                info.append(title, meta, player);
+                
+                // 클릭은 videoListContainer의 위임 리스너가 dataset을 읽어 처리
+                const uploadBtn = document.createElement('button');
+                uploadBtn.className = 'video-upload-btn';
+                uploadBtn.dataset.videoPath = video.path;
+                uploadBtn.dataset.videoFilename = video.filename;
+                uploadBtn.style.cssText = 'background: #ff0000; padding: 10px 20px; font-size: 0.9rem;';
+                uploadBtn.textContent = '📺 YouTube 업로드';
+                
+                const actions = document.createElement('div');
+                actions.appendChild(uploadBtn);
+                
+                row.append(info, actions);
+                videoItem.appendChild(row);
+                fragment.appendChild(videoItem);
             });
+            
+            container.replaceChildren(fragment);
         } else {
             container.innerHTML = '<p style="color: var(--text-secondary); text-align: center; padding: 20px;">저장된 영상이 없습니다.</p>';
         }
@@ -430,15 +505,15 @@ function selectVideoForUpload(videoPath, filename) {
     currentVideoPath = videoPath;
     
     // YouTube 업로드 섹션 표시
-    const uploadSection = document.getElementById('youtubeUploadSection');
+    const uploadSection = DOM.youtubeUploadSection;
     if (uploadSection) {
         uploadSection.style.display = 'block';
         uploadSection.scrollIntoView({ behavior: 'smooth' });
         
         // 메타데이터 필드 초기화 (파일명 기반 기본값)
-        const titleInput = document.getElementById('uploadTitle');
-        const descriptionInput = document.getElementById('uploadDescription');
-        const tagsInput = document.getElementById('uploadTags');
+        const titleInput = DOM.uploadTitle;
+        const descriptionInput = DOM.uploadDescription;
+        const tagsInput = DOM.uploadTags;
         
         if (titleInput) {
             titleInput.value = filename.replace('.mp4', '').replace(/_/g, ' ');
@@ -450,24 +525,43 @@ function selectVideoForUpload(videoPath, filename) {
             tagsInput.value = 'healing, asmr, nature, relaxation';
         }
         
-        setupUploadButton();
+        resetUploadButton();
     }
 }
 
 // 페이지 로드 시 초기화
 window.addEventListener('load', () => {
+    cacheDomElements();
     connectWebSocket();
     
-    const createBtn = document.getElementById('createBtn');
+    const createBtn = DOM.createBtn;
     if (createBtn) {
         createBtn.addEventListener('click', createShorts);
     }
     
-    const refreshBtn = document.getElementById('refreshVideoListBtn');
+    const refreshBtn = DOM.refreshVideoListBtn;
     if (refreshBtn) {
         refreshBtn.addEventListener('click', loadVideoList);
     }
     
-    setupUploadButton();
+    // 영상 목록 업로드 버튼은 컨테이너 하나에서 이벤트 위임으로 처리
+    const videoListContainer = DOM.videoListContainer;
+    if (videoListContainer) {
+        videoListContainer.addEventListener('click', (e) => {
+            const uploadBtn = e.target.closest('.video-upload-btn');
+            if (!uploadBtn) return;
+            e.preventDefault();
+            selectVideoForUpload(uploadBtn.dataset.videoPath, uploadBtn.dataset.videoFilename);
+        });
+    }
+    
+    const uploadBtn = DOM.uploadYoutubeBtn;
+    if (uploadBtn) {
+        uploadBtn.addEventListener('click', (e) => {
+            e.preventDefault();
+            uploadToYouTube();
+        });
+    }
+    
     loadVideoList();
 });
@@ -98,6 +98,47 @@ async def test_reviewer_agent():
         return False
 
 
+async def test_reviewer_preflight():
+    """ReviewerAgent 로컬 사전 검사(_fast_preflight) 테스트 (Gemini 호출 없음)"""
+    print("\n" + "=" * 60)
+    print("[TEST] ReviewerAgent 사전 검사 테스트")
+    print("=" * 60)
+    
+    # (프롬프트, 사전 검사 통과 여부) - 통과하면 LLM 평가로 넘어감
+    cases = [
+        ("1080x1920 vertical, Duration: 30 seconds", True),
+        ("9:16 format, an 8-second loop", True),
+        ("YouTube Shorts, 7.5s of gentle rain", True),
+        ("1080x1920 세로 영상, 15초 길이", True),
+        ("1080x1920 세로 영상, 길이10초", True),
+        ("9:16 비율, 10s동안 빗소리", True),
+        ("1080x1920 vertical, a few seconds of rain", False),
+        ("1080x1920 vertical, 15 scenes of rain", False),
+        ("Duration: 30 seconds, landscape 1920x1080", False),
+    ]
+    
+    try:
+        agent = ReviewerAgent()
+        failed = 0
+        for prompt, should_pass in cases:
+            passed = agent._fast_preflight(prompt) is None
+            if passed != should_pass:
+                failed += 1
+                print(f"[FAIL] {prompt!r}: 통과 예상={should_pass}, 실제={passed}")
+        
+        if failed:
+            return False
+        
+        print(f"[OK] 사전 검사 {len(cases)}개 케이스 통과")
+        return True
+        
+    except Exception as e:
+        print(f"[FAIL] ReviewerAgent 사전 검사 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 async def test_a2a_server_integration():
     """A2A 서버 통합 테스트"""
     print("\n" + "=" * 60)
@@ -163,7 +204,10 @@ async def main():
     # 2. ReviewerAgent 테스트
     results.append(await test_reviewer_agent())
     
-    # 3. A2A 서버 통합 테스트
+    # 3. ReviewerAgent 사전 검사 테스트
+    results.append(await test_reviewer_preflight())
+    
+    # 4. A2A 서버 통합 테스트
     results.append(await test_a2a_server_integration())
     
     # 결과 요약
@@ -171,7 +215,7 @@ async def main():
     print("[SUMMARY] 테스트 결과 요약")
     print("=" * 60)
     
-    test_names = ["PlannerAgent", "ReviewerAgent", "A2A 서버 통합"]
+    test_names = ["PlannerAgent", "ReviewerAgent", "ReviewerAgent 사전 검사", "A2A 서버 통합"]
     for name, result in zip(test_names, results):
         status = "[PASS] 통과" if result else "[FAIL] 실패"
         print(f"  {status} - {name}")